@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase BinarniZapis za kompaktni binarni zapis karata, skupova
+karata, poteza i dijeljenja.
+
+"""
+
+from karta import Karta
+from skup_karata import SkupKarata
+
+class BinarniZapis (object):
+    """
+    Klasa za kodiranje karata i kolekcija karata u nizove bajtova i obratno.
+
+    Svaka karta zapisuje se jednim bajtom:
+        --  valjana karta (karta kojoj su definirani i boja i znak) zapisuje se
+            svojim kodom (v. funkciju Karta.kod), dakle bajtom od 0 do 51,
+        --  karta nedefinirane boje ili znaka (na primjer predstavnik karata
+            nekog znaka u funkciji MinimaxIgrac.vjerojatnaRuka) zapisuje se
+            bajtom 0x80 | kljuc, gdje je kljuc kljuc karte (v. funkciju
+            Karta.kljuc).
+    Skup valjanih karata zapisuje se s 7 bajtova kao 52-bitni broj (bitovi
+    objekta klase SkupKarata, najmanje znacajni bajt prvi).  Potez (karta,
+    skupljeno) zapisuje se s 8 bajtova (bajt odigrane karte i skup skupljenih
+    karata), a niz kolekcija karata (na primjer stol i ruke igraca u jednom
+    dijeljenju) tako da se prije karata svake kolekcije zapise bajt broja
+    njezinih karata.
+
+    Povratne vrijednosti funkcija za kodiranje su objekti klase bytes (str u
+    Pythonu 2), a funkcije za dekodiranje primaju objekte klase bytes,
+    bytearray ili bilo koji niz cijelih brojeva od 0 do 255.  Ako se zadani
+    podaci ne mogu dekodirati, izbacuje se iznimka tipa ValueError.
+
+    """
+
+    # Broj bajtova zapisa skupa karata.
+    __bajtoviSkupa = 7
+
+    @classmethod
+    def kodirajKartu (cls, karta):
+        """
+        Dohvati bajt (cijeli broj od 0 do 255) kojim se zapisuje karta karta.
+
+        """
+
+        if not isinstance(karta, Karta):
+            karta = Karta(karta)
+
+        kod = karta.kod
+
+        return kod if kod is not None else 0x80 | karta.kljuc
+
+    @classmethod
+    def dekodirajKartu (cls, bajt):
+        """
+        Dohvati kartu zapisanu bajtom bajt.
+
+        Funkcija je inverz funkcije BinarniZapis.kodirajKartu.
+
+        """
+
+        if 0 <= bajt < 52:
+            return Karta.izKoda(bajt)
+
+        if bajt & 0x80 and bajt < 0x80 + len(Karta.Boja) * (max(Karta.Znak) + 1):
+            boja, znak = (bajt & 0x7f) % len(Karta.Boja), (bajt & 0x7f) // len(Karta.Boja)
+            if (not boja or not znak) and Karta.Znak.postoji(znak):
+                return Karta.izBojeZnaka(Karta.Boja(boja), Karta.Znak(znak))
+
+        raise ValueError('Bajt {0} nije zapis karte.'.format(bajt))
+
+    @classmethod
+    def kodirajKarte (cls, karte):
+        """
+        Kodiraj niz karata karte (redom kojim su zadane; na primjer ruku ili
+        promijesani spil).
+
+        """
+
+        return bytes(bytearray(BinarniZapis.kodirajKartu(karta) for karta in karte))
+
+    @classmethod
+    def dekodirajKarte (cls, podaci):
+        """
+        Dekodiraj niz karata zapisan bajtovima podaci.
+
+        Povratna vrijednost je tuple karata redom kojim su zapisane.
+
+        """
+
+        return tuple(BinarniZapis.dekodirajKartu(bajt) for bajt in bytearray(podaci))
+
+    @classmethod
+    def kodirajSkup (cls, S):
+        """
+        Kodiraj skup valjanih karata S (objekt klase SkupKarata ili kolekciju
+        valjanih karata) u 7 bajtova.
+
+        """
+
+        bitovi = SkupKarata.bitoviKolekcije(S)
+        if bitovi is None:
+            raise ValueError('Skup karata moze se kodirati samo ako su sve karte valjane.')
+
+        return bytes(bytearray(bitovi >> 8 * i & 0xff for i in range(BinarniZapis.__bajtoviSkupa)))
+
+    @classmethod
+    def dekodirajSkup (cls, podaci):
+        """
+        Dekodiraj skup karata zapisan sa 7 bajtova podaci.
+
+        Povratna vrijednost je objekt klase set.
+
+        """
+
+        return BinarniZapis.dekodirajSkupKarata(podaci).uSkup()
+
+    @classmethod
+    def dekodirajSkupKarata (cls, podaci):
+        """
+        Dekodiraj skup karata zapisan sa 7 bajtova podaci.
+
+        Povratna vrijednost je objekt klase SkupKarata.
+
+        """
+
+        podaci = bytearray(podaci)
+        if len(podaci) != BinarniZapis.__bajtoviSkupa:
+            raise ValueError('Zapis skupa karata mora imati {0:d} bajtova.'.format(BinarniZapis.__bajtoviSkupa))
+
+        bitovi = 0
+        for i in range(BinarniZapis.__bajtoviSkupa):
+            bitovi |= podaci[i] << 8 * i
+        if bitovi >> 52:
+            raise ValueError('Zapis skupa karata sadrzi nepostojece karte.')
+
+        return SkupKarata.izBitova(bitovi)
+
+    @classmethod
+    def kodirajPotez (cls, karta, skupljeno):
+        """
+        Kodiraj potez kojim se igra karta karta i sa stola skuplja skup
+        skupljeno u 8 bajtova.
+
+        """
+
+        return bytes(bytearray([BinarniZapis.kodirajKartu(karta)])) + BinarniZapis.kodirajSkup(skupljeno)
+
+    @classmethod
+    def dekodirajPotez (cls, podaci):
+        """
+        Dekodiraj potez zapisan s 8 bajtova podaci.
+
+        Povratna vrijednost je tuple (karta, skupljeno), gdje je skupljeno
+        objekt klase set, kao povratna vrijednost funkcije Tablic.Igrac.odigraj.
+
+        """
+
+        podaci = bytearray(podaci)
+        if len(podaci) != 1 + BinarniZapis.__bajtoviSkupa:
+            raise ValueError('Zapis poteza mora imati {0:d} bajtova.'.format(1 + BinarniZapis.__bajtoviSkupa))
+
+        return (BinarniZapis.dekodirajKartu(podaci[0]), BinarniZapis.dekodirajSkup(podaci[1:]))
+
+    @classmethod
+    def kodirajKolekcije (cls, kolekcije):
+        """
+        Kodiraj niz kolekcija karata kolekcije (na primjer stol i ruke igraca u
+        jednom dijeljenju).
+
+        Svaka kolekcija zapisuje se bajtom broja njezinih karata (najvise 255)
+        i zatim bajtovima njezinih karata.
+
+        """
+
+        podaci = bytearray()
+        for karte in kolekcije:
+            karte = BinarniZapis.kodirajKarte(karte)
+            if len(karte) > 0xff:
+                raise ValueError('Kolekcija karata za kodiranje smije imati najvise 255 karata.')
+            podaci.append(len(karte))
+            podaci.extend(karte)
+
+        return bytes(podaci)
+
+    @classmethod
+    def dekodirajKolekcije (cls, podaci):
+        """
+        Dekodiraj niz kolekcija karata zapisan bajtovima podaci.
+
+        Povratna vrijednost je lista tuple-ova karata.
+
+        """
+
+        podaci = bytearray(podaci)
+
+        kolekcije = list()
+        i = 0
+        while i < len(podaci):
+            n = podaci[i]
+            if i + 1 + n > len(podaci):
+                raise ValueError('Zapis kolekcija karata je nepotpun.')
+            kolekcije.append(BinarniZapis.dekodirajKarte(podaci[i + 1:i + 1 + n]))
+            i += 1 + n
+
+        return kolekcije
+
+    @classmethod
+    def kodirajDijeljenja (cls, dijeljenja):
+        """
+        Kodiraj niz dijeljenja dijeljenja (na primjer sva dijeljenja u
+        partiji).
+
+        Svako dijeljenje je niz kolekcija karata (na primjer stol i ruke
+        igraca), a zapisuje se bajtom broja kolekcija i zatim zapisom
+        kolekcija kao u funkciji BinarniZapis.kodirajKolekcije.
+
+        """
+
+        podaci = bytearray()
+        for kolekcije in dijeljenja:
+            kolekcije = list(kolekcije)
+            if len(kolekcije) > 0xff:
+                raise ValueError('Dijeljenje za kodiranje smije imati najvise 255 kolekcija karata.')
+            podaci.append(len(kolekcije))
+            podaci.extend(BinarniZapis.kodirajKolekcije(kolekcije))
+
+        return bytes(podaci)
+
+    @classmethod
+    def dekodirajDijeljenja (cls, podaci):
+        """
+        Dekodiraj niz dijeljenja zapisan bajtovima podaci.
+
+        Povratna vrijednost je lista dijeljenja, a svako dijeljenje je lista
+        tuple-ova karata (v. funkciju BinarniZapis.dekodirajKolekcije).
+
+        """
+
+        podaci = bytearray(podaci)
+
+        dijeljenja = list()
+        i = 0
+        while i < len(podaci):
+            m = podaci[i]
+            i += 1
+            kolekcije = list()
+            for j in range(m):
+                if i >= len(podaci) or i + 1 + podaci[i] > len(podaci):
+                    raise ValueError('Zapis dijeljenja je nepotpun.')
+                n = podaci[i]
+                kolekcije.append(BinarniZapis.dekodirajKarte(podaci[i + 1:i + 1 + n]))
+                i += 1 + n
+            dijeljenja.append(kolekcije)
+
+        return dijeljenja
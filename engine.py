@@ -7,13 +7,21 @@ Implementacija klase Tablic za simulaciju igranja igre tablic.
 
 import abc
 import copy
+import hashlib
+import itertools
 import random
 import six
 
-import queue
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-from skupovi import partitivniSkup, unijeDisjunktnih
+from skupovi import partitivniSkup, slucajnaUnijaDisjunktnih
 from karta import Karta
+from skup_karata import SkupKarata
+from predmemorija import Predmemorija
+from spil import Mijesalica, Spil
 
 if six.PY3:
     unicode = str
@@ -24,6 +32,26 @@ class Tablic (object):
 
     """
 
+    # Predmemorija funkcije Tablic.moguciPotezi.
+    __predmemorijaPoteza = Predmemorija()
+
+    # Najveci broj karata u skupu za koji funkcija Tablic.moguciPotezi racuna
+    # iscrpno (sumiranjem svih podskupova) umjesto dinamickim programiranjem.
+    # (Izmjereno skriptom provjera_poteza.py: iscrpno racunanje brze je do 3
+    # karte, na 4 karte obje su metode podjednako brze, a od 5 karata brze je
+    # dinamicko programiranje.)
+    __pragIscrpno = 4
+
+    # Unaprijed izracunata tablica poteza (ili None).
+    __tablicaPoteza = None
+
+    # Bodovne vrijednosti svih karata (rjecnik s kljucevima kartama) i bitovne
+    # maske (kao u klasi SkupKarata) valjanih karata koje vrijede barem 1 bod
+    # odnosno 2 boda (racunaju se pri prvom koristenju).
+    __bodovi = None
+    __maskaBoda = None
+    __maskaDvaBoda = None
+
     @six.add_metaclass(abc.ABCMeta)
     class Log (object):
         """
@@ -347,13 +375,30 @@ class Tablic (object):
             # Zapisi potez u zapisnik.
             self.__log.append(potez)
 
+        @classmethod
+        def prihvacaSnimke (cls):
+            """
+            Izjasni prihvaca li zapisnik nepromjenjive snimke stanja igre.
+
+            Ako je povratna vrijednost True, zapisnik jamci da argumente
+            funkcija novaPartija, novoDijeljenje, prevediPotez i kraj samo cita
+            (ne mijenja ih), pa mu u partiji bez kopiranja (v. funkciju
+            Tablic.__init__) skupovi karata mogu biti prosljedeni kao objekti
+            klase frozenset, a igraci i rezultat bez kopiranja.  Zadana
+            povratna vrijednost je False.
+
+            """
+
+            return False
+
         @abc.abstractmethod
         def novaPartija (self, n, igraci):
             """
             Pripremi zapisnik za zapisivanje poteza iz nove partije.
 
             Lista igraci (duljine n) kopija je igraca koji sudjeluju u partiji
-            redoslijedom kojim su na potezu.
+            redoslijedom kojim su na potezu (u partiji bez kopiranja zapisniku
+            koji prihvaca snimke prosljeduju se sami igraci).
 
             """
 
@@ -376,7 +421,8 @@ class Tablic (object):
             """
             Prevedi potez u format za zapisivanje u zapisnik.
 
-            Objekt igraci lista je kopija igraca redom kojim igraju.
+            Objekt igraci lista je kopija igraca redom kojim igraju (v.
+            funkciju novaPartija).
 
             Ako je povratna vrijednost funkcije None, funkcija logirajPotez ga
             ne zapisuje.
@@ -405,6 +451,10 @@ class Tablic (object):
 
         """
 
+        @classmethod
+        def prihvacaSnimke (cls):
+            return True
+
         def novaPartija (self, n, igraci):
             pass
 
@@ -429,7 +479,7 @@ class Tablic (object):
 
         """
 
-        def __init__ (self, i, ime = None):
+        def __init__ (self, i, ime = None, sjeme = None, generator = None):
             """
             Inicijaliziraj objekt klase Igrac.
 
@@ -437,12 +487,14 @@ class Tablic (object):
             Argument ime moze biti objekt klase str koji zadaje ime igraca, ili
             None u kojem slucaju se ime igraca postavlja na
             "[klasa igraca] [i + 1]" (na primjer "RandomIgrac 3" za objekt
-            klase RandomIgrac i i = 2).
+            klase RandomIgrac i i = 2).  Argumenti sjeme, generator zadaju
+            generator pseudoslucajnih brojeva igraca (v. funkciju
+            Tablic.Igrac.postaviGenerator).
 
             Svaka klasa derivirana od klase Tablic.Igrac, ako inicijalizira
             vlastitu metodu __init__, ta bi metoda trebala biti oblika
-                >>> def __init__ (self, i, ime = None[, ...]):
-                        Tablic.Igrac.__init__(self, i, ime)
+                >>> def __init__ (self, i, ime = None[, ...], sjeme = None, generator = None):
+                        Tablic.Igrac.__init__(self, i, ime, sjeme, generator)
                         [...]
             pri cemu za argument i ne bi smio biti prosljeden objekt koji nije
             tipa int (metoda Tablic.dodajIgraca ionako prosljeduje samo takav
@@ -459,21 +511,31 @@ class Tablic (object):
             else:
                 self.__ime = ime
 
+            self.postaviGenerator(sjeme, generator)
+
         def __copy__ (self):
             """
             Dohvati copy.copy(self).
 
             """
 
-            return self.__class__(self.__i, self.__ime)
+            igrac = self.__class__(self.__i, self.__ime)
+            igrac.__generator = self.__generator
+
+            return igrac
 
         def __deepcopy__ (self, memo = dict()):
             """
             Dohvati copy.deepcopy(self, memo).
 
+            Globalni generator (modul random) se ne kopira.
+
             """
 
-            return self.__class__(copy.deepcopy(self.__i, memo), copy.deepcopy(self.__ime, memo))
+            igrac = self.__class__(copy.deepcopy(self.__i, memo), copy.deepcopy(self.__ime, memo))
+            igrac.__generator = self.__generator if self.__generator is random else copy.deepcopy(self.__generator, memo)
+
+            return igrac
 
         def __repr__ (self):
             """
@@ -515,6 +577,61 @@ class Tablic (object):
 
             return self.__ime
 
+        def dohvatiGenerator (self):
+            """
+            Dohvati generator pseudoslucajnih brojeva igraca.
+
+            """
+
+            return self.__generator
+
+        def postaviGenerator (self, sjeme = None, generator = None):
+            """
+            Postavi generator pseudoslucajnih brojeva igraca.
+
+            Ako je zadan generator (objekt s metodama choice i randrange, na
+            primjer objekt klase random.Random), igrac bira njime.  Inace se, ako
+            je zadano sjeme, bira novim generatorom random.Random(sjeme), a ako
+            nije, globalnim generatorom modula random (v. klasu Mijesalica).
+            Ugradeni igraci sve slucajne odluke donose generatorom igraca, pa
+            je igrac sa zadanim sjemenom ponovljiv neovisno o ostatku programa.
+
+            """
+
+            if generator is None:
+                generator = random if sjeme is None else random.Random(sjeme)
+
+            self.__generator = generator
+
+        @classmethod
+        def prihvacaSnimke (cls):
+            """
+            Izjasni prihvaca li igrac nepromjenjive snimke stanja igre.
+
+            Ako je povratna vrijednost True, igrac jamci da argumente funkcija
+            saznajBrojIgraca, saznajNovoDijeljenje, vidiPotez, saznajRezultat
+            i odigraj samo cita (ne mijenja ih), pa mu u partiji bez kopiranja
+            (v. funkciju Tablic.__init__) skupovi karata mogu biti prosljedeni
+            kao objekti klase frozenset, a imena igraca i rezultat bez
+            kopiranja.  Zadana povratna vrijednost je False.
+
+            """
+
+            return False
+
+        @classmethod
+        def igraLegalno (cls):
+            """
+            Izjasni igra li igrac uvijek samo legalne poteze.
+
+            Ako je povratna vrijednost True, funkcija Tablic.simuliraj ne
+            provjerava legalnost igracevih poteza.  Zadana povratna vrijednost
+            je False.
+
+            """
+
+            return False
+
         @abc.abstractmethod
         def hocuRazlog (self):
             """
@@ -644,6 +761,14 @@ class Tablic (object):
 
         """
 
+        @classmethod
+        def prihvacaSnimke (cls):
+            return True
+
+        @classmethod
+        def igraLegalno (cls):
+            return True
+
         def hocuRazlog (self):
             return False
 
@@ -665,13 +790,15 @@ class Tablic (object):
 
             """
 
-            # Dohvati moguce poteze.
-            M = Tablic.moguciPotezi(stol)
+            # Odaberi kartu slucajnim odabirom i dohvati moguce poteze samo za
+            # njezin znak.
+            generator = self.dohvatiGenerator()
+            karta = generator.choice(list(ruka))
+            P = Tablic.moguciPoteziZnaka(karta.znak, stol)
 
-            # Odaberi potez slucajnim odabirom.
-            karta = random.choice(list(ruka))
-            izbori = list(unijeDisjunktnih(M[karta.znak])) if karta.znak in M else [frozenset()]
-            skupljeno = set(random.choice(izbori))
+            # Odaberi potez slucajnim odabirom (unija se odabire bez racunanja
+            # svih unija).
+            skupljeno = set(slucajnaUnijaDisjunktnih(P, generator)) if P else set()
 
             # Vrati odabrani potez.
             return (karta, skupljeno)
@@ -695,9 +822,34 @@ class Tablic (object):
         return 6
 
     @classmethod
-    def vrijednostKarata (cls, x):
+    def __pripremiBodove (cls):
         """
-        Izracunaj bodovnu vrijednost karte ili kolekcije karata x.
+        Izracunaj bodovne vrijednosti svih karata i maske bodova ako vec nisu
+        izracunate.
+
+        """
+
+        if Tablic.__bodovi is not None:
+            return
+
+        bodovi = dict()
+        for boja in Karta.Boja:
+            for znak in Karta.Znak:
+                if boja == Karta.Boja.KARO and znak == Karta.Znak.BR10:
+                    bodovi.update({Karta.izBojeZnaka(boja, znak) : 2})
+                elif boja == Karta.Boja.TREF and znak == Karta.Znak.BR2 or znak == Karta.Znak.A or znak >= 10:
+                    bodovi.update({Karta.izBojeZnaka(boja, znak) : 1})
+                else:
+                    bodovi.update({Karta.izBojeZnaka(boja, znak) : 0})
+
+        Tablic.__maskaBoda = SkupKarata.bitoviKolekcije(karta for karta in Karta.noviSpil() if bodovi[karta] >= 1)
+        Tablic.__maskaDvaBoda = SkupKarata.bitoviKolekcije(karta for karta in Karta.noviSpil() if bodovi[karta] >= 2)
+        Tablic.__bodovi = bodovi
+
+    @classmethod
+    def vrijednostKarte (cls, karta):
+        """
+        Dohvati bodovnu vrijednost karte karta (objekta klase Karta).
 
         Bodovna vrijednost karte definirana je u pravilima igre tablic, i
         iznosi
@@ -707,23 +859,63 @@ class Tablic (object):
             --  1 ako je karta slika,
             --  1 ako je karta tref 2,
             --  2 ako je karta karo 10.
+        Karte nedefinirane boje vrijede kao karte svog znaka koje nisu tref 2 ni
+        karo 10, a karte nedefiniranog znaka vrijede 0.  Vrijednosti se citaju
+        iz unaprijed izracunatog rjecnika.
+
+        """
+
+        if Tablic.__bodovi is None:
+            Tablic.__pripremiBodove()
+
+        return Tablic.__bodovi[karta]
+
+    @classmethod
+    def vrijednost (cls, karte):
+        """
+        Izracunaj bodovnu vrijednost (ravne) kolekcije karata karte.
+
+        Ako je karte objekt klase SkupKarata, vrijednost se racuna brojanjem
+        postavljenih bitova u presjecima skupa s maskama karata koje vrijede
+        barem 1 bod odnosno 2 boda.  Inace se zbrajaju vrijednosti karata
+        procitane iz rjecnika (v. funkciju Tablic.vrijednostKarte).
+
+        """
+
+        if Tablic.__bodovi is None:
+            Tablic.__pripremiBodove()
+
+        if isinstance(karte, SkupKarata):
+            bitovi = karte.dohvatiBitove()
+
+            return bin(bitovi & Tablic.__maskaBoda).count('1') + bin(bitovi & Tablic.__maskaDvaBoda).count('1')
+
+        return sum(map(Tablic.__bodovi.__getitem__, karte))
+
+    @classmethod
+    def vrijednostKarata (cls, x):
+        """
+        Izracunaj bodovnu vrijednost karte ili kolekcije karata x.
+
+        Bodovna vrijednost karte definirana je u pravilima igre tablic (v.
+        funkciju Tablic.vrijednostKarte).
 
         Ako je x kolekcija, suma se racuna rekurzivno, stoga je zapravo
             >>> Tablic.vrijednostKarata(((Karta('tref 2'), Karta('karo 10')), Karta('pik A')))
             4
 
+        Funkcija je zadrzana radi kompatibilnosti; za ravne kolekcije karata
+        brza je funkcija Tablic.vrijednost.
+
         """
 
         # Vrati bodovnu vrijednost karte x ako je x karta.
         if isinstance(x, Karta):
-            if x.boja == Karta.Boja.TREF and x.znak == Karta.Znak.BR2:
-                return 1
-            if x.boja == Karta.Boja.KARO and x.znak == Karta.Znak.BR10:
-                return 2
-            if x.znak < 10 and x.znak != 1:
-                return 0
+            return Tablic.vrijednostKarte(x)
 
-            return 1
+        # Vrati vrijednost skupa karata x ako je x objekt klase SkupKarata.
+        if isinstance(x, SkupKarata):
+            return Tablic.vrijednost(x)
 
         # Konvertiraj x u kartu i vracati njezinu bodovnu vrijednost odnosno vrati sumu bodovnih
         # vrijednosti karata u kolekciji x ako x nije nonvertibilno u kartu.
@@ -755,6 +947,46 @@ class Tablic (object):
 
         return 3
 
+    @classmethod
+    def predmemorijaPoteza (cls):
+        """
+        Dohvati predmemoriju (objekt klase Predmemorija) funkcije
+        Tablic.moguciPotezi.
+
+        Predmemorija je zajednicka za sve objekte klase Tablic u procesu, a
+        moze se iskljuciti pozivom
+            >>> Tablic.predmemorijaPoteza().postaviVelicinu(0)
+
+        """
+
+        return Tablic.__predmemorijaPoteza
+
+    @classmethod
+    def dohvatiTablicuPoteza (cls):
+        """
+        Dohvati unaprijed izracunatu tablicu poteza (ili None ako nije
+        postavljena).
+
+        """
+
+        return Tablic.__tablicaPoteza
+
+    @classmethod
+    def postaviTablicuPoteza (cls, tablica):
+        """
+        Postavi unaprijed izracunatu tablicu poteza.
+
+        Argument tablica mora biti None ili objekt s metodom potezi kao objekt
+        klase tablica_poteza.TablicaPoteza.  Tablica se koristi samo pri
+        racunanju poteza nad vektorima (v. funkciju
+        PohlepniIgrac.moguciPoteziKanonski), a funkcija Tablic.moguciPotezi
+        uvijek racuna dinamickim programiranjem jer je "napuhivanje" vektora
+        iz tablice u konkretne karte sporije od samog racunanja.
+
+        """
+
+        Tablic.__tablicaPoteza = tablica
+
     @classmethod
     def moguciPotezi (cls, S):
         """
@@ -769,6 +1001,197 @@ class Tablic (object):
         Ako neki znak nije kljuc povratnog rjecnika, nijedan podskup skupa S ne
         moze se sumirati u taj znak po pravilima igre tablic.
 
+        Izracunati rjecnici pamte se u predmemoriji Tablic.predmemorijaPoteza()
+        s kljucem koji kanonski reprezentira skup S (bitovi objekta klase
+        SkupKarata ako su sve karte u S valjane, inace sortirani tuple
+        kljuceva karata, v. funkciju Karta.kljuc), a povratna vrijednost je
+        kopija zapamcenog rjecnika (familije podskupova se kopiraju, a njihovi
+        elementi ne).
+
+        Na skupovima od najvise 4 karte rjecnik se racuna iscrpno (v.
+        funkciju Tablic.moguciPoteziIscrpno) jer je na malim skupovima
+        sumiranje svih podskupova brze od dinamickog programiranja.
+
+        """
+
+        # Izracunaj kljuc skupa S.
+        S = tuple(S)
+        kljuc = SkupKarata.bitoviKolekcije(S)
+        if kljuc is None:
+            kljuc = tuple(sorted(karta.kljuc for karta in S))
+
+        # Dohvati rjecnik poteza iz predmemorije (na malim skupovima racuna se
+        # iscrpno) i vrati njegovu kopiju.
+        izracunaj = Tablic.moguciPoteziIscrpno if len(S) <= Tablic.__pragIscrpno else Tablic.__izracunajMogucePoteze
+        M = Tablic.__predmemorijaPoteza.dohvati(kljuc, izracunaj, S)
+
+        return {x : set(P) for x, P in six.iteritems(M)}
+
+    @classmethod
+    def moguciPoteziZnaka (cls, znak, S):
+        """
+        Pronadi sve podskupove kolekcije karata S koji se sumiraju u znak
+        znak.
+
+        Povratna vrijednost jednaka je vrijednosti
+            >>> Tablic.moguciPotezi(S).get(znak, set())
+        ali se racunaju samo podskupovi koji se sumiraju u zadani znak.  Ako
+        nijedan podskup skupa S ne daje ciljnu sumu (sto se provjerava
+        bitovnom maskom suma podskupova), odmah se vraca prazni skup.  Inace
+        se izbori karata racunaju dinamickim programiranjem kao u funkciji
+        Tablic.moguciPotezi, ali se odbacuju stanja sa sumom vecom od najvece
+        ciljne sume i "napuhuju" se samo izbori koji daju ciljnu sumu.
+        Rezultati se ne pamte u predmemoriji.
+
+        """
+
+        # Izracunaj ciljne sume (znak A dobiva se sumom 1 ili 11).
+        # (Znakovi su objekti klase enum.IntEnum pa se s njima racuna kao s
+        # cijelim brojevima, bez sporog dohvacanja atributa value.)
+        ciljevi = (1, 11) if znak == Karta.Znak.A else (int(znak),)
+        granica = ciljevi[-1]
+
+        # Grupiraj karte po znakovima (karte vece od najvece ciljne sume ne
+        # mogu biti ni u jednom podskupu) i izracunaj bitovnu masku suma
+        # podskupova (bit t maske m postavljen je ako i samo ako je t suma
+        # nekog podskupa skupa S).
+        grupe = dict()
+        m = 1
+        for karta in S:
+            z = karta.znak
+            if z > granica:
+                continue
+            m |= (m << z | (m << 11 if z == 1 else 0)) & 0x7fff
+            if z in grupe:
+                grupe[z].append(karta)
+            else:
+                grupe.update({z : [karta]})
+
+        # Provjeri postoji li podskup s ciljnom sumom.
+        if not any(m >> t & 1 for t in ciljevi):
+            return set()
+
+        # Izracunaj sve izbore karata po znakovima cija najmanja suma ne
+        # prelazi najvecu ciljnu sumu.
+        stanja = {0 : [tuple()]}
+        for z, karte in six.iteritems(grupe):
+            nova = {s : list(I) for s, I in six.iteritems(stanja)}
+            for s, I in six.iteritems(stanja):
+                for k in range(1, len(karte) + 1):
+                    t = s + k * z
+                    if t > granica:
+                        break
+                    if t in nova:
+                        nova[t] += [izbor + ((karte, k),) for izbor in I]
+                    else:
+                        nova.update({t : [izbor + ((karte, k),) for izbor in I]})
+            stanja = nova
+
+        # "Napuhni" izbore koji daju ciljnu sumu u podskupove.
+        P = set()
+        for s, I in six.iteritems(stanja):
+            for izbor in I:
+                if not izbor:
+                    continue
+                if s in ciljevi or s + 10 in ciljevi and any(karte[0].znak == 1 for karte, k in izbor):
+                    P |= {frozenset(itertools.chain(*A)) for A in itertools.product(*(itertools.combinations(karte, k) for karte, k in izbor))}
+
+        return P
+
+    @classmethod
+    def __izracunajMogucePoteze (cls, S):
+        """
+        Izracunaj povratnu vrijednost funkcije Tablic.moguciPotezi.
+
+        Sume se racunaju dinamickim programiranjem po znakovima karata umjesto
+        sumiranjem svih podskupova skupa S:
+            1.  Karte iz S grupiramo po znakovima.
+            2.  Stanje je najmanja moguca suma odabranih karata (karte znaka A
+                racunaju se kao 1), a vrijednost stanja lista izbora, to jest
+                tuple-ova parova (grupa, k) koji oznacavaju da je iz grupe
+                odabrano k karata.  Kako nijedna suma ne smije prijeci 14, a
+                sume su monotone, stanja sa sumom strogo vecom od 14 se
+                odbacuju.
+            3.  Ako je u izboru odabrana barem jedna karta znaka A, osim
+                najmanje sume s moguca je i suma s + 10 (najvise jedna karta
+                znaka A moze vrijediti 11).
+            4.  Svaki izbor "napuhujemo" u sve podskupove S s odabranim brojem
+                karata svakog znaka.
+        Slozenost funkcije je, dakle, polinomijalna u broju karata u S i
+        linearna u velicini povratnog rjecnika (broj stanja ogranicen je
+        konstantom jer nijedna suma ne prelazi 14).
+
+        Povratna vrijednost jednaka je povratnoj vrijednosti funkcije
+        Tablic.moguciPoteziIscrpno.
+
+        """
+
+        # Grupiraj karte po znakovima.
+        grupe = dict()
+        for karta in S:
+            if karta.znak in grupe:
+                grupe[karta.znak].append(karta)
+            else:
+                grupe.update({karta.znak : [karta]})
+
+        # Izracunaj sve izbore karata po znakovima cija najmanja suma ne
+        # prelazi 14.
+        stanja = {0 : [tuple()]}
+        for znak, karte in six.iteritems(grupe):
+            nova = {s : list(I) for s, I in six.iteritems(stanja)}
+            for s, I in six.iteritems(stanja):
+                for k in range(1, len(karte) + 1):
+                    t = s + k * znak.value
+                    if t > 14:
+                        break
+                    if t in nova:
+                        nova[t] += [izbor + ((karte, k),) for izbor in I]
+                    else:
+                        nova.update({t : [izbor + ((karte, k),) for izbor in I]})
+            stanja = nova
+
+        # Inicijaliziraj rjecnik poteza na prazni rjecnik.
+        M = dict()
+
+        # Izracunaj rjecnik poteza "napuhavanjem" izbora u podskupove.
+        for s, I in six.iteritems(stanja):
+            for izbor in I:
+                if not izbor:
+                    continue
+
+                # Izracunaj sve moguce sume izbora.
+                sume = {s}
+                if s + 10 <= 14 and any(karte[0].znak == Karta.Znak.A for karte, k in izbor):
+                    sume |= {s + 10}
+
+                # Izracunaj sve podskupove s odabranim brojem karata svakog
+                # znaka.
+                P = {frozenset(itertools.chain(*A)) for A in itertools.product(*(itertools.combinations(karte, k) for karte, k in izbor))}
+
+                for x in sume:
+                    x = Karta.Znak(x if x != 11 else 1)
+                    if x in M:
+                        M[x] |= P
+                    else:
+                        M.update({x : set(P)})
+
+        # Vrati izracunati rjecnik poteza.
+        return M
+
+    @classmethod
+    def moguciPoteziIscrpno (cls, S):
+        """
+        Pronadi sve moguce sume karata u kolekciji karata S sumiranjem svih
+        podskupova.
+
+        Povratna vrijednost jednaka je povratnoj vrijednosti funkcije
+        Tablic.moguciPotezi, ali se racuna sumiranjem svih elemenata
+        partitivnog skupa skupa S (slozenost je eksponencijalna, reda O(2^n),
+        gdje je n broj karata u S).  Funkcija je zadrzana kao referentna
+        implementacija za provjeru ispravnosti funkcije Tablic.moguciPotezi, a
+        ta je funkcija koristi i na skupovima od najvise 4 karte (na kojima je
+        iscrpno racunanje brze od dinamickog programiranja).
+
         """
 
         # Inicijaliziraj rjecnik poteza na prazni rjecnik.
@@ -779,8 +1202,7 @@ class Tablic (object):
 
         # Izracunaj rjecnik poteza.
         for A in P:
-            for x in sum(A):
-                x = Karta.Znak(x if x != 11 else 1)
+            for x in Karta.moguceSume(A):
                 if x in M:
                     M[x] |= {A}
                 else:
@@ -789,6 +1211,167 @@ class Tablic (object):
         # Vrati izracunati rjecnik poteza.
         return M
 
+    @classmethod
+    def mozeSeSumirati (cls, znak, S):
+        """
+        Provjeri postoji li neprazni podskup kolekcije karata S koji se po
+        pravilima igre tablic sumira u znak znak.
+
+        Povratna vrijednost jednaka je vrijednosti izraza
+            >>> znak in Tablic.moguciPotezi(S)
+        ali se racuna samo skupom dostiznih najmanjih suma (karte znaka A
+        racunaju se kao 1) uz oznaku sadrzi li podskup kartu znaka A.
+
+        """
+
+        # Izracunaj sve dostizne najmanje sume nepraznih podskupova.
+        stanja = {(0, False, False)}
+        for karta in S:
+            stanja |= {(s + karta.znak.value, a or karta.znak == Karta.Znak.A, True) for s, a, n in stanja if s + karta.znak.value <= 14}
+
+        # Provjeri sumira li se neki neprazni podskup u znak.
+        return any(n and Tablic.__sumiraSe(s, a, znak) for s, a, n in stanja)
+
+    @classmethod
+    def mozeSeParticionirati (cls, znak, S):
+        """
+        Provjeri moze li se kolekcija karata S particionirati na podskupove
+        ciji se svaki clan po pravilima igre tablic sumira u znak znak.
+
+        Povratna vrijednost jednaka je vrijednosti izraza
+            >>> znak in M and frozenset(S) in unijeDisjunktnih(M[znak])
+        gdje je M = Tablic.moguciPotezi(S) (za neprazni S), ali se racuna
+        izravno pretrazivanjem s vracanjem (backtracking) nad brojevima karata
+        po numerickim vrijednostima: karta najvece vrijednosti mora biti u
+        nekom clanu particije, stoga se za nju redom biraju svi moguci clanovi
+        (sastavljeni od karata manjih ili jednakih vrijednosti) i rekurzivno se
+        particionira ostatak.  Pretrazivanje se prekida cim se pronade
+        particija, a stanja (brojevi preostalih karata) za koja je ustanovljeno
+        da se ne mogu particionirati pamte se.
+
+        Karte nedefiniranog znaka (vrijednosti 0) mogu se dodati u bilo koji
+        clan particije.  Prazna kolekcija S particionira se prazno particijom
+        pa je povratna vrijednost za nju True.
+
+        """
+
+        def __grupe (brojevi, i, budzet):
+            """
+            Iteriraj po svim odabirima karata vrijednosti najvise i cija suma
+            ne prelazi budzet (odabiri su liste parova (vrijednost, broj)).
+
+            """
+
+            if i == 0 or not budzet:
+                yield list()
+
+                return
+
+            for k in range(min(brojevi[i], budzet // i) + 1):
+                for grupa in __grupe(brojevi, i - 1, budzet - k * i):
+                    yield ([(i, k)] if k else list()) + grupa
+
+        def __particioniraj (brojevi):
+            """
+            Provjeri mogu li se karte zadane brojevima po vrijednostima
+            particionirati.
+
+            """
+
+            # Pronadi najvecu vrijednost preostalih karata.
+            h = 14
+            while h and not brojevi[h]:
+                h -= 1
+            if not h:
+                return True
+
+            if brojevi in neuspjesni:
+                return False
+
+            # Izdvoji kartu najvece vrijednosti i pokusaj ju upariti sa svim
+            # mogucim odabirima preostalih karata.
+            ostatak = list(brojevi)
+            ostatak[h] -= 1
+            for grupa in __grupe(ostatak, h, 14 - h):
+                s = h + sum(i * k for i, k in grupa)
+                a = h == 1 or any(i == 1 for i, k in grupa)
+                if not Tablic.__sumiraSe(s, a, znak):
+                    continue
+                novi = list(ostatak)
+                for i, k in grupa:
+                    novi[i] -= k
+                if __particioniraj(tuple(novi)):
+                    return True
+
+            # Zapamti da se karte ne mogu particionirati.
+            neuspjesni.add(brojevi)
+
+            return False
+
+        # Prebroji karte po numerickim vrijednostima.
+        brojevi = [0 for i in range(15)]
+        for karta in S:
+            brojevi[karta.znak.value] += 1
+
+        # Karte nedefiniranog znaka ne mogu same ciniti clan particije.
+        if brojevi[0] and not any(brojevi[1:]):
+            return False
+        brojevi[0] = 0
+
+        neuspjesni = set()
+
+        return __particioniraj(tuple(brojevi))
+
+    @classmethod
+    def __greskePoteza (cls, ruka, stol, karta, skupljeno):
+        """
+        Dohvati listu gresaka poteza kojim se iz ruke ruka igra karta karta i
+        sa stola stol skuplja skup skupljeno.
+
+        Greske su opisane u funkciji Tablic.Igrac.odigraj (objekt karta ako
+        karta nije u ruci, objekt skupljeno ako skupljeno nije podskup stola,
+        karta.znak ako se nijedan podskup skupa skupljeno ne sumira u znak
+        karte i False ako se skupljeno ne moze particionirati na podskupove
+        koji se sumiraju u znak karte).  Potez je legalan ako i samo ako je
+        povratna lista prazna.
+
+        """
+
+        greske = list()
+
+        # Provjeri je li karta u ruci.
+        if not karta in ruka:
+            greske.append(karta)
+
+        # Provjeri je li skupljeno na stolu.
+        if not skupljeno <= stol:
+            greske.append(skupljeno)
+
+        # Ako se skuplja sa stola, provjeri moze li se skupljeno
+        # particionirati na podskupove koji se sumiraju u znak karte (ako ne
+        # moze, provjeri sumira li se barem neki podskup u znak karte).
+        if skupljeno and not Tablic.mozeSeParticionirati(karta.znak, skupljeno):
+            if not Tablic.mozeSeSumirati(karta.znak, skupljeno):
+                greske.append(karta.znak)
+            else:
+                greske.append(False)
+
+        return greske
+
+    @classmethod
+    def __sumiraSe (cls, s, a, znak):
+        """
+        Provjeri sumira li se skup karata s najmanjom sumom s (karte znaka A
+        racunaju se kao 1) u znak znak, pri cemu je a True ako i samo ako skup
+        sadrzi kartu znaka A (tada je moguca i suma s + 10).
+
+        """
+
+        if znak == Karta.Znak.A:
+            return s == 1 or s == 11
+
+        return s == znak.value or a and s + 10 == znak.value
+
     def __new__ (cls, *args, **kwargs):
         """
         Kreiraj objekt klase Tablic.
@@ -797,7 +1380,7 @@ class Tablic (object):
 
         return super(Tablic, cls).__new__(cls)
 
-    def __init__ (self, spil = None):
+    def __init__ (self, spil = None, bezKopiranja = False, sjeme = None, generator = None):
         """
         Inicijaliziraj objekt klase Tablic.
 
@@ -805,28 +1388,45 @@ class Tablic (object):
         se novi promijesani spil (52 karte) od povratne vrijednosti poziva
         funkcije
             >>> Karta.noviSpil()
-        Inace taj argument mora biti iterabilni objekt svih objekata bez
+        (mijesalicom Mijesalica(sjeme, generator), dakle zadanim generatorom,
+        novim generatorom random.Random(sjeme) ako je zadano samo sjeme, a
+        inace globalnim generatorom modula random; v. funkciju
+        Mijesalica.promijesaj).  Inace taj argument mora biti iterabilni objekt svih objekata bez
         duplikata iz skupa povratne vrijednosti poziva funkcije
             >>> Karta.noviSpil()
         u bilo kojem poretku (u tom je onda poretku, dakle tako je promijesan,
-        spil kojim ce se partija igrati).
+        spil kojim ce se partija igrati), na primjer povratna vrijednost
+        funkcije Mijesalica.promijesaj.
+
+        Stol, ruke i skupovi skupljenih karata igraca interno se cuvaju kao
+        objekti klase SkupKarata, a igracima, zapisnicima i pozivateljima
+        metoda dohvatiStol, dohvatiSkupljeno prosljeduju se kao objekti klase
+        set.
+
+        Ako je argument bezKopiranja True, partija se igra bez kopiranja:
+        igracima i zapisnicima cije klase to prihvacaju (v. funkcije
+        Tablic.Igrac.prihvacaSnimke i Tablic.Log.prihvacaSnimke) skupovi
+        karata prosljeduju se kao nepromjenjive snimke (objekti klase
+        frozenset koji se za isti skup karata u partiji kreiraju samo jednom),
+        a igraci, imena igraca i rezultat bez kopiranja.  Ostalim igracima i
+        zapisnicima i dalje se prosljeduju kopije.
 
         """
 
         if spil is None:
             # Generiraj novi promijesani spil karata.
-            spil = list(Karta.noviSpil())
-            random.shuffle(spil)
+            spil = Mijesalica(sjeme, generator).promijesaj()
 
         self.__pokrenuta = False
         self.__zavrsena = False
 
-        self.__spil = queue.Queue()
-        for karta in spil:
-            self.__spil.put(karta)
+        self.__bezKopiranja = bool(bezKopiranja)
+
+        # Spil se dijeli pomicanjem pokazivaca (v. klasu Spil).
+        self.__spil = Spil(spil)
 
         self.__igraci = list()
-        self.__stol = set()
+        self.__stol = SkupKarata()
 
     def __repr__ (self):
         """
@@ -869,8 +1469,8 @@ class Tablic (object):
         # Dodaj novog igraca u partiju.
         kwargs.pop('i', None)
         self.__igraci.append({'igrac' : klasa(len(self.__igraci), *args, **kwargs),
-                              'ruka' : set(),
-                              'skupljeno' : set(),
+                              'ruka' : SkupKarata(),
+                              'skupljeno' : SkupKarata(),
                               'table' : 0,
                               'max' : False})
 
@@ -904,7 +1504,7 @@ class Tablic (object):
 
         """
 
-        return copy.deepcopy(self.__stol)
+        return self.__stol.uSkup()
 
     def dohvatiIgraca (self, i):
         """
@@ -939,7 +1539,7 @@ class Tablic (object):
 
         """
 
-        return copy.deepcopy(self.__igraci[i]['skupljeno'])
+        return self.__igraci[i]['skupljeno'].uSkup()
 
     def dohvatiTable (self, i):
         """
@@ -983,6 +1583,38 @@ class Tablic (object):
 
         """
 
+        def __snimka (S):
+            """
+            Dohvati nepromjenjivu snimku (objekt klase frozenset) skupa karata
+            S (objekta klase SkupKarata).
+
+            Snimke se pamte po bitovima skupa pa se za isti skup karata u
+            partiji kreiraju samo jednom.
+
+            """
+
+            bitovi = S.dohvatiBitove()
+
+            try:
+                return snimke[bitovi]
+            except KeyError:
+                snimka = snimke[bitovi] = frozenset(S)
+
+                return snimka
+
+        def __prikaz (S, povjerljiv):
+            """
+            Dohvati skup karata S (objekt klase SkupKarata) u obliku za
+            prosljedivanje igracu ili zapisniku.
+
+            Ako je primatelj povjerljiv, povratna vrijednost je snimka skupa
+            (v. funkciju __snimka).  Inace je povratna vrijednost novi objekt
+            klase set.
+
+            """
+
+            return __snimka(S) if povjerljiv else S.uSkup()
+
         def __objaviBrojIgraca ():
             """
             Pozovi Igrac.saznajBrojIgraca na svakom igracu.
@@ -992,7 +1624,7 @@ class Tablic (object):
             imena = [self.__igraci[i]['igrac'].dohvatiIme() for i in range(len(self.__igraci))]
 
             for i in range(len(self.__igraci)):
-                self.__igraci[i]['igrac'].saznajBrojIgraca(len(self.__igraci), copy.deepcopy(imena))
+                self.__igraci[i]['igrac'].saznajBrojIgraca(len(self.__igraci), imena if povjerljiviIgraci[i] else copy.deepcopy(imena))
 
         def __pokreni ():
             """
@@ -1002,8 +1634,7 @@ class Tablic (object):
 
             self.__pokrenuta = True
 
-            for i in range(Tablic.inicijalniBrojKarata_stol()):
-                self.__stol |= {self.__spil.get()}
+            self.__stol |= self.__spil.podijeli(Tablic.inicijalniBrojKarata_stol())
 
         def __zavrsi (zadnji):
             """
@@ -1020,9 +1651,8 @@ class Tablic (object):
 
             if zadnji is not None:
                 # "Pocisti" stol.
-                while self.__stol:
-                    karta = self.__stol.pop()
-                    self.__igraci[zadnji]['skupljeno'] |= {karta}
+                self.__igraci[zadnji]['skupljeno'] |= self.__stol
+                self.__stol = SkupKarata()
 
             # Pronadi igraca sa strogo najvise skupljenih karata ako postoji.
             I = [0]
@@ -1046,13 +1676,17 @@ class Tablic (object):
 
             """
 
-            for i in range(Tablic.inicijalniBrojKarata_ruka()):
-                for j in range(len(self.__igraci)):
-                    self.__igraci[j]['ruka'] |= {self.__spil.get()}
-                if self.__spil.empty():
-                    return i + 1
+            # Karte se dijele redom kao da svaki igrac u krugu dobiva po
+            # jednu kartu, ali se dohvacaju odjednom pa igrac s indeksom j
+            # dobiva karte s indeksima j, j + n, j + 2 * n, ...
+            n = len(self.__igraci)
+            k = min(Tablic.inicijalniBrojKarata_ruka(), len(self.__spil) // n)
+
+            karte = self.__spil.podijeli(k * n)
+            for j in range(n):
+                self.__igraci[j]['ruka'] |= karte[j::n]
 
-            return Tablic.inicijalniBrojKarata_ruka()
+            return k
 
         def __objaviNovoDijeljenje (stol):
             """
@@ -1061,7 +1695,7 @@ class Tablic (object):
             """
 
             for i in range(len(self.__igraci)):
-                self.__igraci[i]['igrac'].saznajNovoDijeljenje(copy.deepcopy(self.__igraci[i]['ruka']), copy.deepcopy(stol))
+                self.__igraci[i]['igrac'].saznajNovoDijeljenje(__prikaz(self.__igraci[i]['ruka'], povjerljiviIgraci[i]), __prikaz(stol, povjerljiviIgraci[i]))
 
         def __legalniPotez (i, karta, skupljeno, razlog = False):
             """
@@ -1085,24 +1719,7 @@ class Tablic (object):
 
             """
 
-            greske = list()
-
-            # Provjeri je li karta u ruci.
-            if not karta in self.__igraci[i]['ruka']:
-                greske.append(karta)
-
-            # Provjeri je li skupljeno na stolu.
-            if not skupljeno <= self.__stol:
-                greske.append(skupljeno)
-
-            # Ako se skuplja sa stola, provjeri sume.
-            if skupljeno:
-                M = Tablic.moguciPotezi(skupljeno)
-                if not karta.znak in M:
-                    greske.append(karta.znak)
-                else:
-                    if not frozenset(skupljeno) in unijeDisjunktnih(M[karta.znak]):
-                        greske.append(False)
+            greske = Tablic.__greskePoteza(self.__igraci[i]['ruka'], self.__stol, karta, skupljeno)
 
             # Ako treba, vrati ilegalnost poteza i greske.
             if razlog and greske:
@@ -1129,7 +1746,7 @@ class Tablic (object):
 
             while True:
                 # Dohvati potez od igraca i provjeri njegovu legalnost.
-                karta, skupljeno = self.__igraci[i]['igrac'].odigraj(copy.deepcopy(self.__igraci[i]['ruka']), copy.deepcopy(self.__stol), ponovi)
+                karta, skupljeno = self.__igraci[i]['igrac'].odigraj(__prikaz(self.__igraci[i]['ruka'], povjerljiviIgraci[i]), __prikaz(self.__stol, povjerljiviIgraci[i]), ponovi)
                 legalno = __legalniPotez(i, karta, skupljeno, self.__igraci[i]['igrac'].hocuRazlog())
                 if isinstance(legalno, tuple):
                     legalno, razlog = legalno
@@ -1137,6 +1754,10 @@ class Tablic (object):
                 # Ako je potez legalan, prekini petlju.  Inace postavi
                 # vrijednost ponovi i udi u sljedecu iteraciju petlje.
                 if legalno:
+                    # Zamrzni karte poteza (dalje se dijele bez kopiranja).
+                    karta = Karta.zamrzni(karta)
+                    skupljeno = {Karta.zamrzni(x) for x in skupljeno}
+
                     break
                 elif razlog is None:
                     ponovi = True
@@ -1146,14 +1767,19 @@ class Tablic (object):
             # Vrati dohvaceni potez.
             return (karta, skupljeno)
 
-        def __objaviPotez (i, karta, skupljeno):
+        def __objaviPotez (i, karta, skupljeno, snimkaSkupljenog):
             """
             Pozovi Igrac.vidiPotez na svakom igracu.
 
+            Povjerljivim igracima skup skupljeno prosljeduje se kao snimka
+            snimkaSkupljenog (objekt klase frozenset).
+
             """
 
             for j in range(len(self.__igraci)):
-                self.__igraci[j]['igrac'].vidiPotez(i, copy.deepcopy(self.__igraci[j]['ruka']), copy.deepcopy(self.__stol), karta, copy.deepcopy(skupljeno))
+                self.__igraci[j]['igrac'].vidiPotez(i,
+                                                    __prikaz(self.__igraci[j]['ruka'], povjerljiviIgraci[j]), __prikaz(self.__stol, povjerljiviIgraci[j]),
+                                                    karta, snimkaSkupljenog if povjerljiviIgraci[j] else set(skupljeno))
 
         def __uzmiIzRuke (i, karta, skupi):
             """
@@ -1164,7 +1790,7 @@ class Tablic (object):
 
             """
 
-            self.__igraci[i]['ruka'].remove(karta)
+            self.__igraci[i]['ruka'] -= {karta}
             if skupi:
                 self.__igraci[i]['skupljeno'] |= {karta}
             else:
@@ -1176,9 +1802,8 @@ class Tablic (object):
 
             """
 
-            for karta in skupljeno:
-                self.__stol.remove(karta)
-                self.__igraci[i]['skupljeno'] |= {karta}
+            self.__stol -= skupljeno
+            self.__igraci[i]['skupljeno'] |= skupljeno
 
         def __provjeriTablu (i):
             """
@@ -1196,7 +1821,7 @@ class Tablic (object):
             """
 
             for i in range(len(self.__igraci)):
-                self.__igraci[i]['igrac'].saznajRezultat(copy.deepcopy(rezultat))
+                self.__igraci[i]['igrac'].saznajRezultat(rezultat if povjerljiviIgraci[i] else copy.deepcopy(rezultat))
 
         logovi = list(logovi)
 
@@ -1211,34 +1836,51 @@ class Tablic (object):
         if len(self.__igraci) == 1 or (52 - Tablic.inicijalniBrojKarata_stol()) % len(self.__igraci):
             raise RuntimeError('{0:d} nije valjani broj igraca u partiji igre tablic.'.format(len(self.__igraci)))
 
+        # Odredi kojim se igracima i zapisnicima prosljeduju snimke (u
+        # partiji bez kopiranja to su oni cije klase ih prihvacaju).  Snimke
+        # skupova karata pamte se u rjecniku snimke po bitovima skupova.
+        povjerljiviIgraci = [self.__bezKopiranja and self.__igraci[i]['igrac'].prihvacaSnimke() for i in range(len(self.__igraci))]
+        povjerljiviLogovi = [self.__bezKopiranja and logovi[i].prihvacaSnimke() for i in range(len(logovi))]
+        snimke = dict()
+
+        # Igraci koji se prosljeduju povjerljivim zapisnicima (bez kopiranja).
+        igraci = [self.__igraci[i]['igrac'] for i in range(len(self.__igraci))]
+
         # Pokreni partiju.
         __pokreni()
 
         # Logiraj i objavi pocetak nove partije.
         for i in range(len(logovi)):
-            logovi[i].novaPartija(len(self.__igraci), [copy.deepcopy(self.__igraci[j]['igrac']) for j in range(len(self.__igraci))])
+            logovi[i].novaPartija(len(self.__igraci), igraci if povjerljiviLogovi[i] else [copy.deepcopy(self.__igraci[j]['igrac']) for j in range(len(self.__igraci))])
         __objaviBrojIgraca()
 
         # Igraj partiju.
 
         zadnji = None
-        while not self.__spil.empty():
+        while self.__spil:
             # Podijeli karte i logiraj i objavi novo dijeljenje.
             k = __podijeli()
             for i in range(len(logovi)):
-                logovi[i].novoDijeljenje(k, copy.deepcopy(self.__stol))
+                logovi[i].novoDijeljenje(k, __prikaz(self.__stol, povjerljiviLogovi[i]))
             __objaviNovoDijeljenje(self.__stol)
 
             while self.__igraci[0]['ruka']:
                 for i in range(len(self.__igraci)):
                     # Dohvati, logiraj i objavi potez.
                     karta, skupljeno = __dohvatiPotez(i)
+                    snimkaSkupljenog = frozenset(skupljeno) if self.__bezKopiranja else None
                     for j in range(len(logovi)):
-                        logovi[j].logirajPotez(i,
-                                               [copy.deepcopy(self.__igraci[k]['igrac']) for k in range(len(self.__igraci))],
-                                               copy.deepcopy(self.__igraci[i]['ruka']), copy.deepcopy(self.__stol),
-                                               karta, copy.deepcopy(skupljeno))
-                    __objaviPotez(i, karta, skupljeno)
+                        if povjerljiviLogovi[j]:
+                            logovi[j].logirajPotez(i,
+                                                   igraci,
+                                                   __snimka(self.__igraci[i]['ruka']), __snimka(self.__stol),
+                                                   karta, snimkaSkupljenog)
+                        else:
+                            logovi[j].logirajPotez(i,
+                                                   [copy.deepcopy(self.__igraci[k]['igrac']) for k in range(len(self.__igraci))],
+                                                   self.__igraci[i]['ruka'].uSkup(), self.__stol.uSkup(),
+                                                   karta, set(skupljeno))
+                    __objaviPotez(i, karta, skupljeno, snimkaSkupljenog)
 
                     # Promijeni stanje igre ovisno o potezu.
                     __uzmiIzRuke(i, karta, bool(skupljeno))
@@ -1252,7 +1894,7 @@ class Tablic (object):
         rezultat = self.dohvatiRezultat()
         __objaviRezultat(rezultat)
         for i in range(len(logovi)):
-            logovi[i].kraj(copy.deepcopy(rezultat))
+            logovi[i].kraj(rezultat if povjerljiviLogovi[i] else copy.deepcopy(rezultat))
 
         # Vrati odgovarajucu povratnu vrijednost.
 
@@ -1284,12 +1926,193 @@ class Tablic (object):
         # Izracuinaj rezultat.
         for i in range(len(self.__igraci)):
             r = {'ime' : self.__igraci[i]['igrac'].dohvatiIme(),
-                 'skupljeno' : 0,
+                 'skupljeno' : Tablic.vrijednost(self.__igraci[i]['skupljeno']),
                  'table' : self.__igraci[i]['table'],
                  'max' : self.__igraci[i]['max']}
-            for karta in self.__igraci[i]['skupljeno']:
-                r['skupljeno'] += Tablic.vrijednostKarata(karta)
             rezultati.append(r)
 
         # Vrati izracunati rezultat.
         return rezultati
+
+    @classmethod
+    def izvediSjeme (cls, sjeme, *oznake):
+        """
+        Izvedi sjeme neovisnog toka pseudoslucajnih brojeva iz glavnog sjemena
+        sjeme i oznaka oznake.
+
+        Povratna vrijednost je nenegativni 64-bitni cijeli broj izracunat
+        hash funkcijom SHA-256 stringa sjemena i oznaka (cijelih brojeva ili
+        stringova), pa ne ovisi o verziji Pythona ni o procesu, a sjemena
+        izvedena s razlicitim oznakama (na primjer
+            >>> Tablic.izvediSjeme(sjeme, r, 'spil')
+            >>> Tablic.izvediSjeme(sjeme, r, 'igrac', j)
+        za spil i j-tog igraca r-te partije turnira) prakticki su neovisna.
+
+        """
+
+        kljuc = '/'.join(str(x) for x in (sjeme,) + oznake)
+
+        return int(hashlib.sha256(kljuc.encode('utf-8')).hexdigest()[:16], 16)
+
+    @classmethod
+    def simuliraj (cls, igraci, n, sjeme = None, generator = None):
+        """
+        Odigraj n partija bez zapisnika i dohvati njihove konacne rezultate.
+
+        Argument igraci je niz igraca (objekata podklasa klase Tablic.Igrac s
+        indeksima redom 0, 1, ...) ili klasa igraca (koje se instanciraju samo
+        jednom, s indeksom kao jedinim argumentom).  Isti objekti igraju sve
+        partije, a na pocetku svake partije poziva im se funkcija
+        saznajBrojIgraca (kojom se, dakle, moraju "resetirati").  Ako je
+        zadano sjeme, njime se inicijalizira globalni generator modula random
+        (njime se mijesaju spilovi, a ugradeni igraci njime biraju poteze),
+        pa su rezultati jednaki rezultatima partija odigranih nakon
+            >>> random.seed(sjeme)
+        uzastopnim kreiranjem objekata klase Tablic, dodavanjem igraca istih
+        klasa i pozivanjem funkcije igraj.  Ako je zadan generator, spilovi se
+        mijesaju njime (a argument sjeme se zanemaruje), pa su, ako i igraci
+        imaju vlastite generatore (v. funkciju Tablic.Igrac.postaviGenerator),
+        rezultati jednaki rezultatima partija objekata klase Tablic kreiranih
+        s istim generatorom.
+
+        Partije se igraju u uskoj petlji: stanje igre cuva se bitovima (v.
+        klasu SkupKarata), igracima koji to prihvacaju (v. funkciju
+        Tablic.Igrac.prihvacaSnimke) skupovi karata prosljeduju se kao
+        zapamcene nepromjenjive snimke (objekti klase frozenset), a legalnost
+        poteza ne provjerava se igracima koji igraju samo legalne poteze (v.
+        funkciju Tablic.Igrac.igraLegalno).
+
+        Povratna vrijednost je objekt klase numpy.ndarray oblika (n, m) tipa
+        numpy.int16, gdje je m broj igraca, ciji je k-ti redak konacni
+        rezultat k-te partije (v. funkciju Tablic.Log.konacniRezultat).  Ako
+        paket numpy nije dostupan, povratna vrijednost je lista tuple-ova
+        konacnih rezultata.
+
+        """
+
+        def __snimka (bitovi):
+            """
+            Dohvati nepromjenjivu snimku skupa karata zadanog bitovima bitovi
+            (snimke se pamte za cijelu partiju).
+
+            """
+
+            try:
+                return snimke[bitovi]
+            except KeyError:
+                snimka = snimke[bitovi] = frozenset(SkupKarata.izBitova(bitovi))
+
+                return snimka
+
+        def __prikaz (bitovi, j):
+            """
+            Dohvati skup karata zadan bitovima bitovi u obliku za
+            prosljedivanje igracu s indeksom j.
+
+            """
+
+            return __snimka(bitovi) if povjerljivi[j] else SkupKarata.izBitova(bitovi).uSkup()
+
+        # Instanciraj igrace zadane klasama.
+        igraci = [igraci[i](i) if isinstance(igraci[i], type) else igraci[i] for i in range(len(igraci))]
+        m = len(igraci)
+
+        # Provjeri igrace.
+
+        if m <= 1 or (52 - Tablic.inicijalniBrojKarata_stol()) % m:
+            raise RuntimeError('{0:d} nije valjani broj igraca u partiji igre tablic.'.format(m))
+
+        for i in range(m):
+            if igraci[i].dohvatiIndeks() != i:
+                raise ValueError('Igrac {0:s} nema indeks {1:d}.'.format(str(igraci[i]), i))
+
+        imena = [igrac.dohvatiIme() for igrac in igraci]
+        povjerljivi = [igrac.prihvacaSnimke() for igrac in igraci]
+        legalni = [igrac.igraLegalno() for igrac in igraci]
+
+        if generator is None:
+            if sjeme is not None:
+                random.seed(sjeme)
+            generator = random
+        mijesalica = Mijesalica(generator = generator)
+
+        rezultati = list()
+        for r in range(n):
+            # Pripremi novu partiju.
+            spil = Spil(mijesalica.promijesaj())
+            snimke = dict()
+
+            stol = SkupKarata.bitoviKolekcije(spil.podijeli(Tablic.inicijalniBrojKarata_stol()))
+            ruke = [0 for j in range(m)]
+            skupljeno = [0 for j in range(m)]
+            table = [0 for j in range(m)]
+            zadnji = None
+
+            for j in range(m):
+                igraci[j].saznajBrojIgraca(m, imena if povjerljivi[j] else list(imena))
+
+            while spil:
+                # Podijeli karte (kao u funkciji igraj) i objavi dijeljenje.
+                k = min(Tablic.inicijalniBrojKarata_ruka(), len(spil) // m)
+                karte = spil.podijeli(k * m)
+                for j in range(m):
+                    ruke[j] |= SkupKarata.bitoviKolekcije(karte[j::m])
+                for j in range(m):
+                    igraci[j].saznajNovoDijeljenje(__prikaz(ruke[j], j), __prikaz(stol, j))
+
+                for t in range(k):
+                    for i in range(m):
+                        # Dohvati potez (do prvog legalnog ako igrac ne igra
+                        # samo legalne poteze).
+                        ponovi = False
+                        while True:
+                            karta, S = igraci[i].odigraj(__prikaz(ruke[i], i), __prikaz(stol, i), ponovi)
+                            if legalni[i]:
+                                break
+                            greske = Tablic.__greskePoteza(SkupKarata.izBitova(ruke[i]), SkupKarata.izBitova(stol), karta, S)
+                            if not greske:
+                                break
+                            ponovi = (True, tuple(greske)) if igraci[i].hocuRazlog() else True
+
+                        karta = Karta.zamrzni(karta)
+                        b = 1 << karta.kod
+                        s = SkupKarata.bitoviKolekcije(S)
+
+                        # Objavi potez.
+                        for j in range(m):
+                            igraci[j].vidiPotez(i,
+                                                __prikaz(ruke[j], j), __prikaz(stol, j),
+                                                karta, __snimka(s) if povjerljivi[j] else SkupKarata.izBitova(s).uSkup())
+
+                        # Promijeni stanje igre ovisno o potezu.
+                        ruke[i] &= ~b
+                        if s:
+                            skupljeno[i] |= b | s
+                            stol &= ~s
+                            if not stol:
+                                table[i] += 1
+                            zadnji = i
+                        else:
+                            stol |= b
+
+            # Zavrsi partiju (kao u funkciji igraj).
+            if zadnji is not None:
+                skupljeno[zadnji] |= stol
+            brojevi = [bin(x).count('1') for x in skupljeno]
+            strogo = brojevi.count(max(brojevi)) == 1
+
+            rezultat = [{'ime' : imena[j],
+                         'skupljeno' : Tablic.vrijednost(SkupKarata.izBitova(skupljeno[j])),
+                         'table' : table[j],
+                         'max' : (strogo and brojevi[j] == max(brojevi), brojevi[j])} for j in range(m)]
+            for j in range(m):
+                igraci[j].saznajRezultat(rezultat if povjerljivi[j] else copy.deepcopy(rezultat))
+
+            rezultati.append(tuple(Tablic.Log.konacniRezultat(rezultat)))
+
+        # Vrati konacne rezultate partija.
+
+        if np is None:
+            return rezultati
+
+        return np.array(rezultati, dtype = np.int16).reshape(n, m)
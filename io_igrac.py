@@ -71,13 +71,13 @@ class IOIgrac (Tablic.Igrac):
         # Vrati str(x).
         return str(x)
 
-    def __init__ (self, i, ime = None):
+    def __init__ (self, i, ime = None, sjeme = None, generator = None):
         """
         Inicijaliziraj objekt klase IOIgrac.
 
         """
 
-        Tablic.Igrac.__init__(self, i, ime)
+        Tablic.Igrac.__init__(self, i, ime, sjeme, generator)
 
         # Inicijaliziraj relevantne varijable
 
@@ -267,10 +267,10 @@ class IOIgrac (Tablic.Igrac):
                         karta = (Karta(Karta.Boja.TREF, Karta.Znak.BR2) if karta.znak == Karta.Znak.BR2 else Karta(Karta.Boja.KARO, Karta.Znak.BR10))
                     else:
                         # Inace pronadi (neku) kartu odgovarajuceg znaka u ruci.
-                        karta = PohlepniIgrac.slucajniEkvivalentni(ruka, karta)
+                        karta = PohlepniIgrac.slucajniEkvivalentni(ruka, karta, self.dohvatiGenerator())
                 else:
                     # Inace pronadi (neku) kartu odgovarajuceg znaka u ruci.
-                    karta = PohlepniIgrac.slucajniEkvivalentni(ruka, karta)
+                    karta = PohlepniIgrac.slucajniEkvivalentni(ruka, karta, self.dohvatiGenerator())
 
         # Pronadi sve moguce poteze s odabranom kartom.
         M = Tablic.moguciPotezi(stol)
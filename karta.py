@@ -10,6 +10,8 @@ import enum
 import math
 import six
 
+from predmemorija import Predmemorija
+
 if six.PY3:
     unicode = str
     long = int
@@ -20,8 +22,26 @@ class Karta (object):
 
     Klasa Karta optimizirana je za igru tablic.
 
+    Ako je ukljuceno interniranje karata (v. funkciju postaviInterniranje),
+    sve karte su unaprijed kreirani jedinstveni objekti (po jedan za svaku
+    kombinaciju boje i znaka, ukljucujuci nedefinirane): Karta(...),
+    copy.copy i copy.deepcopy vracaju postojeci objekt, a za usporedbu karata
+    dovoljno je usporediti identitete.  Internirane karte su zamrznute: ne mogu
+    se mijenjati (pokusaj zadavanja boje ili znaka izbacuje iznimku tipa
+    TypeError), pa se mogu dijeliti medu igracima, zapisnicima i dretvama bez
+    kopiranja.  Zamrznuta karta jednaka bilo kojoj karti dohvaca se funkcijom
+    Karta.zamrzni (i ako je interniranje iskljuceno).
+
+    Svaka karta pamti svoj kljuc (v. funkciju kljuc), cijeli broj koji je
+    ujedno hash vrijednost karte i po kojem se karte usporeduju (==, <, >,
+    <=, >=) bez konverzija.  Karte se tim operatorima usporeduju samo s
+    kartama; za usporedbu karte s vrijednoscu koja se tek treba konvertirati
+    u kartu koristi se funkcija usporedi.
+
     """
 
+    __slots__ = ('boja', 'znak', '__zamrznuta', '__kljuc')
+
     @enum.unique
     class Boja (enum.IntEnum):
         """
@@ -144,7 +164,7 @@ class Karta (object):
 
             """
 
-            return self.value * len(list(Karta.Boja))
+            return self.value * len(Karta.Boja)
 
     class __Iterator (object):
         """
@@ -235,6 +255,271 @@ class Karta (object):
 
             return unicode('{0:s}({1:s}, {2:d}, {3:d}, {4:d})').format(self.__class__.__name__, unicode(self.__karta), self.__i, self.__stop, self.__step)
 
+    # Je li ukljuceno interniranje karata.
+    __interniranje = True
+
+    # Lista interniranih karata (indeks karte je boja + 5 * znak) i lista
+    # interniranih valjanih karata po kodovima (racunaju se pri prvom
+    # koristenju).
+    __internirane = None
+    __poKodu = None
+
+    # Predmemorija procitanih stringova (kljuc je string, a rezultat par boje i
+    # znaka karte; puni se kanonskim zapisima karata pri prvom koristenju).
+    __predmemorijaNotacija = Predmemorija()
+    __notacijePripremljene = False
+
+    # Boje i znakovi karata poredani po indeksima u kodovima karata te indeksi
+    # znakova u kodovima karata po vrijednostima znakova (v. funkciju kod).
+    __boje = (Boja.HERC, Boja.PIK, Boja.KARO, Boja.TREF)
+    __znakovi = (Znak.A, Znak.BR2, Znak.BR3, Znak.BR4, Znak.BR5, Znak.BR6, Znak.BR7, Znak.BR8, Znak.BR9, Znak.BR10, Znak.J, Znak.Q, Znak.K)
+    __indeksiZnakova = (None, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, None, 10, 11, 12)
+
+    # Tablica suma (na mjestu [a][b] je bitovna maska svih mogucih suma karte
+    # vrijednosti a i vrijednosti b --- t-ti bit postavljen je ako i samo ako
+    # je t moguca suma; v. funkciju __add__) i znakovi u koje se sumiraju
+    # sume po vrijednostima (suma 11 sumira se u znak A).
+    __tablicaSuma = tuple(tuple((1 << a + b if a + b <= 14 else 0) | (1 << a + b + 10 if 1 in {a, b} and a + b + 10 <= 14 else 0) for b in range(15)) for a in range(15))
+    __znakoviSuma = (Znak.NA, Znak.A, Znak.BR2, Znak.BR3, Znak.BR4, Znak.BR5, Znak.BR6, Znak.BR7, Znak.BR8, Znak.BR9, Znak.BR10, Znak.A, Znak.J, Znak.Q, Znak.K)
+
+    @classmethod
+    def __kreiraj (cls, boja, znak, zamrznuta = False):
+        """
+        Kreiraj novi objekt klase Karta boje boja i znaka znak (objekata klasa
+        Karta.Boja i Karta.Znak respektivno) bez citanja argumenata.
+
+        """
+
+        karta = object.__new__(Karta)
+        object.__setattr__(karta, 'boja', boja)
+        object.__setattr__(karta, 'znak', znak)
+        object.__setattr__(karta, '_Karta__kljuc', boja + len(Karta.Boja) * znak)
+        object.__setattr__(karta, '_Karta__zamrznuta', zamrznuta)
+
+        return karta
+
+    @classmethod
+    def __pripremiInternirane (cls):
+        """
+        Kreiraj internirane karte ako vec nisu kreirane.
+
+        """
+
+        if Karta.__internirane is not None:
+            return
+
+        internirane = [None for i in range(len(Karta.Boja) * (max(Karta.Znak) + 1))]
+        for boja in Karta.Boja:
+            for znak in Karta.Znak:
+                internirane[boja + len(Karta.Boja) * znak] = Karta.__kreiraj(boja, znak, True)
+
+        Karta.__poKodu = [internirane[Karta.__boje[kod & 3] + len(Karta.Boja) * Karta.__znakovi[kod >> 2]] for kod in range(52)]
+        Karta.__internirane = internirane
+
+    @classmethod
+    def postaviInterniranje (cls, interniranje):
+        """
+        Ukljuci (interniranje = True) ili iskljuci (interniranje = False)
+        interniranje karata.
+
+        Iskljucivanje interniranja ne utjece na vec kreirane karte, ali nove
+        karte kreiraju se kao novi objekti koji se mogu mijenjati.
+
+        """
+
+        Karta.__interniranje = bool(interniranje)
+
+    @classmethod
+    def jeInterniranje (cls):
+        """
+        Provjeri je li ukljuceno interniranje karata.
+
+        """
+
+        return Karta.__interniranje
+
+    @classmethod
+    def izBojeZnaka (cls, boja, znak):
+        """
+        Dohvati kartu boje boja i znaka znak.
+
+        Argumenti boja i znak moraju biti objekti klasa Karta.Boja i Karta.Znak
+        respektivno (ne provjeravaju se i ne prevode kao u funkciji
+        Karta.__init__).
+
+        """
+
+        if Karta.__interniranje:
+            if Karta.__internirane is None:
+                Karta.__pripremiInternirane()
+
+            return Karta.__internirane[boja + len(Karta.Boja) * znak]
+
+        return Karta.__kreiraj(boja, znak)
+
+    @classmethod
+    def zamrzni (cls, karta):
+        """
+        Dohvati zamrznutu (interniranu) kartu jednaku karti karta.
+
+        Ako je karta vec zamrznuta, povratna vrijednost je sama karta.
+        Funkcija ne ovisi o tome je li interniranje ukljuceno.
+
+        """
+
+        if Karta.__internirane is None:
+            Karta.__pripremiInternirane()
+
+        return Karta.__internirane[karta.__kljuc]
+
+    @classmethod
+    def izKoda (cls, kod):
+        """
+        Dohvati kartu s kodom kod (cijeli broj od 0 do 51, v. funkciju kod).
+
+        """
+
+        if Karta.__interniranje:
+            if Karta.__poKodu is None:
+                Karta.__pripremiInternirane()
+
+            return Karta.__poKodu[kod]
+
+        return Karta.izBojeZnaka(Karta.__boje[kod & 3], Karta.__znakovi[kod >> 2])
+
+    @classmethod
+    def predmemorijaNotacija (cls):
+        """
+        Dohvati predmemoriju procitanih stringova (objekt klase Predmemorija).
+
+        Predmemorija se pri prvom citanju stringa puni kanonskim zapisima svih
+        karata (na primjer 'herc 10', 'herc10', 'h10', 'h 10', 'herc', '10').
+
+        """
+
+        return Karta.__predmemorijaNotacija
+
+    @classmethod
+    def __procitajNotaciju (cls, notacija):
+        """
+        Procitaj string notacija kao u funkciji Karta.__init__ (bez
+        predmemorije) i vrati par boje i znaka procitane karte.
+
+        """
+
+        karta = Karta.__kreiraj(Karta.Boja.NA, Karta.Znak.NA)
+
+        if notacija.upper() in Karta.Boja.__members__:
+            karta.boja = notacija
+        else:
+            # Rastavi string.
+            dijelovi = notacija.split()
+            if len(dijelovi) == 1:
+                # Ako je string i nakon rastavljanja jedinstven, rastavi se
+                # rucno.
+                stop = False
+                for j in range(len(dijelovi[0])):
+                    if dijelovi[0][j].isdigit() or dijelovi[0][j:].upper() in Karta.Znak.__members__:
+                        stop = True
+
+                        break
+                if not stop:
+                    j = len(dijelovi[0])
+
+                if j:
+                    # Prvim dijelom stringa zadaj boju.
+                    karta.boja = dijelovi[0][:j]
+                if j < len(dijelovi[0]):
+                    # Drugim dijelom stringa zadaj znak.
+                    karta.znak = dijelovi[0][j:]
+            elif len(dijelovi) == 2:
+                # Prvim dijelom stringa zadaj boju, a drugim znak.
+                karta.boja = dijelovi[0]
+                karta.znak = dijelovi[1]
+            elif dijelovi:
+                # Rastav stringa na strogo vise od 2 podstringa se ne prepoznaje.
+                raise TypeError("String `{0:s}' nije valjani argument za inicijalizaciju objekta klase Karta.".format(notacija))
+
+        return (karta.boja, karta.znak)
+
+    @classmethod
+    def __notacija (cls, notacija):
+        """
+        Dohvati par boje i znaka karte zadane stringom notacija (iz
+        predmemorije procitanih stringova).
+
+        """
+
+        if not Karta.__notacijePripremljene:
+            Karta.__notacijePripremljene = True
+
+            # Napuni predmemoriju kanonskim zapisima karata.
+            for boja in Karta.__boje:
+                for b in (boja.name.lower(), boja.name.lower()[0]):
+                    Karta.__predmemorijaNotacija.zapamti(b, Karta.__procitajNotaciju(b))
+                    for znak in Karta.__znakovi:
+                        z = znak.name if znak.value > 10 or znak == Karta.Znak.A else str(znak.value)
+                        Karta.__predmemorijaNotacija.zapamti(z, Karta.__procitajNotaciju(z))
+                        for x in ('{0:s} {1:s}'.format(b, z), '{0:s}{1:s}'.format(b, z)):
+                            Karta.__predmemorijaNotacija.zapamti(x, Karta.__procitajNotaciju(x))
+
+        return Karta.__predmemorijaNotacija.dohvati(notacija, Karta.__procitajNotaciju, notacija)
+
+    @classmethod
+    def parsiraj (cls, x):
+        """
+        Procitaj karte zadane kolekcijom ili stringom x.
+
+        Ako je x string, rastavlja se po zarezima i svaki (neprazni) dio
+        predstavlja jednu kartu (na primjer 'herc 10, pik K, 7').  Inace je x
+        iterabilni objekt ciji su elementi stringovi ili drugi valjani
+        argumenti za inicijalizaciju objekta klase Karta.  Povratna vrijednost
+        je tuple procitanih karata redom kojim su zadane.
+
+        """
+
+        if isinstance(x, (str, unicode)):
+            x = [y.strip() for y in x.split(',') if y.strip()]
+
+        return tuple(Karta.izBojeZnaka(*Karta.__notacija(y)) if isinstance(y, (str, unicode)) else Karta(y) for y in x)
+
+    @classmethod
+    def maskaSuma (cls, karte):
+        """
+        Dohvati bitovnu masku svih mogucih suma kolekcije karata karte.
+
+        Bit t povratne maske postavljen je ako i samo ako je t (od 0 do 14)
+        moguca suma svih karata iz karte (karte znaka A racunaju se kao 1 ili
+        11, a sume vece od 14 se odbacuju).  Maska se racuna posmacima bitova:
+        dodavanjem karte vrijednosti v maska m prelazi u m << v (i jos
+        m << 11 ako je karta znaka A).
+
+        """
+
+        m = 1
+        for karta in karte:
+            v = karta.znak
+            m = (m << v | (m << 11 if v == 1 else 0)) & 0x7fff
+
+        return m
+
+    @classmethod
+    def moguceSume (cls, karte):
+        """
+        Dohvati skup svih znakova u koje se sumira kolekcija karata karte.
+
+        Povratna vrijednost je skup objekata klase Karta.Znak dobivenih iz
+        svih mogucih suma (v. funkciju Karta.maskaSuma) tako da se suma 11
+        prevodi u znak A, a suma 0 u znak NA.  Za nepraznu kolekciju karata
+        karte povratna vrijednost je, dakle, jednaka
+            >>> {Karta.Znak(x if x != 11 else 1) for x in sum(karte)}
+
+        """
+
+        m = Karta.maskaSuma(karte)
+
+        return {Karta.__znakoviSuma[t] for t in range(15) if m >> t & 1}
+
     @classmethod
     def uKarte (cls, x):
         """
@@ -270,16 +555,43 @@ class Karta (object):
 
         """
 
-        return {Karta(boja, znak) for boja in [Karta.Boja.HERC, Karta.Boja.PIK, Karta.Boja.KARO, Karta.Boja.TREF]
-                                  for znak in [Karta.Znak.A, Karta.Znak.BR2, Karta.Znak.BR3, Karta.Znak.BR4, Karta.Znak.BR5, Karta.Znak.BR6, Karta.Znak.BR7, Karta.Znak.BR8, Karta.Znak.BR9, Karta.Znak.BR10, Karta.Znak.J, Karta.Znak.Q, Karta.Znak.K]}
+        return {Karta.izKoda(kod) for kod in range(52)}
 
     def __new__ (cls, *args, **kwargs):
         """
         Kreiraj objekt klase Karta.
 
+        Ako je ukljuceno interniranje karata, argumenti se citaju kao u funkciji
+        Karta.__init__ i vraca se internirana karta (Karta.__init__ tada ne
+        mijenja kartu).
+
         """
 
-        return super(Karta, cls).__new__(cls)
+        if Karta.__interniranje and cls is Karta:
+            # Tretiraj najcesce slucajeve bez kreiranja novog objekta.
+            if len(args) == 2 and not kwargs and isinstance(args[0], Karta.Boja) and isinstance(args[1], Karta.Znak):
+                Karta.__pripremiInternirane()
+
+                return Karta.__internirane[args[0] + len(Karta.Boja) * args[1]]
+            if len(args) == 1 and not kwargs and isinstance(args[0], Karta) and args[0].__zamrznuta:
+                return args[0]
+            if len(args) == 1 and not kwargs and isinstance(args[0], (str, unicode)):
+                return Karta.izBojeZnaka(*Karta.__notacija(args[0]))
+
+        karta = super(Karta, cls).__new__(cls)
+        object.__setattr__(karta, 'boja', Karta.Boja.NA)
+        object.__setattr__(karta, 'znak', Karta.Znak.NA)
+        object.__setattr__(karta, '_Karta__kljuc', 0)
+        object.__setattr__(karta, '_Karta__zamrznuta', False)
+
+        if Karta.__interniranje and cls is Karta:
+            # Procitaj argumente i vrati interniranu kartu.
+            karta.__init__(*args, **kwargs)
+            Karta.__pripremiInternirane()
+
+            return Karta.__internirane[karta.boja + len(Karta.Boja) * karta.znak]
+
+        return karta
 
     def __init__ (self, *args, **kwargs):
         """
@@ -367,6 +679,10 @@ class Karta (object):
 
         """
 
+        # Internirana karta je vec inicijalizirana.
+        if self.__zamrznuta:
+            return
+
         # Inicijaliziraj kartu na nedefiniranu kartu.
         self.boja = Karta.Boja.NA
         self.znak = Karta.Znak.NA
@@ -392,37 +708,8 @@ class Karta (object):
                     # Zadaj samo znak karte.
                     self.znak = args[0]
                 elif isinstance(args[0], (str, unicode)):
-                    # Zadaj kartu stringom.
-                    if args[0].upper() in Karta.Boja.__members__:
-                        self.boja = args[0]
-                    else:
-                        # Rastavi string.
-                        karta = args[0].split()
-                        if len(karta) == 1:
-                            # Ako je string i nakon rastavljanja jedinstven,
-                            # rastavi se rucno.
-                            stop = False
-                            for j in range(len(karta[0])):
-                                if karta[0][j].isdigit() or karta[0][j:].upper() in Karta.Znak.__members__:
-                                    stop = True
-
-                                    break
-                            if not stop:
-                                j = len(karta[0])
-
-                            if j:
-                                # Prvim dijelom stringa zadaj boju.
-                                self.boja = karta[0][:j]
-                            if j < len(karta[0]):
-                                # Drugim dijelom stringa zadaj znak.
-                                self.znak = karta[0][j:]
-                        elif len(karta) == 2:
-                            # Prvim dijelom stringa zadaj boju, a drugim znak.
-                            self.boja = karta[0]
-                            self.znak = karta[1]
-                        elif karta:
-                            # Rastav stringa na strogo vise od 2 podstringa se ne prepoznaje.
-                            raise TypeError("String `{0:s}' nije valjani argument za inicijalizaciju objekta klase Karta.".format(args[0]))
+                    # Zadaj kartu stringom (v. funkciju Karta.parsiraj).
+                    self.boja, self.znak = Karta.__notacija(args[0])
                 elif isinstance(args[0], dict):
                     # Zadavaj kartu rjecnikom.
                     if not set(args[0].keys()) <= {'boja', 'znak'}:
@@ -476,6 +763,7 @@ class Karta (object):
         Pokusaj zadati vrijednost atributa.
 
         Ako atribut name ne postoji, izbacuje se iznimka tipa AttributeError.
+        Ako je karta internirana, izbacuje se iznimka tipa TypeError.
 
         U daljnjem tekstu enumeracija je Karta.Boja ako je name = 'boja'
         odnosno Karta.Znak ako je name = 'znak'.  Ako je value objekt klase
@@ -579,18 +867,18 @@ class Karta (object):
 
             raise TypeError("Vrijednost `{0:s}' nije valjana vrijednost za zadavanje enumeracije `{0:s}'.".format(repr(vrijednost), enumeracija.__name__))
 
+        if name not in {'boja', 'znak'}:
+            raise AttributeError("Atribut `{0:s}' ne postoji.".format(name))
+        if self.__zamrznuta:
+            raise TypeError("Internirana karta se ne moze mijenjati.")
+
         if name == 'boja':
-            if 'boja' in self.__dict__:
-                self.__dict__['boja'] = __prevedi(Karta.Boja, value)
-            else:
-                self.__dict__.update({'boja' : __prevedi(Karta.Boja, value)})
-        elif name == 'znak':
-            if 'znak' in self.__dict__:
-                self.__dict__['znak'] = __prevedi(Karta.Znak, value)
-            else:
-                self.__dict__.update({'znak' : __prevedi(Karta.Znak, value)})
+            object.__setattr__(self, 'boja', __prevedi(Karta.Boja, value))
         else:
-            raise AttributeError("Atribut `{0:s}' ne postoji.".format(name))
+            object.__setattr__(self, 'znak', __prevedi(Karta.Znak, value))
+
+        # Azuriraj kljuc karte.
+        object.__setattr__(self, '_Karta__kljuc', self.boja + len(Karta.Boja) * self.znak)
 
     def __delattr__ (self, name):
         """
@@ -607,18 +895,82 @@ class Karta (object):
         """
         Dohvati copy.copy(self).
 
+        Internirana karta se ne kopira.
+
         """
 
+        if self.__zamrznuta:
+            return self
+
         return Karta(self.boja, self.znak)
 
     def __deepcopy__ (self, memo = dict()):
         """
         Dohvati copy.deepcopy(self, memo).
 
+        Internirana karta se ne kopira.
+
         """
 
+        if self.__zamrznuta:
+            return self
+
         return Karta(copy.deepcopy(self.boja, memo), copy.deepcopy(self.znak, memo))
 
+    def __reduce__ (self):
+        """
+        Dohvati podatke za serijalizaciju (pickle) karte.
+
+        Karta se deserijalizira pozivom Karta(boja, znak), stoga je
+        deserijalizirana karta internirana ako je interniranje ukljuceno.
+
+        """
+
+        return (Karta, (self.boja, self.znak))
+
+    @property
+    def zamrznuta (self):
+        """
+        Provjeri je li karta zamrznuta (internirana, ne moze se mijenjati).
+
+        """
+
+        return self.__zamrznuta
+
+    @property
+    def kljuc (self):
+        """
+        Dohvati kljuc karte.
+
+        Kljuc karte je cijeli broj boja + 5 * znak (gdje su boja i znak
+        enumeracijske vrijednosti boje i znaka karte).  Kljucevi razlicitih
+        karata su razliciti, uzlazni poredak kljuceva odgovara uzlaznom
+        poretku karata, a hash vrijednost karte jednaka je njezinom kljucu.
+
+        """
+
+        return self.__kljuc
+
+    @property
+    def kod (self):
+        """
+        Dohvati kod karte.
+
+        Kod karte je 4 * z + b, gdje je z indeks znaka karte (0 za A, 1 do 9
+        za brojeve od 2 do 10, 10, 11, 12 za J, Q, K respektivno), a b indeks
+        boje karte (0, 1, 2, 3 za herc, pik, karo, tref respektivno).  Dakle,
+        uzlazni poredak kodova odgovara uzlaznom poretku karata.
+
+        Ako karta nije valjana karta (ako joj boja ili znak nisu definirani),
+        kod je None.
+
+        """
+
+        if not (self.boja and self.znak):
+            return None
+
+        return 4 * Karta.__indeksiZnakova[self.znak] + self.boja - 1
+
     def __len__ (self):
         """
         Dohvati len(self).
@@ -717,17 +1069,46 @@ class Karta (object):
 
         """
 
+        # Izracunaj bitovnu masku svih mogucih suma i vrati skup suma.
+        m = self.__maskaZbroja(value)
+
+        sume = set()
+        while m:
+            b = m & -m
+            sume.add(b.bit_length() - 1)
+            m ^= b
+
+        return sume
+
+    def __maskaZbroja (self, value):
+        """
+        Dohvati bitovnu masku svih mogucih suma trenutne karte i vrijednosti
+        value (v. funkciju __add__).
+
+        Bit t povratne maske postavljen je ako i samo ako je t moguca suma.
+        Sume karte i cijelog broja citaju se iz tablice suma.
+
+        """
+
         if value is None:
             # Tretiraj specijalni slucaj kada je value None.
-            if self.znak == Karta.Znak.NA:
-                return set()
-            else:
-                return {self.znak.value}
+            return 1 << self.znak if self.znak else 0
+
+        if isinstance(value, int) and 0 <= value <= 14:
+            # Procitaj sume iz tablice suma (valjane cijele vrijednosti su
+            # vrijednosti znakova i 11, dakle svi cijeli brojevi od 0 do 14).
+            return Karta.__tablicaSuma[self.znak][value]
 
         if hasattr(value, '__iter__') and not isinstance(value, (str, unicode, Karta)):
             # Tretiraj specijalni slucaj kada je value iterabilni objekt i nije
             # string ili objekt klase Karta.
-            return set().union(*tuple(self.__add__(y) for y in value))
+            tablica = Karta.__tablicaSuma[self.znak]
+
+            m = 0
+            for y in value:
+                m |= tablica[y] if isinstance(y, int) and 0 <= y <= 14 else self.__maskaZbroja(y)
+
+            return m
 
         if isinstance(value, complex):
             if value.imag:
@@ -735,41 +1116,18 @@ class Karta (object):
             value = float(value.real)
 
         if isinstance(value, int):
-            if not Karta.Znak.postoji(value) and value != 11:
-                raise ValueError('value mora biti 0, 11 ili numericka vrijednost neke karte.')
-        else:
-            try:
-                value = int(Karta(value))
-            except TypeError:
-                raise TypeError("value mora biti objekt klase `int' ili konvertibilan u objekt klase `Karta'.".format(repr(value)))
-            except ValueError:
-                raise ValueError("Vrijednost `{0:s}' nije valjani sumand za zbrajanje objekata klase `Karta'.".format(repr(value)))
-
-        if self.znak == Karta.Znak.A and value == 1:
-            # Tretiraj specijalni slucaj zbrajanja 2 A.
-            return {Karta.Znak.BR2.value, Karta.Znak.J.value}
-        if self.znak == Karta.Znak.A:
-            # Tretiraj specijalni slucaj kada je karta znaka A.
-            if 1 + value > 14:
-                return set()
-            if 11 + value > 14:
-                return {1 + value}
-            return {1 + value, 11 + value}
-        if value == 1:
-            # Tretiraj specijalni slucaj kada je value A.
-            if self.znak + 1 > 14:
-                return set()
-            if self.znak + 11 > 14:
-                return {self.znak + 1}
-            else:
-                return {self.znak + 1, self.znak + 11}
+            # Cijeli brojevi izvan intervala [0, 14] nisu valjani sumandi.
+            raise ValueError('value mora biti 0, 11 ili numericka vrijednost neke karte.')
 
-        if self.znak + value > 14:
-            # Ako je zbroj preveliki, zbroj nije moguc pa vrati prazni skup.
-            return set()
+        try:
+            value = int(Karta(value))
+        except TypeError:
+            raise TypeError("value mora biti objekt klase `int' ili konvertibilan u objekt klase `Karta'.".format(repr(value)))
+        except ValueError:
+            raise ValueError("Vrijednost `{0:s}' nije valjani sumand za zbrajanje objekata klase `Karta'.".format(repr(value)))
 
-        # Vrati skupa koji sadrzi jedinstvenu mogucu vrijednost zbroja.
-        return {self.znak + value}
+        # Procitaj sume iz tablice suma.
+        return Karta.__tablicaSuma[self.znak][value]
 
     def __radd__ (self, value):
         """
@@ -950,20 +1308,43 @@ class Karta (object):
         """
         Dohvati hash(self).
 
+        Hash vrijednost karte je njezin kljuc (v. funkciju kljuc).
+
+        """
+
+        return self.__kljuc
+
+    def usporedi (self, value):
         """
+        Usporedi kartu s vrijednoscu value.
+
+        Ako value nije objekt klase Karta, najprije se konvertira u objekt
+        klase Karta (kao Karta(value)).  Povratna vrijednost je -1, 0 ili 1 ako
+        je karta manja od, jednaka ili veca od dobivene karte respektivno.
+
+        """
+
+        if not isinstance(value, Karta):
+            value = Karta(value)
 
-        return (self.boja.value + self.znak.value * len(list(Karta.Boja)))
+        return (self.__kljuc > value.__kljuc) - (self.__kljuc < value.__kljuc)
 
     def __eq__ (self, value):
         """
         Usporedi (==) karte kao uredene parove boje i znaka.
 
+        Ako value nije objekt klase Karta, povratna vrijednost je
+        NotImplemented (v. funkciju usporedi).
+
         """
 
+        if self is value:
+            return True
+
         if not isinstance(value, Karta):
-            value = Karta(value)
+            return NotImplemented
 
-        return self.znak == value.znak and self.boja == value.boja
+        return self.__kljuc == value.__kljuc
 
     def __ne__ (self, value):
         """
@@ -971,7 +1352,13 @@ class Karta (object):
 
         """
 
-        return not self.__eq__(value)
+        if self is value:
+            return False
+
+        if not isinstance(value, Karta):
+            return NotImplemented
+
+        return self.__kljuc != value.__kljuc
 
     def __lt__ (self, value):
         """
@@ -980,9 +1367,9 @@ class Karta (object):
         """
 
         if not isinstance(value, Karta):
-            value = Karta(value)
+            return NotImplemented
 
-        return self.znak < value.znak or self.znak == value.znak and self.boja < value.boja
+        return self.__kljuc < value.__kljuc
 
     def __gt__ (self, value):
         """
@@ -991,9 +1378,9 @@ class Karta (object):
         """
 
         if not isinstance(value, Karta):
-            value = Karta(value)
+            return NotImplemented
 
-        return value.__lt__(self)
+        return self.__kljuc > value.__kljuc
 
     def __le__ (self, value):
         """
@@ -1001,7 +1388,10 @@ class Karta (object):
 
         """
 
-        return not self.__gt__(value)
+        if not isinstance(value, Karta):
+            return NotImplemented
+
+        return self.__kljuc <= value.__kljuc
 
     def __ge__ (self, value):
         """
@@ -1009,4 +1399,7 @@ class Karta (object):
 
         """
 
-        return not self.__lt__(value)
+        if not isinstance(value, Karta):
+            return NotImplemented
+
+        return self.__kljuc >= value.__kljuc
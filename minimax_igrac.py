@@ -9,6 +9,7 @@ import copy
 import time
 
 from karta import Karta
+from skup_karata import SkupKarata
 from engine import Tablic
 from pohlepni_log import PohlepniLog
 from pohlepni_igrac import PohlepniIgrac
@@ -27,12 +28,12 @@ class MinimaxIgrac (Tablic.Igrac):
         Vjerojatnom rukom igraca smatra se skup onih karata za koje ne vrijedi
         da ih igrac sigurno ili vjerojatno nema.
 
-        Objekt sigurnoNema mora biti objekt klase set ciji su elementi objekti
-        klase Karta, a predstavljaju tocno one karte koje igrac sigurno nema
-        (zadavajuci i boju i znak).  Objekt vjerojatno nema mora biti lista
-        booleanskih vrijednosti koja na indeksu i sadrzi True ako i samo ako
-        igrac vjerojatno nema kartu/-e koja/-e se pozivom funkcije
-        PohlepniLog.prevediKartu prevodi/-e u indeks i.
+        Objekt sigurnoNema mora biti objekt klase set ili SkupKarata ciji su
+        elementi objekti klase Karta, a predstavljaju tocno one karte koje
+        igrac sigurno nema (zadavajuci i boju i znak).  Objekt vjerojatno nema
+        mora biti lista booleanskih vrijednosti koja na indeksu i sadrzi True
+        ako i samo ako igrac vjerojatno nema kartu/-e koja/-e se pozivom
+        funkcije PohlepniLog.prevediKartu prevodi/-e u indeks i.
 
         Povratna vrijednost funkcije objekt je klase set ciji su elementi
         objekti klase Karta.  Svaka karta koja nije tref 2 ili karo 10, a nije
@@ -43,7 +44,18 @@ class MinimaxIgrac (Tablic.Igrac):
 
         """
 
-        return {Karta(PohlepniLog.prevediIndeks(PohlepniLog.prevediKartu(x))) for x in Karta.noviSpil() - sigurnoNema if not vjerojatnoNema[PohlepniLog.prevediKartu(x)]}
+        # Izracunaj predstavnike karata po indeksima za zapisnik.
+        predstavnici = [PohlepniLog.prevediIndeks(i) for i in range(PohlepniLog.dohvatiBrojIndeksa())]
+        predstavnici = [x if isinstance(x, Karta) else Karta.izBojeZnaka(Karta.Boja.NA, x) for x in predstavnici]
+
+        # Izracunaj vjerojatnu ruku.
+        ruka = set()
+        for x in SkupKarata.puni() - sigurnoNema:
+            i = PohlepniLog.prevediKartu(x)
+            if not vjerojatnoNema[i]:
+                ruka |= {predstavnici[i]}
+
+        return ruka
 
     @classmethod
     def heuristika (cls,
@@ -84,7 +96,7 @@ class MinimaxIgrac (Tablic.Igrac):
 
             if zadnji is not None:
                 # "Pocisti" stol.
-                bodovi[zadnji] += Tablic.vrijednostKarata(stol)
+                bodovi[zadnji] += Tablic.vrijednost(stol)
                 skupljeno[zadnji] += len(stol)
 
             # Pronadi osobu sa strogo najvise skupljenih karata ako postoji.
@@ -156,8 +168,13 @@ class MinimaxIgrac (Tablic.Igrac):
 
         """
 
-        # Saniraj argument sigurnoNema.
-        sigurnoNema = sigurnoNema | ruka | stol
+        # Prevedi skupove karata u objekte klase SkupKarata (skupovne operacije
+        # u stablu stanja igre tada su bitovne operacije nad cijelim brojevima
+        # pa stanja ne zauzimaju gotovo nimalo memorije) i saniraj argument
+        # sigurnoNema.
+        ruka = SkupKarata(ruka)
+        stol = SkupKarata(stol)
+        sigurnoNema = SkupKarata(sigurnoNema) | ruka | stol
 
         # Definiraj sortiranu listu kartaskih boja.
         boje = sorted([Karta.Boja.HERC, Karta.Boja.PIK, Karta.Boja.KARO, Karta.Boja.TREF], reverse = True)
@@ -203,7 +220,7 @@ class MinimaxIgrac (Tablic.Igrac):
                 zadnjiPotez = (PohlepniLog.dohvatiBrojIndeksa(), list())
 
                 # Iteriraj po mogucim potezima.
-                for potez in PohlepniIgrac.izborPoteza(ruka, stol):
+                for potez in PohlepniIgrac.izborPotezaKanonski(ruka, stol):
                     # Izracunaj "protorip poteza" (izgled poteza neovisno o bojama karata osim u slucaju specijalnih karata --- tref 2 i karo 10) i provjeri
                     # je li takav potez vec obraden (ako je, obrada se preskce).
                     ovajPotez = (PohlepniLog.prevediKartu(potez['karta']), sorted([PohlepniLog.prevediKartu(x) for x in potez['skupljeno']], reverse = True))
@@ -215,8 +232,8 @@ class MinimaxIgrac (Tablic.Igrac):
                         zadnjiPotez = ovajPotez
 
                     # Kreiraj nove liste bodova i brojeva skupljenih karata.
-                    noviBodovi = copy.deepcopy(bodovi)
-                    novoSkupljeno = copy.deepcopy(skupljeno)
+                    noviBodovi = list(bodovi)
+                    novoSkupljeno = list(skupljeno)
                     noviBodovi[i] += (potez['vrijednost'] + int(potez['tabla']) * Tablic.vrijednostTable())
                     if potez['skupljeno']:
                         novoSkupljeno[i] += 1 + len(potez['skupljeno'])
@@ -287,7 +304,7 @@ class MinimaxIgrac (Tablic.Igrac):
                 isti = set()
 
                 # Iteriraj po mogucim potezima.
-                for potez in PohlepniIgrac.izborPoteza(tudaRuka, stol):
+                for potez in PohlepniIgrac.izborPotezaKanonski(tudaRuka, stol):
                     # Izracunaj "protorip poteza" (izgled poteza neovisno o bojama karata osim u slucaju specijalnih karata --- tref 2 i
                     # karo 10) i provjeri je li takav potez vec obraden (ako je, obrada se preskce).
                     ovajPotez = (PohlepniLog.prevediKartu(potez['karta']),
@@ -323,7 +340,7 @@ class MinimaxIgrac (Tablic.Igrac):
                             elif potez['karta'].znak == Karta.Znak.BR10 and boja == Karta.Boja.KARO:
                                 continue
                             if not Karta(boja, potez['karta'].znak) in sigurnoNema:
-                                potez['karta'].boja = boja
+                                potez['karta'] = Karta(boja, potez['karta'].znak)
 
                                 break
 
@@ -332,11 +349,11 @@ class MinimaxIgrac (Tablic.Igrac):
                     # omogucile bolji potez od ovog (osim ove karte ako se ona mozda vec pojavila s
                     # mogucnosti boljeg poteza).
                     if not zadnje:
-                        novoVjerojatnoNema = copy.deepcopy(vjerojatnoNema)
+                        novoVjerojatnoNema = [list(x) for x in vjerojatnoNema]
                         for x in bolji - {ovajPotez[0]}:
                             novoVjerojatnoNema[j][x] = True
-                    noviBodovi = copy.deepcopy(bodovi)
-                    novoSkupljeno = copy.deepcopy(skupljeno)
+                    noviBodovi = list(bodovi)
+                    novoSkupljeno = list(skupljeno)
                     noviBodovi[j] += (potez['vrijednost'] + int(potez['tabla']) * Tablic.vrijednostTable())
                     if potez['skupljeno']:
                         novoSkupljeno[j] += 1 + len(potez['skupljeno'])
@@ -400,7 +417,7 @@ class MinimaxIgrac (Tablic.Igrac):
         # Vrati izracunati najvjerojatniji slijed poteza.
         return grana
 
-    def __init__ (self, i, ime = None, maxDubina = Tablic.inicijalniBrojKarata_ruka(), maxT = float('inf')):
+    def __init__ (self, i, ime = None, maxDubina = Tablic.inicijalniBrojKarata_ruka(), maxT = float('inf'), sjeme = None, generator = None):
         """
         Inicijaliziraj objekt klase MinimaxIgrac.
 
@@ -408,10 +425,12 @@ class MinimaxIgrac (Tablic.Igrac):
         MinimaxIgrac pri racunanju sljedeceg poteza.  Nakon zadnjeg dijeljenja
         za dubinu se uzima vrijednost Tablic.inicijalniBrojKarata_ruka(),
         neovisno o argumentu maxDubina.
+        Argumenti sjeme, generator zadaju generator pseudoslucajnih brojeva
+        igraca (v. funkciju Tablic.Igrac.postaviGenerator).
 
         """
 
-        Tablic.Igrac.__init__(self, i, ime)
+        Tablic.Igrac.__init__(self, i, ime, sjeme, generator)
 
         self.__maxDubina = maxDubina
         self.__maxT = maxT
@@ -467,6 +486,14 @@ class MinimaxIgrac (Tablic.Igrac):
 
         return igrac
 
+    @classmethod
+    def prihvacaSnimke (cls):
+        return True
+
+    @classmethod
+    def igraLegalno (cls):
+        return True
+
     def hocuRazlog (self):
         return False
 
@@ -486,7 +513,7 @@ class MinimaxIgrac (Tablic.Igrac):
 
         self.__zadnji = None
 
-        self.__sigurnoNema = set()
+        self.__sigurnoNema = SkupKarata()
         self.__vjerojatnoNema = [[0 for i in range(PohlepniLog.dohvatiBrojIndeksa())] for j in range(self.__n)]
 
     def saznajNovoDijeljenje (self, ruka, stol):
@@ -511,7 +538,7 @@ class MinimaxIgrac (Tablic.Igrac):
 
         # Azuriraj varijable ako je igrac kupio karte.
         if skupljeno:
-            self.__bodovi[i] += Tablic.vrijednostKarata({karta} | skupljeno) + int(skupljeno == stol) * Tablic.vrijednostTable()
+            self.__bodovi[i] += Tablic.vrijednost({karta} | skupljeno) + int(skupljeno == stol) * Tablic.vrijednostTable()
             self.__skupljeno[i] += 1 + len(skupljeno)
 
             self.__zadnji = i
@@ -525,12 +552,12 @@ class MinimaxIgrac (Tablic.Igrac):
             self.__vjerojatnoNema[i][PohlepniLog.prevediKartu(karta)] = False
 
             # Izracunaj vrijednost odigranog poteza i karte koje i-ti igrac vjerojatno ima.
-            vrijednost = (Tablic.vrijednostKarata(skupljeno | {karta}) + int(skupljeno == stol) * Tablic.vrijednostTable()) if skupljeno else 0
+            vrijednost = (Tablic.vrijednost(skupljeno | {karta}) + int(skupljeno == stol) * Tablic.vrijednostTable()) if skupljeno else 0
             tudaRuka = MinimaxIgrac.vjerojatnaRuka(self.__sigurnoNema, self.__vjerojatnoNema[i])
 
             # Za svaki potez vrijedniji od odigranog, a koji ne zahtijeva igranje odigrane karte, uvecaj vrijednost da igrac nema kartu kojom se taj potez
             # igra.
-            for potez in PohlepniIgrac.izborPoteza(tudaRuka, stol):
+            for potez in PohlepniIgrac.izborPotezaKanonski(tudaRuka, stol):
                 if (max(potez['vrijednost'], 0) + int(potez['tabla']) * Tablic.vrijednostTable() < vrijednost or
                     max(potez['vrijednost'], 0) + int(potez['tabla']) * Tablic.vrijednostTable() == vrijednost and len(potez['skupljeno']) <= len(skupljeno)):
                     break
@@ -582,7 +609,7 @@ class MinimaxIgrac (Tablic.Igrac):
             raise RuntimeError('Minimax algoritam nije pronasao nijedan moguci potez.')
 
         # Odigraj najpovoljniji potez.
-        return (PohlepniIgrac.slucajniEkvivalentni(ruka, grana[0]['karta']), grana[0]['skupljeno'])
+        return (PohlepniIgrac.slucajniEkvivalentni(ruka, grana[0]['karta'], self.dohvatiGenerator()), grana[0]['skupljeno'])
 
     def dohvatiMaxDubinu (self):
         """
@@ -638,7 +665,7 @@ class MinimaxIgrac (Tablic.Igrac):
 
         """
 
-        return copy.deepcopy(self.__sigurnoNema)
+        return None if self.__sigurnoNema is None else self.__sigurnoNema.uSkup()
 
     def dohvatiVjerojatnoNema (self, i = None):
         """
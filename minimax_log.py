@@ -25,6 +25,10 @@ class MinimaxLog (Tablic.Log):
 
         Tablic.Log.__init__(self, log)
 
+    @classmethod
+    def prihvacaSnimke (cls):
+        return True
+
     def novaPartija (self, n, igraci):
         pass
 
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+"""
+Skripta za mjerenje brzine funkcija za racunanje poteza (mikro-mjerenja).
+
+Skripta se pokrece s opcionalnim argumentima
+    -o datoteka --  rezultati mjerenja spremaju se u JSON datoteku datoteka,
+    -u datoteka --  rezultati mjerenja usporeduju se s rezultatima spremljenim
+                    u JSON datoteci datoteka (npr. s rezultatima prethodne
+                    verzije koda) i oznacavaju se mjerenja koja su sporija za
+                    vise od prag (v. nize),
+    -t sekundi  --  najmanje trajanje mjerenja jedne funkcije na jednom
+                    scenariju (zadano je varijablom T, v. nize),
+    -p prag     --  relativno usporenje iznad kojeg se mjerenje oznacava kao
+                    regresija (zadano je varijablom prag, v. nize).
+Ako je neko mjerenje sporije od usporedivanog, skripta zavrsava s izlaznim
+kodom 1.
+
+Predmemorije rezultata (v. klasu Predmemorija) za vrijeme mjerenja su
+iskljucene (mjeri se brzina samog racunanja).
+
+"""
+
+import json
+import platform
+import random
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from karta import Karta
+from skupovi import partitivniSkup, unijeDisjunktnih, maksimalneUnijeDisjunktnih, unijeDisjunktnihVektora
+from engine import Tablic
+from pohlepni_igrac import PohlepniIgrac
+from minimax_igrac import MinimaxIgrac
+
+# Sjeme generatora pseudoslucajnih brojeva (scenariji su ponovljivi).
+sjeme = 2017
+
+# Broj primjera (stolova i ruku) po scenariju.  Na nepovoljnim stolovima
+# racunanje je znatno sporije pa se koristi manje primjera.
+N = 20
+N_patoloski = 5
+
+# Najmanje trajanje (u sekundama) mjerenja jedne funkcije na jednom scenariju.
+T = 1.0
+
+# Relativno usporenje (omjer medijana trajanja poziva) iznad kojeg se
+# mjerenje oznacava kao regresija (vrlo kratka mjerenja podlozna su sumu od
+# nekoliko desetaka posto).
+prag = 0.20
+
+# Verzija formata JSON datoteke rezultata.
+verzija = 1
+
+def slucajniPrimjer (generator, n, spil = None):
+    """
+    Dohvati slucajni primjer (stol od n karata i ruku od
+    Tablic.inicijalniBrojKarata_ruka() karata).
+
+    Karte stola biraju se iz liste spil (ako je None, iz cijelog spila), a
+    karte ruke iz preostalih karata.
+
+    """
+
+    if spil is None:
+        spil = sorted(Karta.noviSpil())
+
+    stol = set(generator.sample(spil, n))
+    ruka = set(generator.sample(sorted(Karta.noviSpil() - stol), Tablic.inicijalniBrojKarata_ruka()))
+
+    return (ruka, stol)
+
+def scenarijPrazni (generator):
+    """
+    Dohvati primjere s praznim stolom.
+
+    """
+
+    return [slucajniPrimjer(generator, 0) for i in range(N)]
+
+def scenarijTipicni (generator):
+    """
+    Dohvati primjere s tipicnim stolom od 4 do 6 karata.
+
+    """
+
+    return [slucajniPrimjer(generator, generator.randint(4, 6)) for i in range(N)]
+
+def scenarijPatoloski (generator):
+    """
+    Dohvati primjere s "nepovoljnim" stolom od 12 do 14 karata.
+
+    Nepovoljni stolovi sadrze mnogo karata znaka A i karata niskih znakova pa
+    je broj podskupova stola koji se sumiraju u neki znak velik.
+
+    """
+
+    niske = sorted(x for x in Karta.noviSpil() if x.znak in {Karta.Znak.A, Karta.Znak.BR2, Karta.Znak.BR3, Karta.Znak.BR4, Karta.Znak.BR5})
+
+    return [slucajniPrimjer(generator, generator.randint(12, 14), niske) for i in range(N_patoloski)]
+
+# Scenariji mjerenja.  Svaki scenarij reprezentiran je parom imena i funkcije
+# koja za zadani generator pseudoslucajnih brojeva vraca listu primjera.
+scenariji = (('prazni', scenarijPrazni),
+             ('tipicni', scenarijTipicni),
+             ('patoloski', scenarijPatoloski))
+
+def pripremiUnije (ruka, stol):
+    """
+    Dohvati argumente za mjerenje funkcije unijeDisjunktnih (najvecu familiju
+    mogucih poteza nekog znaka na stolu stol).
+
+    """
+
+    potezi = Tablic.moguciPotezi(stol)
+    potezi.pop(Karta.Znak.NA, None)
+
+    return (max(potezi.values(), key = len) if potezi else set(),)
+
+def pripremiMinimax (ruka, stol):
+    """
+    Dohvati argumente za mjerenje funkcije MinimaxIgrac.odigraj (igraca koji
+    je saznao dijeljenje, ruku i stol).
+
+    """
+
+    igrac = MinimaxIgrac(0, 'Minimax', maxDubina = 1)
+    igrac.saznajBrojIgraca(2, ['Minimax', 'Suparnik'])
+    igrac.saznajNovoDijeljenje(ruka, stol)
+
+    return (igrac, ruka, stol)
+
+# Funkcije za mjerenje.  Svaka funkcija reprezentirana je rjecnikom s
+# kljucevima 'ime', 'funkcija', 'priprema', a mjeri se trajanje poziva
+#     >>> funkcija(*priprema(ruka, stol))
+# (trajanje poziva funkcije priprema se ne mjeri).
+funkcije = ({'ime' : 'partitivniSkup', 'funkcija' : partitivniSkup, 'priprema' : lambda ruka, stol : (stol,)},
+            {'ime' : 'unijeDisjunktnih', 'funkcija' : unijeDisjunktnih, 'priprema' : pripremiUnije},
+            {'ime' : 'Tablic.moguciPotezi', 'funkcija' : Tablic.moguciPotezi, 'priprema' : lambda ruka, stol : (stol,)},
+            {'ime' : 'PohlepniIgrac.izborPoteza', 'funkcija' : PohlepniIgrac.izborPoteza, 'priprema' : lambda ruka, stol : (ruka, stol)},
+            {'ime' : 'MinimaxIgrac.odigraj', 'funkcija' : lambda igrac, ruka, stol : igrac.odigraj(ruka, stol), 'priprema' : pripremiMinimax})
+
+def iskljuciPredmemorije ():
+    """
+    Iskljuci sve predmemorije rezultata.
+
+    """
+
+    for predmemorija in (Tablic.predmemorijaPoteza(),
+                         PohlepniIgrac.predmemorijaKanonskihPoteza(),
+                         unijeDisjunktnih.predmemorija,
+                         maksimalneUnijeDisjunktnih.predmemorija,
+                         unijeDisjunktnihVektora.predmemorija):
+        predmemorija.postaviVelicinu(0)
+
+def percentil (vremena, p):
+    """
+    Dohvati p-ti percentil uzlazno sortirane liste vremena.
+
+    """
+
+    return vremena[min(len(vremena) - 1, int(p * len(vremena) / 100.0))]
+
+def izmjeri (funkcija, argumenti):
+    """
+    Izmjeri trajanje poziva funkcije funkcija na listi argumenata argumenti.
+
+    Funkcija se poziva redom na svim argumentima dok ukupno trajanje poziva ne
+    prijede T sekundi (ali barem jednom na svakom argumentu).  Povratna
+    vrijednost je objekt klase dict s kljucevima i vrijednostima
+        --  'poziva' : broj poziva funkcije,
+        --  'ops' : prosjecni broj poziva u sekundi,
+        --  'p50' : medijan trajanja poziva (u sekundama),
+        --  'p99' : 99. percentil trajanja poziva (u sekundama),
+        --  'memorija' : najveca kolicina alocirane memorije (u bajtovima) za
+            vrijeme jednog prolaska kroz sve argumente (None ako modul
+            tracemalloc nije dostupan).
+
+    """
+
+    sat = timeit.default_timer
+
+    # Zagrij funkciju.
+    funkcija(*argumenti[0])
+
+    # Izmjeri trajanja poziva.
+    vremena = list()
+    ukupno = 0.0
+    while ukupno < T or len(vremena) < len(argumenti):
+        for x in argumenti:
+            t0 = sat()
+            funkcija(*x)
+            t1 = sat()
+
+            vremena.append(t1 - t0)
+            ukupno += t1 - t0
+
+    vremena.sort()
+
+    # Izmjeri najvecu kolicinu alocirane memorije (odvojeno jer pracenje
+    # alokacija usporava izvrsavanje).
+    memorija = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        for x in argumenti:
+            funkcija(*x)
+        memorija = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {'poziva' : len(vremena),
+            'ops' : len(vremena) / ukupno if ukupno else float('inf'),
+            'p50' : percentil(vremena, 50),
+            'p99' : percentil(vremena, 99),
+            'memorija' : memorija}
+
+def usporedi (rezultati, osnova):
+    """
+    Usporedi rezultate mjerenja rezultati s rezultatima osnova.
+
+    Za svako mjerenje prisutno u oba rezultata ispisuje se omjer medijana
+    trajanja poziva (medijan je manje osjetljiv na sum od prosjeka).
+    Povratna vrijednost je lista imena mjerenja koja su sporija za vise od
+    prag.
+
+    """
+
+    regresije = list()
+
+    print("\n{0:<40s}{1:>14s}{2:>14s}{3:>10s}".format('Mjerenje', 'Osnova [ms]', 'Sada [ms]', 'Omjer'))
+    for ime in sorted(rezultati):
+        if ime not in osnova:
+            continue
+
+        omjer = osnova[ime]['p50'] / rezultati[ime]['p50'] if rezultati[ime]['p50'] else float('inf')
+        oznaka = ''
+        if omjer < 1.0 - prag:
+            regresije.append(ime)
+            oznaka = '  REGRESIJA'
+
+        print("{0:<40s}{1:14.4f}{2:14.4f}{3:9.2f}x{4:s}".format(ime, 1000.0 * osnova[ime]['p50'], 1000.0 * rezultati[ime]['p50'], omjer, oznaka))
+
+    return regresije
+
+# Procitaj argumente.
+izlaz = None
+ulaz = None
+argumenti = sys.argv[1:]
+while argumenti:
+    if len(argumenti) < 2:
+        raise RuntimeError("Argument `{0:s}' zahtijeva vrijednost.".format(argumenti[0]))
+
+    if argumenti[0] == '-o':
+        izlaz = argumenti[1]
+    elif argumenti[0] == '-u':
+        ulaz = argumenti[1]
+    elif argumenti[0] == '-t':
+        T = float(argumenti[1])
+    elif argumenti[0] == '-p':
+        prag = float(argumenti[1])
+    else:
+        raise RuntimeError("Dodatni argument `{0:s}' nije prepoznat.".format(argumenti[0]))
+
+    argumenti = argumenti[2:]
+
+# Iskljuci predmemorije (mjeri se brzina samog racunanja).
+iskljuciPredmemorije()
+
+# Izmjeri sve funkcije na svim scenarijima.
+rezultati = dict()
+print("{0:<40s}{1:>12s}{2:>12s}{3:>12s}{4:>12s}".format('Mjerenje', 'op/s', 'p50 [ms]', 'p99 [ms]', 'Mem. [KiB]'))
+for j, (ime, scenarij) in enumerate(scenariji):
+    primjeri = scenarij(random.Random(sjeme + j))
+    for funkcija in funkcije:
+        rezultat = izmjeri(funkcija['funkcija'], [funkcija['priprema'](ruka, stol) for ruka, stol in primjeri])
+        rezultati.update({'{0:s}/{1:s}'.format(funkcija['ime'], ime) : rezultat})
+
+        print("{0:<40s}{1:12.1f}{2:12.4f}{3:12.4f}{4:>12s}".format('{0:s}/{1:s}'.format(funkcija['ime'], ime),
+                                                                    rezultat['ops'],
+                                                                    1000.0 * rezultat['p50'],
+                                                                    1000.0 * rezultat['p99'],
+                                                                    '{0:.1f}'.format(rezultat['memorija'] / 1024.0) if rezultat['memorija'] is not None else '-'))
+        sys.stdout.flush()
+
+# Spremi rezultate.
+if izlaz is not None:
+    with open(izlaz, 'w') as datoteka:
+        json.dump({'verzija' : verzija,
+                   'python' : platform.python_version(),
+                   'sjeme' : sjeme,
+                   'rezultati' : rezultati},
+                  datoteka, indent = 2, sort_keys = True)
+
+# Usporedi rezultate sa spremljenim rezultatima.
+if ulaz is not None:
+    with open(ulaz, 'r') as datoteka:
+        osnova = json.load(datoteka)
+
+    if osnova.get('verzija') != verzija:
+        raise RuntimeError("Datoteka `{0:s}' nije u podrzanom formatu.".format(ulaz))
+
+    if usporedi(rezultati, osnova['rezultati']):
+        sys.exit(1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+"""
+Skripta za mjerenje broja odigranih partija u sekundi sa i bez kopiranja
+stanja igre (v. argument bezKopiranja funkcije Tablic.__init__) te pri
+simulaciji bez zapisnika (v. funkciju Tablic.simuliraj).
+
+Skripta se pokrece s opcionalnim argumentima
+    -n partija  --  broj partija po mjerenju (zadano je varijablom N, v.
+                    nize),
+    -r ponavljanja  --  broj ponavljanja mjerenja (zadano je varijablom R,
+                        v. nize),
+    -s sjeme    --  sjeme generatora pseudoslucajnih brojeva (zadano je
+                    varijablom sjeme, v. nize).
+Mjerenja sa i bez kopiranja izmjenjuju se, a za svaki nacin uzima se najbolje
+od R ponavljanja (najmanje podlozno sumu).  Svaka konfiguracija igra se s
+istim sjemenom u oba nacina pa se provjerava i da su rezultati partija
+jednaki.  Simulacija se mjeri samo za konfiguracije bez zapisnika.
+
+"""
+
+import random
+import sys
+import timeit
+
+from engine import Tablic
+from pohlepni_igrac import PohlepniIgrac
+from pohlepni_log import PohlepniLog
+from minimax_log import MinimaxLog
+
+# Sjeme generatora pseudoslucajnih brojeva (mjerenja su ponovljiva).
+sjeme = 2017
+
+# Broj partija po mjerenju.
+N = 200
+
+# Broj ponavljanja mjerenja.
+R = 3
+
+# Konfiguracije mjerenja.  Svaka konfiguracija reprezentirana je rjecnikom s
+# kljucevima 'ime', 'igraci' (tuple klasa igraca) i 'logovi' (funkcija koja
+# vraca tuple novih zapisnika za jednu partiju).
+konfiguracije = ({'ime' : 'RandomIgrac x 2', 'igraci' : (Tablic.RandomIgrac, Tablic.RandomIgrac), 'logovi' : lambda : tuple()},
+                 {'ime' : 'RandomIgrac x 4', 'igraci' : (Tablic.RandomIgrac,) * 4, 'logovi' : lambda : tuple()},
+                 {'ime' : 'PohlepniIgrac x 2', 'igraci' : (PohlepniIgrac, PohlepniIgrac), 'logovi' : lambda : tuple()},
+                 {'ime' : 'RandomIgrac x 2 + logovi', 'igraci' : (Tablic.RandomIgrac, Tablic.RandomIgrac), 'logovi' : lambda : (PohlepniLog(list()), MinimaxLog(list()), Tablic.PrazniLog(list()))})
+
+def odigraj (konfiguracija, bezKopiranja):
+    """
+    Odigraj N partija konfiguracije konfiguracija.
+
+    Povratna vrijednost je tuple (trajanje, rezultati), gdje je trajanje
+    ukupno trajanje partija (u sekundama), a rezultati lista konacnih
+    rezultata partija (v. funkciju Tablic.Log.konacniRezultat).
+
+    """
+
+    sat = timeit.default_timer
+
+    random.seed(sjeme)
+
+    rezultati = list()
+    trajanje = 0.0
+    for i in range(N):
+        t0 = sat()
+        partija = Tablic(bezKopiranja = bezKopiranja)
+        for klasa in konfiguracija['igraci']:
+            partija.dodajIgraca(klasa)
+        partija.igraj(*konfiguracija['logovi']())
+        t1 = sat()
+
+        trajanje += t1 - t0
+        rezultati.append(Tablic.Log.konacniRezultat(partija.dohvatiRezultat()))
+
+    return (trajanje, rezultati)
+
+def simuliraj (konfiguracija):
+    """
+    Simuliraj N partija konfiguracije konfiguracija funkcijom
+    Tablic.simuliraj.
+
+    Povratna vrijednost je tuple (trajanje, rezultati) kao kod funkcije
+    odigraj.
+
+    """
+
+    sat = timeit.default_timer
+
+    t0 = sat()
+    rezultati = Tablic.simuliraj(konfiguracija['igraci'], N, sjeme)
+    t1 = sat()
+
+    return (t1 - t0, [[int(bodovi) for bodovi in rezultat] for rezultat in rezultati])
+
+# Procitaj argumente.
+argumenti = sys.argv[1:]
+while argumenti:
+    if len(argumenti) < 2:
+        raise RuntimeError("Argument `{0:s}' zahtijeva vrijednost.".format(argumenti[0]))
+
+    if argumenti[0] == '-n':
+        N = int(argumenti[1])
+    elif argumenti[0] == '-r':
+        R = int(argumenti[1])
+    elif argumenti[0] == '-s':
+        sjeme = int(argumenti[1])
+    else:
+        raise RuntimeError("Dodatni argument `{0:s}' nije prepoznat.".format(argumenti[0]))
+
+    argumenti = argumenti[2:]
+
+# Izmjeri sve konfiguracije u oba nacina.
+print("{0:<32s}{1:>16s}{2:>16s}{3:>10s}{4:>20s}{5:>10s}".format('Konfiguracija', 'Kopije [p/s]', 'Snimke [p/s]', 'Omjer', 'Simulacija [p/s]', 'Omjer'))
+for konfiguracija in konfiguracije:
+    # Zagrij predmemorije (da ne utjecu na prvo mjerenje).
+    odigraj(konfiguracija, False)
+
+    t_kopije = float('inf')
+    t_snimke = float('inf')
+    t_simulacija = float('inf')
+    simulacija = not konfiguracija['logovi']()
+    for i in range(R):
+        t, rezultati_kopije = odigraj(konfiguracija, False)
+        t_kopije = min(t_kopije, t)
+
+        t, rezultati_snimke = odigraj(konfiguracija, True)
+        t_snimke = min(t_snimke, t)
+
+        if rezultati_kopije != rezultati_snimke:
+            raise RuntimeError("Rezultati konfiguracije `{0:s}' razlikuju se sa i bez kopiranja.".format(konfiguracija['ime']))
+
+        if simulacija:
+            t, rezultati_simulacije = simuliraj(konfiguracija)
+            t_simulacija = min(t_simulacija, t)
+
+            if rezultati_simulacije != rezultati_kopije:
+                raise RuntimeError("Rezultati konfiguracije `{0:s}' razlikuju se pri simulaciji.".format(konfiguracija['ime']))
+
+    if simulacija:
+        print("{0:<32s}{1:16.1f}{2:16.1f}{3:9.2f}x{4:20.1f}{5:9.2f}x".format(konfiguracija['ime'], N / t_kopije, N / t_snimke, t_kopije / t_snimke, N / t_simulacija, t_kopije / t_simulacija))
+    else:
+        print("{0:<32s}{1:16.1f}{2:16.1f}{3:9.2f}x{4:>20s}{5:>10s}".format(konfiguracija['ime'], N / t_kopije, N / t_snimke, t_kopije / t_snimke, '-', '-'))
+    sys.stdout.flush()
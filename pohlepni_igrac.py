@@ -5,13 +5,15 @@ Implementacija klase igraca igre tablic koji igra pohlepnim algoritmom.
 
 """
 
-import copy
+import itertools
 import random
+import six
 
-from skupovi import partitivniSkup, unijeDisjunktnih
+from skupovi import partitivniSkup, unijeDisjunktnih, maksimalneUnijeDisjunktnih, unijeDisjunktnihVektora, maksimalneUnijeDisjunktnihVektora
 from karta import Karta
 from engine import Tablic
 from pohlepni_log import PohlepniLog
+from predmemorija import Predmemorija
 
 class PohlepniIgrac (Tablic.Igrac):
     """
@@ -19,21 +21,34 @@ class PohlepniIgrac (Tablic.Igrac):
 
     """
 
+    # Znakovi karata po indeksima za zapisnik.
+    __znakovi = tuple(x if isinstance(x, Karta.Znak) else x.znak for x in (PohlepniLog.prevediIndeks(i) for i in range(PohlepniLog.dohvatiBrojIndeksa())))
+
+    # Predmemorija funkcije PohlepniIgrac.moguciPoteziKanonski.
+    __predmemorijaKanonskihPoteza = Predmemorija()
+
+    # Karte posebnih bodovnih vrijednosti (kljucevi u rjecnicima poteza).
+    __karo10 = Karta.zamrzni(Karta.izBojeZnaka(Karta.Boja.KARO, Karta.Znak.BR10))
+    __tref2 = Karta.zamrzni(Karta.izBojeZnaka(Karta.Boja.TREF, Karta.Znak.BR2))
+
     @classmethod
-    def slucajniEkvivalentni (cls, ruka, karta):
+    def slucajniEkvivalentni (cls, ruka, karta, generator = random):
         """
         Slucajnim odabirom odaberi kartu u ruci ekvivalentnu zadanoj karti.
 
+        Argument generator je objekt s metodom choice (na primjer generator
+        igraca, v. funkciju Tablic.Igrac.dohvatiGenerator).
+
         """
 
         # Pronadi ekvivalentne karte karti karta u ruci.
         kandidati = [x for x in ruka if PohlepniLog.prevediKartu(x) == PohlepniLog.prevediKartu(karta)]
 
         # Vrati neku slucajno odabranu kartu ekvivalentnu zadanoj karti.
-        return random.choice(kandidati) if kandidati else karta
+        return generator.choice(kandidati) if kandidati else karta
 
     @classmethod
-    def izborPoteza (cls, ruka, stol):
+    def izborPoteza (cls, ruka, stol, samoMaksimalni = False):
         """
         Izracunaj sve moguce poteze i sortiraj ih po korisnosti.
 
@@ -69,23 +84,14 @@ class PohlepniIgrac (Tablic.Igrac):
             --  potez[Karta.Znak.A],
             --  14 - int(potez['karta']).
 
-        """
+        Ako je samoMaksimalni True, za svaku kartu iz ruke u obzir se uzimaju
+        samo potezi kojima se sa stola skuplja maksimalna unija (v. funkciju
+        skupovi.maksimalneUnijeDisjunktnih).  Kako potez kojim se skuplja pravi
+        nadskup karata nekog drugog poteza istom kartom nije losiji ni u jednoj
+        vrijednosti uredaja, a skuplja strogo vise karata, prvi potez u
+        povratnoj listi jednak je kao i za samoMaksimalni = False.
 
-        def __uredaj (potez):
-            """
-            Reprezentiraj potez x kao usporedivi tuple za kljuc sortiranja.
-
-            """
-
-            return (potez['tabla'],
-                    potez['vrijednost'],
-                    len(potez['skupljeno']),
-                    potez[Karta(Karta.Boja.KARO, Karta.Znak.BR10)],
-                    potez[Karta(Karta.Boja.TREF, Karta.Znak.BR2)],
-                    potez[Karta.Znak.A],
-                    14 - int(potez['karta']),
-                    potez['karta'],
-                    tuple(sorted(list(potez['skupljeno']), reverse = True)))
+        """
 
         # Dohvati sve moguce sume karata sa stola.
         M = Tablic.moguciPotezi(stol)
@@ -94,35 +100,254 @@ class PohlepniIgrac (Tablic.Igrac):
         potezi = list()
         for karta in ruka:
             # Izracunaj i evaluiraje sve moguce poteza s igranjem karte karta.
-            zaSkupiti = unijeDisjunktnih(M[karta.znak]) if karta.znak in M else {frozenset()}
+            zaSkupiti = (maksimalneUnijeDisjunktnih if samoMaksimalni else unijeDisjunktnih)(M[karta.znak]) if karta.znak in M else {frozenset()}
             for skupljeno in zaSkupiti:
-                skupljeno = set(skupljeno)
-                potez = {'karta' : karta, 'skupljeno' : copy.deepcopy(skupljeno)}
-                if skupljeno:
-                    potez.update({'tabla' : skupljeno == stol})
-                    skupljeno |= {karta}
-                    potez.update({'vrijednost' : Tablic.vrijednostKarata(skupljeno),
-                                  Karta(Karta.Boja.KARO, Karta.Znak.BR10) : int(any(x.boja == Karta.Boja.KARO and x.znak == Karta.Znak.BR10 for x in skupljeno)),
-                                  Karta(Karta.Boja.TREF, Karta.Znak.BR2) : int(any(x.boja == Karta.Boja.TREF and x.znak == Karta.Znak.BR2 for x in skupljeno)),
-                                  Karta.Znak.A : sum(int(x.znak == Karta.Znak.A) for x in skupljeno)})
-                else:
-                    potez.update({'tabla' : False,
-                                  'vrijednost' : -Tablic.vrijednostKarata(karta),
-                                  Karta(Karta.Boja.KARO, Karta.Znak.BR10) : -1 if (karta.boja == Karta.Boja.KARO and karta.znak == Karta.Znak.BR10) else 0,
-                                  Karta(Karta.Boja.TREF, Karta.Znak.BR2) : -1 if (karta.boja == Karta.Boja.TREF and karta.znak == Karta.Znak.BR2) else 0,
-                                  Karta.Znak.A : -1 if karta.znak == Karta.Znak.A else 0})
-                potezi.append(potez)
+                potezi.append(PohlepniIgrac.__ocijeniPotez(karta, set(skupljeno), stol))
+
+        # Vrati poteze sortirane po "korisnosti".
+        return sorted(potezi, key = PohlepniIgrac.__uredaj, reverse = True)
+
+    @classmethod
+    def moguciPoteziKanonski (cls, v):
+        """
+        Pronadi sve moguce sume karata zadanih vektorom v.
+
+        Vektor v mora biti povratna vrijednost funkcije PohlepniLog.prevediSkup
+        (na indeksu i je broj karata s indeksom i za zapisnik).  Za zbrajanje
+        karata bitni su samo njihovi znakovi, a karte s istim indeksom za
+        zapisnik imaju isti znak, stoga se sume racunaju nad vektorom v umjesto
+        nad konkretnim kartama: cetiri karte znaka 7 na stolu, na primjer,
+        daju jedan odabir (vektor s vrijednosti 4 na indeksu karata 7) umjesto
+        2^4 razlicitih podskupova.
+
+        Povratna vrijednost je dict ciji su kljucevi znakovi karata (objekti
+        klase Karta.Znak), a vrijednosti objekti klase set elemenata vektora
+        (objekata klase tuple) manjih ili jednakih v (po komponentama).  Vektor
+        u pridruzen je znaku ako i samo ako se svaki podskup karata s u[i]
+        karata indeksa i za svaki i sumira (medu ostalim) u taj znak.  Sume se
+        racunaju dinamickim programiranjem kao u funkciji Tablic.moguciPotezi.
+
+        Izracunati rjecnici pamte se u predmemoriji
+        PohlepniIgrac.predmemorijaKanonskihPoteza() s kljucem v.  Ako je
+        postavljena tablica poteza (v. funkciju Tablic.postaviTablicuPoteza),
+        rjecnik se pri promasaju predmemorije najprije trazi u tablici.
+
+        """
+
+        # Dohvati rjecnik poteza iz predmemorije i vrati njegovu kopiju.
+        v = tuple(v)
+        M = PohlepniIgrac.__predmemorijaKanonskihPoteza.dohvati(v, PohlepniIgrac.__izracunajMogucePotezeKanonski, v)
+
+        return {x : set(P) for x, P in six.iteritems(M)}
+
+    @classmethod
+    def predmemorijaKanonskihPoteza (cls):
+        """
+        Dohvati predmemoriju (objekt klase Predmemorija) funkcije
+        PohlepniIgrac.moguciPoteziKanonski.
+
+        """
+
+        return PohlepniIgrac.__predmemorijaKanonskihPoteza
+
+    @classmethod
+    def izborPotezaKanonski (cls, ruka, stol, samoMaksimalni = False):
+        """
+        Izracunaj sve kanonske moguce poteze i sortiraj ih po korisnosti.
+
+        Funkcija je analogon funkcije PohlepniIgrac.izborPoteza, ali se potezi
+        racunaju nad vektorima brojeva karata po indeksima za zapisnik (v.
+        funkcije PohlepniLog.prevediSkup, PohlepniIgrac.moguciPoteziKanonski,
+        skupovi.unijeDisjunktnihVektora), a tek se odabrani vektori
+        "napuhuju" u konkretne karte.  Stoga se od svih poteza koji se
+        razlikuju samo u bojama karata istih indeksa za zapisnik (i koji su
+        stoga jednako vrijedni) u povratnoj listi nalazi samo jedan
+        predstavnik: igra se najveca karta iz ruke s danim indeksom, a sa
+        stola se skupljaju najvece karte svakog indeksa.  Poredak predstavnika
+        u povratnoj listi jednak je poretku najboljih poteza svake klase
+        ekvivalentnih poteza u povratnoj listi funkcije
+        PohlepniIgrac.izborPoteza, pa je prvi potez u povratnoj listi jednak
+        kao i u povratnoj listi te funkcije.
+
+        """
 
         # Vrati poteze sortirane po "korisnosti".
-        return sorted(potezi, key = __uredaj, reverse = True)
+        return sorted(PohlepniIgrac.__kanonskiPotezi(ruka, stol, samoMaksimalni), key = PohlepniIgrac.__uredaj, reverse = True)
+
+    @classmethod
+    def najboljiPotezKanonski (cls, ruka, stol, samoMaksimalni = False):
+        """
+        Dohvati prvi potez iz povratne liste funkcije
+        PohlepniIgrac.izborPotezaKanonski (ili None ako je lista prazna).
+
+        Potezi se ne sortiraju, nego se trazi prvi najkorisniji potez (kako je
+        sortiranje stabilno, to je upravo prvi potez sortirane liste).
+
+        """
 
-    def __init__ (self, i, ime = None):
+        potezi = PohlepniIgrac.__kanonskiPotezi(ruka, stol, samoMaksimalni)
+
+        return max(potezi, key = PohlepniIgrac.__uredaj) if potezi else None
+
+    @classmethod
+    def __kanonskiPotezi (cls, ruka, stol, samoMaksimalni):
+        """
+        Izracunaj (nesortiranu) listu svih kanonskih mogucih poteza (v.
+        funkciju PohlepniIgrac.izborPotezaKanonski).
+
+        """
+
+        # Prevedi stol u vektor i dohvati sve moguce sume karata sa stola.
+        v = PohlepniLog.prevediSkup(stol)
+        M = PohlepniIgrac.moguciPoteziKanonski(v)
+
+        # Grupiraj karte na stolu po indeksima (silazno sortirane).
+        naStolu = [list() for i in range(PohlepniLog.dohvatiBrojIndeksa())]
+        for karta in sorted(stol, reverse = True):
+            naStolu[PohlepniLog.prevediKartu(karta)].append(karta)
+
+        # Odaberi predstavnike karata iz ruke (najvece karte svakog indeksa).
+        predstavnici = dict()
+        for karta in sorted(ruka, reverse = True):
+            if not PohlepniLog.prevediKartu(karta) in predstavnici:
+                predstavnici.update({PohlepniLog.prevediKartu(karta) : karta})
+
+        # Evaluiraj sve kanonske poteze.
+        potezi = list()
+        for karta in six.itervalues(predstavnici):
+            # Izracunaj i evaluiraj sve kanonske poteze s igranjem karte karta
+            # "napuhavanjem" vektora u konkretne karte.
+            zaSkupiti = (maksimalneUnijeDisjunktnihVektora if samoMaksimalni else unijeDisjunktnihVektora)(M[karta.znak], v) if karta.znak in M else {tuple(0 for x in v)}
+            for u in zaSkupiti:
+                skupljeno = set(itertools.chain(*(naStolu[i][:u[i]] for i in range(len(u)))))
+                potezi.append(PohlepniIgrac.__ocijeniPotez(karta, skupljeno, stol))
+
+        return potezi
+
+    @classmethod
+    def __izracunajMogucePotezeKanonski (cls, v):
+        """
+        Izracunaj povratnu vrijednost funkcije
+        PohlepniIgrac.moguciPoteziKanonski.
+
+        """
+
+        # Pokusaj dohvatiti rjecnik poteza iz tablice poteza.
+        if Tablic.dohvatiTablicuPoteza() is not None:
+            M = Tablic.dohvatiTablicuPoteza().potezi(v)
+            if M is not None:
+                return M
+
+        # Izracunaj sve odabire brojeva karata po indeksima cija najmanja suma
+        # ne prelazi 14.
+        stanja = {0 : [tuple()]}
+        for i in range(len(v)):
+            if not v[i]:
+                continue
+            znak = PohlepniIgrac.__znakovi[i]
+            nova = {s : list(I) for s, I in six.iteritems(stanja)}
+            for s, I in six.iteritems(stanja):
+                for k in range(1, v[i] + 1):
+                    t = s + k * znak.value
+                    if t > 14:
+                        break
+                    if t in nova:
+                        nova[t] += [izbor + ((i, k),) for izbor in I]
+                    else:
+                        nova.update({t : [izbor + ((i, k),) for izbor in I]})
+            stanja = nova
+
+        # Inicijaliziraj rjecnik poteza na prazni rjecnik.
+        M = dict()
+
+        # Dohvati indeks karata znaka A za zapisnik.
+        a = PohlepniLog.prevediKartu(Karta(Karta.Znak.A))
+
+        # Izracunaj rjecnik poteza.
+        for s, I in six.iteritems(stanja):
+            for izbor in I:
+                if not izbor:
+                    continue
+
+                # Prevedi izbor u vektor.
+                u = [0 for x in v]
+                for i, k in izbor:
+                    u[i] = k
+                u = tuple(u)
+
+                # Izracunaj sve moguce sume izbora.
+                sume = {s}
+                if s + 10 <= 14 and u[a]:
+                    sume |= {s + 10}
+
+                for x in sume:
+                    x = Karta.Znak(x if x != 11 else 1)
+                    if x in M:
+                        M[x] |= {u}
+                    else:
+                        M.update({x : {u}})
+
+        # Vrati izracunati rjecnik poteza.
+        return M
+
+    @classmethod
+    def __ocijeniPotez (cls, karta, skupljeno, stol):
+        """
+        Evaluiraj potez igranja karte karta i skupljanja skupa skupljeno sa
+        stola stol (rjecnik poteza opisan je u funkciji
+        PohlepniIgrac.izborPoteza).
+
+        """
+
+        potez = {'karta' : karta, 'skupljeno' : set(skupljeno)}
+        if skupljeno:
+            potez.update({'tabla' : skupljeno == stol})
+            skupljeno |= {karta}
+            potez.update({'vrijednost' : Tablic.vrijednost(skupljeno),
+                          PohlepniIgrac.__karo10 : int(PohlepniIgrac.__karo10 in skupljeno),
+                          PohlepniIgrac.__tref2 : int(PohlepniIgrac.__tref2 in skupljeno),
+                          Karta.Znak.A : sum(int(x.znak == Karta.Znak.A) for x in skupljeno)})
+        else:
+            potez.update({'tabla' : False,
+                          'vrijednost' : -Tablic.vrijednostKarte(karta),
+                          PohlepniIgrac.__karo10 : -int(karta == PohlepniIgrac.__karo10),
+                          PohlepniIgrac.__tref2 : -int(karta == PohlepniIgrac.__tref2),
+                          Karta.Znak.A : -1 if karta.znak == Karta.Znak.A else 0})
+
+        return potez
+
+    @classmethod
+    def __uredaj (cls, potez):
+        """
+        Reprezentiraj potez kao usporedivi tuple za kljuc sortiranja.
+
+        """
+
+        return (potez['tabla'],
+                potez['vrijednost'],
+                len(potez['skupljeno']),
+                potez[PohlepniIgrac.__karo10],
+                potez[PohlepniIgrac.__tref2],
+                potez[Karta.Znak.A],
+                14 - int(potez['karta']),
+                potez['karta'],
+                tuple(sorted(list(potez['skupljeno']), reverse = True)))
+
+    def __init__ (self, i, ime = None, sjeme = None, generator = None):
         """
         Inicijaliziraj objekt klase PohlepniIgrac.
 
         """
 
-        Tablic.Igrac.__init__(self, i, ime)
+        Tablic.Igrac.__init__(self, i, ime, sjeme, generator)
+
+    @classmethod
+    def prihvacaSnimke (cls):
+        return True
+
+    @classmethod
+    def igraLegalno (cls):
+        return True
 
     def hocuRazlog (self):
         return False
@@ -151,11 +376,11 @@ class PohlepniIgrac (Tablic.Igrac):
 
         """
 
-        # Dohvati poteze sortirane po korisnosti.
-        potezi = PohlepniIgrac.izborPoteza(ruka, stol)
+        # Dohvati najkorisniji potez.
+        potez = PohlepniIgrac.najboljiPotezKanonski(ruka, stol, True)
 
-        if not potezi:
+        if potez is None:
             raise RuntimeError('Pohlepni algoritam nije pronasao nijedan moguci potez.')
 
         # Odigraj trenutno najpovoljniji potez.
-        return (PohlepniIgrac.slucajniEkvivalentni(ruka, potezi[0]['karta']), potezi[0]['skupljeno'])
+        return (PohlepniIgrac.slucajniEkvivalentni(ruka, potez['karta'], self.dohvatiGenerator()), potez['skupljeno'])
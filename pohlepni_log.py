@@ -26,6 +26,46 @@ class PohlepniLog (Tablic.Log):
 
     """
 
+    # Indeksi karata za zapisnik po kljucevima karata (v. funkciju
+    # Karta.kljuc; racunaju se pri prvom koristenju).
+    __indeksi = None
+
+    @classmethod
+    def __pripremiIndekse (cls):
+        """
+        Izracunaj indekse za zapisnik svih karata (svih kombinacija boja i
+        znakova) po kljucevima karata.
+
+        """
+
+        if PohlepniLog.__indeksi is not None:
+            return
+
+        karte = [Karta.izBojeZnaka(boja, znak) for boja in Karta.Boja for znak in Karta.Znak]
+
+        indeksi = [None for i in range(max(karta.kljuc for karta in karte) + 1)]
+        for karta in karte:
+            indeksi[karta.kljuc] = PohlepniLog.__izracunajIndeks(karta)
+
+        PohlepniLog.__indeksi = tuple(indeksi)
+
+    @classmethod
+    def __izracunajIndeks (cls, karta):
+        """
+        Izracunaj indeks za zapisnik karte karta (objekta klase Karta).
+
+        """
+
+        # Tretiraj specijalne slucajeve da je karta neka od karata tref 2 i karo
+        # 10.
+        if karta.boja == Karta.Boja.TREF and karta.znak == Karta.Znak.BR2:
+            return 13
+        elif karta.boja == Karta.Boja.KARO and karta.znak == Karta.Znak.BR10:
+            return 14
+
+        # Vrati indeks karte.
+        return karta.znak.value - (1 if karta.znak < 11 else 2)
+
     @classmethod
     def dohvatiBrojIndeksa (cls):
         """
@@ -60,6 +100,9 @@ class PohlepniLog (Tablic.Log):
             13  --  ako je karta tref 2,
             14  --  ako je karta karo 10.
 
+        Indeksi se citaju iz unaprijed izracunate tablice po kljucevima karata
+        (v. funkciju Karta.kljuc).
+
         """
 
         if not isinstance(karta, Karta):
@@ -68,15 +111,10 @@ class PohlepniLog (Tablic.Log):
             except (TypeError, ValueError):
                 raise TypeError("Vrijednost `{0:s}' nije valjana reprezentacija karte.".format(repr(karta)))
 
-        # Tretiraj specijalne slucajeve da je karta neka od karata tref 2 i karo
-        # 10.
-        if karta.boja == Karta.Boja.TREF and karta.znak == Karta.Znak.BR2:
-            return 13
-        elif karta.boja == Karta.Boja.KARO and karta.znak == Karta.Znak.BR10:
-            return 14
+        if PohlepniLog.__indeksi is None:
+            PohlepniLog.__pripremiIndekse()
 
-        # Vrati indeks karte.
-        return karta.znak.value - (1 if karta.znak < 11 else 2)
+        return PohlepniLog.__indeksi[karta.kljuc]
 
     @classmethod
     def prevediIndeks (cls, indeks):
@@ -97,13 +135,34 @@ class PohlepniLog (Tablic.Log):
         if indeks >= 0 and indeks <= 12:
             return Karta.Znak(indeks + (1 if indeks < 10 else 2))
         elif indeks == 13:
-            return Karta(Karta.Boja.TREF, Karta.Znak.BR2)
+            return Karta.izBojeZnaka(Karta.Boja.TREF, Karta.Znak.BR2)
         elif indeks == 14:
-            return Karta(Karta.Boja.KARO, Karta.Znak.BR10)
+            return Karta.izBojeZnaka(Karta.Boja.KARO, Karta.Znak.BR10)
 
         # Vrati None (ako je indeks nepostojeci).
         return None
 
+    @classmethod
+    def prevediSkup (cls, S):
+        """
+        Prevedi kolekciju karata S u vektor brojeva karata po indeksima.
+
+        Povratna vrijednost je tuple duljine PohlepniLog.dohvatiBrojIndeksa()
+        koji na indeksu i sadrzi broj karata iz S koje se pozivom funkcije
+        PohlepniLog.prevediKartu prevode u indeks i.
+
+        """
+
+        # Inicijaliziraj vektor na sve vrijednosti 0.
+        v = [0 for i in range(PohlepniLog.dohvatiBrojIndeksa())]
+
+        # Prebroji karte po indeksima.
+        for x in S:
+            v[PohlepniLog.prevediKartu(x)] += 1
+
+        # Vrati vektor.
+        return tuple(v)
+
     def __init__ (self, log = list()):
         """
         Inicijaliziraj objekt klase PohlepniLog.
@@ -112,6 +171,10 @@ class PohlepniLog (Tablic.Log):
 
         Tablic.Log.__init__(self, log)
 
+    @classmethod
+    def prihvacaSnimke (cls):
+        return True
+
     def novaPartija (self, n, igraci):
         pass
 
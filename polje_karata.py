@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase PoljeKarata za reprezentaciju kolekcija karata poljem
+kodova karata (pomocu paketa numpy).
+
+"""
+
+import numpy as np
+import six
+
+from karta import Karta
+from skup_karata import SkupKarata
+
+if six.PY3:
+    unicode = str
+    long = int
+
+class PoljeKarata (object):
+    """
+    Klasa za reprezentaciju kolekcija valjanih igracih karata poljem kodova.
+
+    Kolekcija karata (ruka, stol, spil...) reprezentirana je jednodimenzionalnim
+    objektom klase numpy.ndarray tipa numpy.uint8 ciji su elementi kodovi
+    karata (v. funkciju Karta.kod) redom kojim su karte u kolekciji.  Znakovi,
+    boje, numericke i bodovne vrijednosti karata te vektori brojeva karata po
+    indeksima kao u funkciji PohlepniLog.prevediSkup racunaju se odjednom za
+    sve karte (citanjem iz tablica po kodovima), a skupovne operacije (|, &,
+    -, ^) preko maski od 52 logicke vrijednosti (povratna vrijednost skupovne
+    operacije je polje sortiranih kodova bez ponavljanja).
+
+    Objekti klase PoljeKarata su nepromjenjivi, a polje kodova se ne kopira:
+    funkcija PoljeKarata.izKodova i slice-ovi (na primjer polje[2:]) dijele
+    polje kodova s izvornim objektom, a funkcija kodovi vraca pogled na polje
+    koji se ne moze mijenjati.  Iteriranjem po objektu klase PoljeKarata
+    dobivaju se objekti klase Karta, pa se objekti klase PoljeKarata mogu
+    zadavati svugdje gdje se ocekuje kolekcija karata.
+
+    """
+
+    __slots__ = ('__kodovi',)
+
+    # Indeksi znakova, indeksi boja, numericke vrijednosti, bodovne vrijednosti
+    # i indeksi za zapisnik karata po kodovima te znakovi i boje po indeksima
+    # (racunaju se pri prvom koristenju).
+    __indeksiZnakova = None
+    __indeksiBoja = None
+    __vrijednosti = None
+    __bodovi = None
+    __indeksiZapisnika = None
+    __znakovi = None
+    __boje = None
+
+    @classmethod
+    def __pripremi (cls):
+        """
+        Izracunaj tablice po kodovima karata ako vec nisu izracunate.
+
+        """
+
+        if PoljeKarata.__indeksiZnakova is not None:
+            return
+
+        # Tablice se racunaju postojecim funkcijama za pojedinacne karte.
+        from engine import Tablic
+        from pohlepni_log import PohlepniLog
+
+        karte = [Karta.izKoda(kod) for kod in range(52)]
+
+        PoljeKarata.__indeksiBoja = np.array([kod & 3 for kod in range(52)], dtype = np.uint8)
+        PoljeKarata.__vrijednosti = np.array([karta.znak.value for karta in karte], dtype = np.uint8)
+        PoljeKarata.__bodovi = np.array([Tablic.vrijednostKarte(karta) for karta in karte], dtype = np.uint8)
+        PoljeKarata.__indeksiZapisnika = np.array([PohlepniLog.prevediKartu(karta) for karta in karte], dtype = np.uint8)
+        PoljeKarata.__znakovi = tuple(karte[4 * z].znak for z in range(13))
+        PoljeKarata.__boje = tuple(karte[b].boja for b in range(4))
+        PoljeKarata.__indeksiZnakova = np.array([kod >> 2 for kod in range(52)], dtype = np.uint8)
+
+    @classmethod
+    def izKodova (cls, kodovi):
+        """
+        Kreiraj objekt klase PoljeKarata zadan kodovima karata kodovi.
+
+        Ako je kodovi jednodimenzionalni objekt klase numpy.ndarray tipa
+        numpy.uint8, polje se ne kopira (promjene polja kodovi vidljive su u
+        kreiranom objektu).  Ako neki kod nije cijeli broj od 0 do 51,
+        izbacuje se iznimka tipa ValueError.
+
+        """
+
+        kodovi = np.asarray(kodovi)
+        if kodovi.ndim != 1:
+            raise ValueError('Kodovi karata moraju biti zadani jednodimenzionalnim poljem.')
+        if kodovi.size and (kodovi.dtype.kind not in {'i', 'u'} or kodovi.min() < 0 or kodovi.max() >= 52):
+            raise ValueError('Kodovi karata moraju biti cijeli brojevi od 0 do 51.')
+
+        polje = object.__new__(PoljeKarata)
+        polje.__kodovi = kodovi.astype(np.uint8, copy = False)
+
+        return polje
+
+    @classmethod
+    def izMaske (cls, maska):
+        """
+        Kreiraj objekt klase PoljeKarata od karata cije su vrijednosti u
+        maski maska (polje od 52 logicke vrijednosti indeksirano kodovima
+        karata) istinite.
+
+        Kodovi karata u kreiranom objektu sortirani su uzlazno.
+
+        """
+
+        return PoljeKarata.izKodova(np.flatnonzero(maska).astype(np.uint8))
+
+    @classmethod
+    def kodoviKolekcije (cls, x):
+        """
+        Dohvati polje kodova karata u kolekciji x.
+
+        Ako je x objekt klase PoljeKarata, povratna vrijednost je njegovo polje
+        kodova (bez kopiranja).  Inace se x smatra kolekcijom karata, a ako
+        neki element kolekcije nije valjana karta, povratna vrijednost je None.
+
+        """
+
+        if isinstance(x, PoljeKarata):
+            return x.__kodovi
+
+        kodovi = list()
+        for karta in x:
+            kod = karta.kod if isinstance(karta, Karta) else None
+            if kod is None:
+                return None
+            kodovi.append(kod)
+
+        return np.array(kodovi, dtype = np.uint8)
+
+    @classmethod
+    def matricaVektora (cls, polja):
+        """
+        Dohvati matricu vektora brojeva karata po indeksima za zapisnik
+        kolekcija karata u polja.
+
+        Povratna vrijednost je objekt klase numpy.ndarray oblika (N, 15) tipa
+        numpy.uint8 ciji je i-ti redak vektor i-te kolekcije (v. funkciju
+        vektor), pa se moze zadati kao serija stolova u funkciji
+        SerijskiPotezi.moguciPotezi.
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        kodovi = [polje.__kodovi if isinstance(polje, PoljeKarata) else PoljeKarata(polje).__kodovi for polje in polja]
+
+        V = np.zeros((len(kodovi), 15), dtype = np.uint8)
+        if not kodovi:
+            return V
+
+        # Prebroji karte po indeksima odjednom za sve kolekcije.
+        redovi = np.repeat(np.arange(len(kodovi)), [x.size for x in kodovi])
+        np.add.at(V, (redovi, PoljeKarata.__indeksiZapisnika[np.concatenate(kodovi)]), 1)
+
+        return V
+
+    def __init__ (self, karte = None):
+        """
+        Inicijaliziraj objekt klase PoljeKarata.
+
+        Ako je karte None, inicijalizira se prazno polje.  Inace karte mora biti
+        objekt klase PoljeKarata (polje kodova se dijeli) ili kolekcija
+        valjanih karata (objekata klase Karta kojima su definirani i boja i
+        znak), a u suprotnom se izbacuje iznimka tipa ValueError.
+
+        """
+
+        if karte is None:
+            self.__kodovi = np.zeros(0, dtype = np.uint8)
+        else:
+            self.__kodovi = PoljeKarata.kodoviKolekcije(karte)
+            if self.__kodovi is None:
+                raise ValueError("Objekt klase `PoljeKarata' moze sadrzavati samo valjane karte.")
+
+    def __copy__ (self):
+        """
+        Dohvati copy.copy(self).
+
+        """
+
+        return self
+
+    def __deepcopy__ (self, memo = dict()):
+        """
+        Dohvati copy.deepcopy(self, memo).
+
+        Polje kodova se kopira (kopija ne dijeli polje s izvornim objektom).
+
+        """
+
+        return PoljeKarata.izKodova(self.__kodovi.copy())
+
+    def __reduce__ (self):
+        """
+        Dohvati podatke za serijalizaciju (pickle) objekta.
+
+        """
+
+        return (PoljeKarata.izKodova, (self.__kodovi,))
+
+    def kodovi (self):
+        """
+        Dohvati polje kodova karata (pogled na polje koji se ne moze mijenjati).
+
+        """
+
+        kodovi = self.__kodovi.view()
+        kodovi.flags.writeable = False
+
+        return kodovi
+
+    def indeksiZnakova (self):
+        """
+        Dohvati polje indeksa znakova karata (0 za A, 1 do 9 za brojeve od 2
+        do 10, 10, 11, 12 za J, Q, K respektivno).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return PoljeKarata.__indeksiZnakova[self.__kodovi]
+
+    def indeksiBoja (self):
+        """
+        Dohvati polje indeksa boja karata (0, 1, 2, 3 za herc, pik, karo, tref
+        respektivno).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return PoljeKarata.__indeksiBoja[self.__kodovi]
+
+    def znakovi (self):
+        """
+        Dohvati listu znakova karata (objekata klase Karta.Znak).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return [PoljeKarata.__znakovi[z] for z in PoljeKarata.__indeksiZnakova[self.__kodovi].tolist()]
+
+    def boje (self):
+        """
+        Dohvati listu boja karata (objekata klase Karta.Boja).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return [PoljeKarata.__boje[b] for b in PoljeKarata.__indeksiBoja[self.__kodovi].tolist()]
+
+    def vrijednosti (self):
+        """
+        Dohvati polje numerickih vrijednosti karata (karte znaka A imaju
+        vrijednost 1).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return PoljeKarata.__vrijednosti[self.__kodovi]
+
+    def bodovi (self):
+        """
+        Dohvati polje bodovnih vrijednosti karata (v. funkciju
+        Tablic.vrijednostKarte).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return PoljeKarata.__bodovi[self.__kodovi]
+
+    def vrijednost (self):
+        """
+        Izracunaj bodovnu vrijednost svih karata (v. funkciju
+        Tablic.vrijednost).
+
+        """
+
+        return int(self.bodovi().sum())
+
+    def indeksi (self):
+        """
+        Dohvati polje indeksa karata za zapisnik (v. funkciju
+        PohlepniLog.prevediKartu).
+
+        """
+
+        PoljeKarata.__pripremi()
+
+        return PoljeKarata.__indeksiZapisnika[self.__kodovi]
+
+    def vektor (self):
+        """
+        Dohvati vektor brojeva karata po indeksima za zapisnik.
+
+        Povratna vrijednost je objekt klase numpy.ndarray duljine 15 tipa
+        numpy.uint8 jednak (kao tuple) povratnoj vrijednosti funkcije
+        PohlepniLog.prevediSkup.
+
+        """
+
+        return np.bincount(self.indeksi(), minlength = 15).astype(np.uint8)
+
+    def maska (self):
+        """
+        Dohvati masku karata (polje od 52 logicke vrijednosti indeksirano
+        kodovima karata; vrijednost je istinita ako i samo ako je karta u
+        polju).
+
+        """
+
+        maska = np.zeros(52, dtype = np.bool_)
+        maska[self.__kodovi] = True
+
+        return maska
+
+    def sortirano (self):
+        """
+        Dohvati objekt klase PoljeKarata s uzlazno sortiranim kartama.
+
+        """
+
+        return PoljeKarata.izKodova(np.sort(self.__kodovi))
+
+    def uSkup (self):
+        """
+        Dohvati objekt klase set karata u polju.
+
+        """
+
+        return set(self)
+
+    def uSkupKarata (self):
+        """
+        Dohvati objekt klase SkupKarata karata u polju.
+
+        """
+
+        return SkupKarata.izBitova(int(np.bitwise_or.reduce(np.left_shift(np.uint64(1), self.__kodovi.astype(np.uint64)))))
+
+    def __len__ (self):
+        """
+        Dohvati broj karata u polju.
+
+        """
+
+        return int(self.__kodovi.size)
+
+    def __iter__ (self):
+        """
+        Iteriraj po kartama u polju.
+
+        """
+
+        for kod in self.__kodovi.tolist():
+            yield Karta.izKoda(kod)
+
+    def __getitem__ (self, key):
+        """
+        Dohvati kartu s indeksom key ili objekt klase PoljeKarata zadan
+        slice-om, poljem indeksa ili maskom key.
+
+        Ako je key slice, polje kodova se ne kopira.
+
+        """
+
+        if isinstance(key, (int, long, np.integer)):
+            return Karta.izKoda(int(self.__kodovi[key]))
+
+        return PoljeKarata.izKodova(self.__kodovi[key])
+
+    def __contains__ (self, karta):
+        """
+        Provjeri je li karta u polju.
+
+        """
+
+        if not isinstance(karta, Karta):
+            return False
+
+        kod = karta.kod
+
+        return kod is not None and bool((self.__kodovi == kod).any())
+
+    def __nonzero__ (self):
+        """
+        Provjeri je li polje neprazno.
+
+        """
+
+        return bool(self.__kodovi.size)
+
+    __bool__ = __nonzero__
+
+    def __hash__ (self):
+        """
+        Dohvati hash(self).
+
+        """
+
+        return hash(self.__kodovi.tobytes())
+
+    def __eq__ (self, value):
+        """
+        Usporedi (==) polja (jednaka su ako sadrze iste karte istim redom).
+
+        """
+
+        if not isinstance(value, PoljeKarata):
+            return NotImplemented
+
+        return bool(np.array_equal(self.__kodovi, value.__kodovi))
+
+    def __ne__ (self, value):
+        """
+        Usporedi (!=) polja.
+
+        """
+
+        jednako = self.__eq__(value)
+
+        return jednako if jednako is NotImplemented else not jednako
+
+    def __maskaKolekcije (self, value):
+        """
+        Dohvati masku karata kolekcije value ili None ako value nije kolekcija
+        valjanih karata.
+
+        """
+
+        kodovi = PoljeKarata.kodoviKolekcije(value)
+        if kodovi is None:
+            return None
+
+        maska = np.zeros(52, dtype = np.bool_)
+        maska[kodovi] = True
+
+        return maska
+
+    def __or__ (self, value):
+        """
+        Dohvati uniju kolekcija karata.
+
+        """
+
+        maska = self.__maskaKolekcije(value)
+        if maska is None:
+            return NotImplemented
+
+        return PoljeKarata.izMaske(self.maska() | maska)
+
+    __ror__ = __or__
+
+    def __and__ (self, value):
+        """
+        Dohvati presjek kolekcija karata.
+
+        """
+
+        maska = self.__maskaKolekcije(value)
+        if maska is None:
+            return NotImplemented
+
+        return PoljeKarata.izMaske(self.maska() & maska)
+
+    __rand__ = __and__
+
+    def __xor__ (self, value):
+        """
+        Dohvati simetricnu razliku kolekcija karata.
+
+        """
+
+        maska = self.__maskaKolekcije(value)
+        if maska is None:
+            return NotImplemented
+
+        return PoljeKarata.izMaske(self.maska() ^ maska)
+
+    __rxor__ = __xor__
+
+    def __sub__ (self, value):
+        """
+        Dohvati razliku kolekcija karata (self - value).
+
+        """
+
+        maska = self.__maskaKolekcije(value)
+        if maska is None:
+            return NotImplemented
+
+        return PoljeKarata.izMaske(self.maska() & ~maska)
+
+    def __rsub__ (self, value):
+        """
+        Dohvati razliku kolekcija karata (value - self).
+
+        """
+
+        maska = self.__maskaKolekcije(value)
+        if maska is None:
+            return NotImplemented
+
+        return PoljeKarata.izMaske(maska & ~self.maska())
+
+    def __repr__ (self):
+        """
+        Dohvati repr(self).
+
+        """
+
+        return '<{0:s}: [{1:s}]>'.format(self.__class__.__name__, ', '.join(repr(karta) for karta in self))
+
+    def __str__ (self):
+        """
+        Dohvati str(self).
+
+        """
+
+        return '{0:s}([{1:s}])'.format(self.__class__.__name__, ', '.join(str(karta) for karta in self))
+
+    def __unicode__ (self):
+        """
+        Dohvati unicode(self).
+
+        """
+
+        return unicode('{0:s}([{1:s}])').format(self.__class__.__name__, unicode(', ').join(unicode(karta) for karta in self))
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase Predmemorija za memoizaciju rezultata funkcija.
+
+"""
+
+import collections
+import six
+
+if six.PY3:
+    unicode = str
+
+class Predmemorija (object):
+    """
+    Klasa za ogranicenu predmemoriju (LRU) rezultata funkcija.
+
+    Predmemorija pamti najvise dohvatiVelicinu() rezultata, a kada je puna,
+    iz nje se izbacuje najdavnije korisceni rezultat.  Predmemorija broji
+    pogotke (rezultat je vec bio zapamcen), promasaje (rezultat se morao
+    izracunati) i izbacivanja rezultata (v. funkciju dohvatiStatistiku).
+
+    Kljucevi predmemorije moraju biti nepromjenjivi objekti koji kanonski
+    reprezentiraju argumente funkcije (jednaki argumenti moraju imati jednake
+    kljuceve).  Zapamceni rezultati se ne kopiraju, stoga pozivatelj ne smije
+    mijenjati povratnu vrijednost funkcije dohvati (ako ju treba mijenjati,
+    mora ju kopirati).
+
+    """
+
+    def __init__ (self, velicina = 4096):
+        """
+        Inicijaliziraj objekt klase Predmemorija.
+
+        Argument velicina zadaje najveci broj zapamcenih rezultata (v. funkciju
+        postaviVelicinu).
+
+        """
+
+        self.__rezultati = collections.OrderedDict()
+        self.__velicina = velicina
+
+        self.__pogoci = 0
+        self.__promasaji = 0
+        self.__izbacivanja = 0
+
+    def __copy__ (self):
+        """
+        Dohvati copy.copy(self).
+
+        Predmemorija je zajednicka za proces, stoga se ne kopira.
+
+        """
+
+        return self
+
+    def __deepcopy__ (self, memo = dict()):
+        """
+        Dohvati copy.deepcopy(self, memo).
+
+        Predmemorija je zajednicka za proces, stoga se ne kopira.
+
+        """
+
+        return self
+
+    def __len__ (self):
+        """
+        Dohvati broj zapamcenih rezultata.
+
+        """
+
+        return len(self.__rezultati)
+
+    def __contains__ (self, kljuc):
+        """
+        Provjeri je li rezultat za kljuc kljuc zapamcen.
+
+        """
+
+        return kljuc in self.__rezultati
+
+    def __repr__ (self):
+        """
+        Dohvati repr(self).
+
+        """
+
+        return '<{0:s}: {1:s}>'.format(self.__class__.__name__, repr(self.dohvatiStatistiku()))
+
+    def __str__ (self):
+        """
+        Dohvati str(self).
+
+        """
+
+        return '{0:s}({1:s})'.format(self.__class__.__name__, ', '.join('{0:s}: {1:s}'.format(kljuc, str(vrijednost)) for kljuc, vrijednost in sorted(six.iteritems(self.dohvatiStatistiku()))))
+
+    def __unicode__ (self):
+        """
+        Dohvati unicode(self).
+
+        """
+
+        return unicode(str(self))
+
+    def dohvatiVelicinu (self):
+        """
+        Dohvati najveci broj zapamcenih rezultata.
+
+        """
+
+        return self.__velicina
+
+    def postaviVelicinu (self, velicina):
+        """
+        Postavi najveci broj zapamcenih rezultata na velicina.
+
+        Ako je velicina None, broj zapamcenih rezultata nije ogranicen.  Ako je
+        velicina 0, predmemorija je iskljucena (rezultati se uvijek racunaju, a
+        pogoci i promasaji se ne broje).  Ako je trenutno zapamceno vise od
+        velicina rezultata, najdavnije korisceni rezultati se izbacuju.
+
+        """
+
+        self.__velicina = velicina
+
+        self.__izbaci()
+
+    def jeUkljucena (self):
+        """
+        Provjeri je li predmemorija ukljucena.
+
+        """
+
+        return self.__velicina is None or self.__velicina > 0
+
+    def isprazni (self):
+        """
+        Izbaci sve zapamcene rezultate (izbacivanja se ne broje).
+
+        """
+
+        self.__rezultati.clear()
+
+    def dohvatiStatistiku (self):
+        """
+        Dohvati statistiku koristenja predmemorije.
+
+        Povratna vrijednost je objekt klase dict s kljucevima i vrijednostima
+            --  'pogoci' : broj dohvacanja vec zapamcenog rezultata,
+            --  'promasaji' : broj dohvacanja rezultata koji se morao
+                izracunati,
+            --  'izbacivanja' : broj izbacenih rezultata zbog ogranicenja
+                velicine predmemorije,
+            --  'zapamceno' : trenutni broj zapamcenih rezultata,
+            --  'velicina' : najveci broj zapamcenih rezultata.
+
+        """
+
+        return {'pogoci' : self.__pogoci,
+                'promasaji' : self.__promasaji,
+                'izbacivanja' : self.__izbacivanja,
+                'zapamceno' : len(self.__rezultati),
+                'velicina' : self.__velicina}
+
+    def resetirajStatistiku (self):
+        """
+        Postavi brojace pogodaka, promasaja i izbacivanja na 0.
+
+        """
+
+        self.__pogoci = 0
+        self.__promasaji = 0
+        self.__izbacivanja = 0
+
+    def dohvati (self, kljuc, funkcija, *args, **kwargs):
+        """
+        Dohvati rezultat za kljuc kljuc.
+
+        Ako rezultat za kljuc kljuc nije zapamcen, racuna se pozivom
+            >>> funkcija(*args, **kwargs)
+        i pamti se u predmemoriji (ako je ukljucena).
+
+        """
+
+        # Ako je predmemorija iskljucena, izracunaj rezultat.
+        if not self.jeUkljucena():
+            return funkcija(*args, **kwargs)
+
+        # Ako je rezultat zapamcen, oznaci ga kao najnovije koristeni i vrati
+        # ga.
+        try:
+            rezultat = self.__rezultati.pop(kljuc)
+        except KeyError:
+            pass
+        else:
+            self.__rezultati[kljuc] = rezultat
+            self.__pogoci += 1
+
+            return rezultat
+
+        # Izracunaj rezultat, zapamti ga i po potrebi izbaci najdavnije
+        # korisceni rezultat.
+        rezultat = funkcija(*args, **kwargs)
+        self.__rezultati[kljuc] = rezultat
+        self.__promasaji += 1
+        self.__izbaci()
+
+        return rezultat
+
+    def zapamti (self, kljuc, rezultat):
+        """
+        Zapamti rezultat rezultat za kljuc kljuc (ako je predmemorija
+        ukljucena).
+
+        Funkcija sluzi za unaprijed punjenje predmemorije, stoga se pogoci i
+        promasaji ne broje.
+
+        """
+
+        if not self.jeUkljucena():
+            return
+
+        self.__rezultati.pop(kljuc, None)
+        self.__rezultati[kljuc] = rezultat
+        self.__izbaci()
+
+    def __izbaci (self):
+        """
+        Izbaci najdavnije koristene rezultate dok ih je zapamceno previse.
+
+        """
+
+        if self.__velicina is None:
+            return
+
+        while len(self.__rezultati) > self.__velicina:
+            self.__rezultati.popitem(last = False)
+            self.__izbacivanja += 1
@@ -55,6 +55,10 @@ class PromatracLog (Tablic.Log):
 
         return log
 
+    @classmethod
+    def prihvacaSnimke (cls):
+        return True
+
     def novaPartija (self, n, igraci):
         """
         Ispisi podatke o novoj partiji.
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+"""
+Skripta za provjeru ispravnosti i mjerenje brzine racunanja mogucih poteza.
+
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from karta import Karta
+from engine import Tablic
+from pohlepni_log import PohlepniLog
+from pohlepni_igrac import PohlepniIgrac
+from tablica_poteza import TablicaPoteza
+
+try:
+    import numpy as np
+    from serijski_potezi import SerijskiPotezi
+except ImportError:
+    SerijskiPotezi = None
+
+# Sjeme generatora pseudoslucajnih brojeva (provjera je ponovljiva).
+sjeme = 2017
+
+# Broj slucajnih stolova za provjeru po velicini stola.
+N = 50
+
+# Velicine stolova za provjeru i mjerenje.
+velicine = range(13)
+
+# Broj ponavljanja racunanja pri mjerenju brzine.
+k = 20
+
+# Najveci broj karata na stolu u tablici poteza za provjeru.
+maxKarataTablice = 4
+
+def slucajniStol (generator, n):
+    """
+    Dohvati slucajni stol od n karata.
+
+    """
+
+    return set(generator.sample(sorted(Karta.noviSpil()), n))
+
+def nepovoljniStolovi ():
+    """
+    Dohvati listu "nepovoljnih" stolova.
+
+    Nepovoljni stolovi su stolovi s mnogo karata znaka A i karata niskih
+    znakova, na kojima je broj podskupova koji se sumiraju u neki znak velik.
+
+    """
+
+    asovi = {x for x in Karta.noviSpil() if x.znak == Karta.Znak.A}
+    niske = sorted(x for x in Karta.noviSpil() if x.znak in {Karta.Znak.BR2, Karta.Znak.BR3, Karta.Znak.BR4})
+
+    return [set(),
+            asovi,
+            asovi | set(niske[:4]),
+            asovi | set(niske[:8]),
+            set(niske),
+            {x for x in Karta.noviSpil() if x.boja == Karta.Boja.HERC},
+            {x for x in Karta.noviSpil() if x.znak in {Karta.Znak.BR5, Karta.Znak.BR6, Karta.Znak.BR7}}]
+
+def provjeri (stol):
+    """
+    Provjeri daju li Tablic.moguciPotezi i Tablic.moguciPoteziIscrpno isti
+    rezultat na stolu stol.
+
+    """
+
+    if Tablic.moguciPotezi(stol) != Tablic.moguciPoteziIscrpno(stol):
+        raise RuntimeError('Funkcije Tablic.moguciPotezi i Tablic.moguciPoteziIscrpno ne daju isti rezultat za stol {0:s}.'.format(str(sorted(stol))))
+
+def provjeriSerijski (stol, P):
+    """
+    Provjeri daju li Tablic.moguciPotezi i SerijskiPotezi.moguciPotezi (ciji je
+    redak za stol stol P) isti rezultat na stolu stol.
+
+    """
+
+    M = dict()
+    for znak, potezi in Tablic.moguciPotezi(stol).items():
+        if znak != Karta.Znak.NA and potezi:
+            M.update({znak : {PohlepniLog.prevediSkup(x) for x in potezi}})
+
+    if SerijskiPotezi.dekodiraj(P) != M:
+        raise RuntimeError('Funkcije Tablic.moguciPotezi i SerijskiPotezi.moguciPotezi ne daju isti rezultat za stol {0:s}.'.format(str(sorted(stol))))
+
+def izmjeri (funkcija, stolovi):
+    """
+    Izmjeri prosjecno vrijeme (u sekundama) izvrsavanja funkcije po stolu.
+
+    """
+
+    t0 = time.time()
+    for i in range(k):
+        for stol in stolovi:
+            funkcija(stol)
+    t1 = time.time()
+
+    return float(t1 - t0) / (k * len(stolovi))
+
+# Iskljuci predmemorije (mjeri se brzina samog racunanja).
+Tablic.predmemorijaPoteza().postaviVelicinu(0)
+PohlepniIgrac.predmemorijaKanonskihPoteza().postaviVelicinu(0)
+
+generator = random.Random(sjeme)
+
+# Provjera ispravnosti na nepovoljnim stolovima.
+for stol in nepovoljniStolovi():
+    provjeri(stol)
+
+# Provjera ispravnosti i mjerenje brzine na slucajnim stolovima.
+print("{0:>8s}{1:>16s}{2:>16s}{3:>12s}".format('Karata', 'Iscrpno [ms]', 'DP [ms]', 'Ubrzanje'))
+for n in velicine:
+    stolovi = [slucajniStol(generator, n) for i in range(N)]
+    for stol in stolovi:
+        provjeri(stol)
+
+    stolovi = stolovi[:max(1, N // 10)]
+    t_iscrpno = izmjeri(Tablic.moguciPoteziIscrpno, stolovi)
+    t_dp = izmjeri(Tablic.moguciPotezi, stolovi)
+
+    print("{0:8d}{1:16.4f}{2:16.4f}{3:11.1f}x".format(n, 1000.0 * t_iscrpno, 1000.0 * t_dp, t_iscrpno / t_dp if t_dp else float('inf')))
+    sys.stdout.flush()
+
+# Provjera ispravnosti i mjerenje brzine tablice poteza (tablica se koristi
+# samo pri racunanju poteza nad vektorima, v. funkciju
+# Tablic.postaviTablicuPoteza).
+datoteka = os.path.join(tempfile.mkdtemp(), 'potezi.bin')
+TablicaPoteza.izgradi(datoteka, maxKarataTablice)
+tablica = TablicaPoteza(datoteka)
+
+print("\n{0:>8s}{1:>16s}{2:>16s}{3:>12s}".format('Karata', 'DP [ms]', 'Tablica [ms]', 'Ubrzanje'))
+for n in range(maxKarataTablice + 1):
+    stolovi = [slucajniStol(generator, n) for i in range(N)]
+    vektori = [PohlepniLog.prevediSkup(stol) for stol in stolovi]
+
+    Tablic.postaviTablicuPoteza(None)
+    M_dp = [PohlepniIgrac.moguciPoteziKanonski(v) for v in vektori]
+    t_dp = izmjeri(PohlepniIgrac.moguciPoteziKanonski, vektori)
+
+    Tablic.postaviTablicuPoteza(tablica)
+    for stol, v, M in zip(stolovi, vektori, M_dp):
+        if PohlepniIgrac.moguciPoteziKanonski(v) != M or tablica.moguciPotezi(stol) != Tablic.moguciPotezi(stol):
+            raise RuntimeError('Tablica poteza i dinamicko programiranje ne daju isti rezultat za stol {0:s}.'.format(str(sorted(stol))))
+    t_tablica = izmjeri(PohlepniIgrac.moguciPoteziKanonski, vektori)
+
+    print("{0:8d}{1:16.4f}{2:16.4f}{3:11.1f}x".format(n, 1000.0 * t_dp, 1000.0 * t_tablica, t_dp / t_tablica if t_tablica else float('inf')))
+    sys.stdout.flush()
+
+Tablic.postaviTablicuPoteza(None)
+tablica.zatvori()
+os.remove(datoteka)
+os.rmdir(os.path.dirname(datoteka))
+
+# Provjera ispravnosti i mjerenje brzine serijskog racunanja poteza.
+if SerijskiPotezi is not None:
+    print("\n{0:>8s}{1:>16s}{2:>16s}{3:>12s}".format('Karata', 'DP [ms]', 'Serijski [ms]', 'Ubrzanje'))
+    for n in velicine:
+        stolovi = [slucajniStol(generator, n) for i in range(N)]
+        V = np.array([PohlepniLog.prevediSkup(stol) for stol in stolovi], dtype = np.uint8)
+
+        P = SerijskiPotezi.moguciPotezi(V)
+        for i in range(N):
+            provjeriSerijski(stolovi[i], P[i])
+
+        t_dp = izmjeri(Tablic.moguciPotezi, stolovi)
+        t0 = time.time()
+        for i in range(k):
+            SerijskiPotezi.moguciPotezi(V)
+        t_serijski = float(time.time() - t0) / (k * N)
+
+        print("{0:8d}{1:16.4f}{2:16.4f}{3:11.1f}x".format(n, 1000.0 * t_dp, 1000.0 * t_serijski, t_dp / t_serijski if t_serijski else float('inf')))
+        sys.stdout.flush()
+
+print("\nProvjera uspjesna.")
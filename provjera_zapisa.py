@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+# -*- coding: utf-8 -*-
+
+"""
+Skripta za provjeru ispravnosti binarnog zapisa karata i usporedbu njegove
+velicine s velicinom serijaliziranih (pickle) objekata.
+
+"""
+
+import pickle
+import random
+
+from karta import Karta
+from engine import Tablic
+from binarni_zapis import BinarniZapis
+
+# Sjeme generatora pseudoslucajnih brojeva (provjera je ponovljiva).
+sjeme = 2017
+
+# Broj slucajnih partija za provjeru.
+N = 200
+
+# Broj igraca u slucajnim partijama.
+n = 2
+
+def provjeri (uvjet, poruka):
+    """
+    Izbaci iznimku tipa RuntimeError s porukom poruka ako uvjet nije istinit.
+
+    """
+
+    if not uvjet:
+        raise RuntimeError(poruka)
+
+def slucajnaDijeljenja (generator):
+    """
+    Dohvati sva dijeljenja slucajne partije (u prvom dijeljenju prva kolekcija
+    je inicijalni stol, a ostale su ruke igraca).
+
+    """
+
+    spil = sorted(Karta.noviSpil())
+    generator.shuffle(spil)
+
+    stol = spil[:Tablic.inicijalniBrojKarata_stol()]
+    spil = spil[Tablic.inicijalniBrojKarata_stol():]
+
+    dijeljenja = list()
+    while spil:
+        k = min(Tablic.inicijalniBrojKarata_ruka(), len(spil) // n)
+        ruke = [tuple(spil[i * k:(i + 1) * k]) for i in range(n)]
+        spil = spil[n * k:]
+        dijeljenja.append(([tuple(stol)] if not dijeljenja else []) + ruke)
+
+    return dijeljenja
+
+generator = random.Random(sjeme)
+
+# Provjera zapisa svih karata (ukljucujuci karte nedefinirane boje ili znaka).
+karte = [Karta.izBojeZnaka(boja, znak) for boja in Karta.Boja for znak in Karta.Znak]
+bajtovi = set()
+for karta in karte:
+    bajt = BinarniZapis.kodirajKartu(karta)
+    provjeri(0 <= bajt <= 0xff and bajt not in bajtovi, 'Karta {0:s} nije zapisana jedinstvenim bajtom.'.format(str(karta)))
+    provjeri(BinarniZapis.dekodirajKartu(bajt) == karta, 'Karta {0:s} nije ispravno dekodirana.'.format(str(karta)))
+    bajtovi.add(bajt)
+provjeri(set(range(52)) <= bajtovi, 'Valjane karte nisu zapisane svojim kodovima.')
+provjeri(BinarniZapis.dekodirajKarte(BinarniZapis.kodirajKarte(karte)) == tuple(karte), 'Niz svih karata nije ispravno dekodiran.')
+
+# Provjera odbijanja neispravnih zapisa.
+for podaci, funkcija in [(52, BinarniZapis.dekodirajKartu), (0x80 + 5 * 11, BinarniZapis.dekodirajKartu),
+                         (b'\xff' * 7, BinarniZapis.dekodirajSkup), (b'\x00' * 6, BinarniZapis.dekodirajSkup),
+                         (b'\x03\x00', BinarniZapis.dekodirajKolekcije), (b'\x02\x01\x00', BinarniZapis.dekodirajDijeljenja)]:
+    try:
+        funkcija(podaci)
+    except ValueError:
+        pass
+    else:
+        raise RuntimeError('Neispravni zapis {0:s} je dekodiran.'.format(repr(podaci)))
+
+# Provjera zapisa skupova, poteza i dijeljenja slucajnih partija.
+velicina = {'zapis' : 0, 'pickle' : 0}
+for i in range(N):
+    dijeljenja = slucajnaDijeljenja(generator)
+
+    podaci = BinarniZapis.kodirajDijeljenja(dijeljenja)
+    provjeri(BinarniZapis.dekodirajDijeljenja(podaci) == [list(kolekcije) for kolekcije in dijeljenja], 'Dijeljenja nisu ispravno dekodirana.')
+
+    velicina['zapis'] += len(podaci)
+    velicina['pickle'] += len(pickle.dumps(dijeljenja, 2))
+
+    for kolekcije in dijeljenja:
+        for karte in kolekcije:
+            S = set(karte)
+            provjeri(BinarniZapis.dekodirajSkup(BinarniZapis.kodirajSkup(S)) == S, 'Skup {0:s} nije ispravno dekodiran.'.format(str(sorted(S))))
+
+            if karte:
+                skupljeno = set(generator.sample(karte[1:], generator.randint(0, len(karte) - 1)))
+                potez = BinarniZapis.dekodirajPotez(BinarniZapis.kodirajPotez(karte[0], skupljeno))
+                provjeri(potez == (karte[0], skupljeno), 'Potez {0:s} nije ispravno dekodiran.'.format(str(karte[0])))
+
+                # Predstavnik znaka karte (kao u funkciji MinimaxIgrac.vjerojatnaRuka).
+                predstavnik = Karta.izBojeZnaka(Karta.Boja.NA, karte[0].znak)
+                provjeri(BinarniZapis.dekodirajPotez(BinarniZapis.kodirajPotez(predstavnik, skupljeno)) == (predstavnik, skupljeno), 'Potez predstavnikom {0:s} nije ispravno dekodiran.'.format(str(predstavnik)))
+
+print("{0:>16s}{1:>16s}".format('Zapis [B]', 'Pickle [B]'))
+print("{0:16.1f}{1:16.1f}".format(float(velicina['zapis']) / N, float(velicina['pickle']) / N))
+
+print("\nProvjera uspjesna.")
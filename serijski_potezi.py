@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase SerijskiPotezi za racunanje mogucih poteza na mnogo
+stolova odjednom (pomocu paketa numpy).
+
+"""
+
+import numpy as np
+
+from karta import Karta
+
+class SerijskiPotezi (object):
+    """
+    Klasa za racunanje mogucih poteza na mnogo stolova odjednom.
+
+    Stolovi su reprezentirani vektorima brojeva karata po indeksima kao u
+    funkciji PohlepniLog.prevediKartu (v. funkciju PohlepniLog.prevediSkup), a
+    serija stolova matricom oblika (N, 15) (svaki redak je jedan stol).
+
+    Svi moguci potezi (vektori u takvi da se svaki podskup karata s u[i] karata
+    indeksa i za svaki i sumira u neki znak) unaprijed su izracunati kao
+    "kandidati" (v. funkciju SerijskiPotezi.kandidati).  Kandidat u je potez na
+    stolu v ako i samo ako je u <= v po komponentama.  Ta se provjera radi
+    odjednom za sve stolove i sve kandidate nad vektorima zapisanim u jedan
+    64-bitni cijeli broj (4 bita po indeksu): ako je H broj kojemu je u svakom
+    4-bitnom polju postavljen samo najvisi bit, vrijedi u <= v ako i samo ako
+    je ((v | H) - u) & H == H (brojevi karata manji su od 8 pa se oduzimanjem
+    ne posuduje iz susjednog polja).
+
+    Ubrzanje u odnosu na funkciju Tablic.moguciPotezi raste s brojem karata na
+    stolu: izmjereno naredbom
+
+        PYTHONPATH=. python provjera_poteza.py
+
+    (serije od 50 stolova) iznosi oko 3 puta na stolovima od 4 karte, a oko 15
+    do 25 puta (tipicno oko 20 puta) na stolovima od 12 karata.  Na praznim i
+    gotovo praznim stolovima serijsko je racunanje sporije.
+
+    """
+
+    # Najveci brojevi karata po indeksima za zapisnik.
+    __granice = (4, 3, 4, 4, 4, 4, 4, 4, 4, 3, 4, 4, 4, 1, 1)
+
+    # Numericke vrijednosti karata po indeksima za zapisnik.
+    __vrijednosti = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14, 2, 10)
+
+    # Znakovi karata redom kojim su zapisani u povratnim vrijednostima.
+    __znakovi = (Karta.Znak.A, Karta.Znak.BR2, Karta.Znak.BR3, Karta.Znak.BR4, Karta.Znak.BR5, Karta.Znak.BR6, Karta.Znak.BR7, Karta.Znak.BR8, Karta.Znak.BR9, Karta.Znak.BR10, Karta.Znak.J, Karta.Znak.Q, Karta.Znak.K)
+
+    # Kandidati, njihovi znakovi i zapakirani kandidati (racunaju se pri prvom
+    # koristenju).
+    __kandidati = None
+    __znakoviKandidata = None
+    __zapakirani = None
+
+    @classmethod
+    def __pripremi (cls):
+        """
+        Izracunaj matricu kandidata, matricu znakova kandidata i zapakirane
+        kandidate ako vec nisu izracunati.
+
+        """
+
+        if SerijskiPotezi.__kandidati is not None:
+            return
+
+        def __kandidati (i, budzet):
+            """
+            Iteriraj po svim vektorima od indeksa i nadalje cija najmanja suma
+            ne prelazi budzet.
+
+            """
+
+            if i == len(SerijskiPotezi.__granice):
+                yield tuple()
+
+                return
+
+            for k in range(min(SerijskiPotezi.__granice[i], budzet // SerijskiPotezi.__vrijednosti[i]) + 1):
+                for u in __kandidati(i + 1, budzet - k * SerijskiPotezi.__vrijednosti[i]):
+                    yield (k,) + u
+
+        # Izracunaj kandidate (bez nul-vektora).
+        kandidati = np.array([u for u in __kandidati(0, 14) if any(u)], dtype = np.uint8)
+
+        # Izracunaj znakove u koje se sumiraju kandidati.
+        s = kandidati.astype(np.int64).dot(np.array(SerijskiPotezi.__vrijednosti, dtype = np.int64))
+        a = kandidati[:, 0] > 0
+        znakovi = np.zeros((kandidati.shape[0], len(SerijskiPotezi.__znakovi)), dtype = bool)
+        for j, znak in enumerate(SerijskiPotezi.__znakovi):
+            if znak == Karta.Znak.A:
+                znakovi[:, j] = (s == 1) | (s == 11)
+            else:
+                znakovi[:, j] = (s == znak.value) | a & (s + 10 == znak.value)
+
+        SerijskiPotezi.__kandidati = kandidati
+        SerijskiPotezi.__znakoviKandidata = znakovi
+        SerijskiPotezi.__zapakirani = SerijskiPotezi.zapakiraj(kandidati)
+
+    @classmethod
+    def zapakiraj (cls, V):
+        """
+        Zapisi svaki redak matrice V (oblika (N, 15)) u jedan 64-bitni cijeli
+        broj (4 bita po indeksu, od najmanje znacajnih bitova).
+
+        """
+
+        V = np.asarray(V, dtype = np.uint64)
+
+        return (V << (np.uint64(4) * np.arange(V.shape[1], dtype = np.uint64))).sum(axis = 1, dtype = np.uint64)
+
+    @classmethod
+    def kandidati (cls):
+        """
+        Dohvati matricu (oblika (K, 15)) svih kandidata za poteze.
+
+        """
+
+        SerijskiPotezi.__pripremi()
+
+        return SerijskiPotezi.__kandidati.copy()
+
+    @classmethod
+    def znakovi (cls):
+        """
+        Dohvati tuple znakova redom kojim su zapisani u povratnim vrijednostima.
+
+        """
+
+        return SerijskiPotezi.__znakovi
+
+    @classmethod
+    def moguciPotezi (cls, V, velicinaSerije = 4096):
+        """
+        Pronadi sve moguce poteze na stolovima zadanim matricom V.
+
+        Matrica V mora biti oblika (N, 15) i na mjestu (i, k) sadrzavati broj
+        karata s indeksom k na i-tom stolu.  Povratna vrijednost je matrica
+        oblika (N, 13, ceil(K / 8)) tipa numpy.uint8 kojoj je na mjestu (i, j)
+        zapakirani (funkcijom numpy.packbits) niz od K bitova: l-ti bit je
+        postavljen ako i samo ako je l-ti kandidat (v. funkciju
+        SerijskiPotezi.kandidati) potez na i-tom stolu koji se sumira u j-ti
+        znak (v. funkciju SerijskiPotezi.znakovi).  Za dekodiranje poteza
+        jednog stola v. funkciju SerijskiPotezi.dekodiraj.
+
+        Stolovi se obraduju u serijama od najvise velicinaSerije stolova (radi
+        ogranicenja potrebne memorije).
+
+        """
+
+        SerijskiPotezi.__pripremi()
+
+        V = np.asarray(V)
+        N = V.shape[0]
+        K = SerijskiPotezi.__kandidati.shape[0]
+
+        P = np.zeros((N, len(SerijskiPotezi.__znakovi), (K + 7) // 8), dtype = np.uint8)
+
+        H = np.uint64(0x888888888888888)
+        for i in range(0, N, velicinaSerije):
+            # Provjeri koji su kandidati potezi na stolovima u seriji.
+            v = SerijskiPotezi.zapakiraj(V[i:i + velicinaSerije])
+            dostupni = (((v[:, None] | H) - SerijskiPotezi.__zapakirani[None, :]) & H) == H
+
+            # Razvrstaj dostupne kandidate po znakovima i zapakiraj ih.
+            P[i:i + velicinaSerije] = np.packbits(dostupni[:, None, :] & SerijskiPotezi.__znakoviKandidata.T[None, :, :], axis = 2)
+
+        return P
+
+    @classmethod
+    def dekodiraj (cls, P):
+        """
+        Dekodiraj poteze jednog stola.
+
+        Argument P mora biti redak povratne vrijednosti funkcije
+        SerijskiPotezi.moguciPotezi (matrica oblika (13, ceil(K / 8))).
+        Povratna vrijednost je dict jednak povratnoj vrijednosti funkcije
+        PohlepniIgrac.moguciPoteziKanonski za pripadni stol.
+
+        """
+
+        SerijskiPotezi.__pripremi()
+
+        K = SerijskiPotezi.__kandidati.shape[0]
+
+        M = dict()
+        for j, znak in enumerate(SerijskiPotezi.__znakovi):
+            l = np.flatnonzero(np.unpackbits(P[j])[:K])
+            if l.size:
+                M.update({znak : {tuple(int(x) for x in u) for u in SerijskiPotezi.__kandidati[l]}})
+
+        return M
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase SkupKarata za reprezentaciju skupova karata bitovima.
+
+"""
+
+import six
+
+from karta import Karta
+
+if six.PY3:
+    unicode = str
+    long = int
+
+class SkupKarata (object):
+    """
+    Klasa za reprezentaciju skupova valjanih igracih karata.
+
+    Skup karata reprezentiran je jednim cijelim brojem od 52 bita tako da je
+    bit s indeksom SkupKarata.kodKarte(karta) postavljen ako i samo ako je
+    karta u skupu.  Objekti klase SkupKarata su nepromjenjivi: operacije |, &,
+    -, ^ vracaju nove objekte, a operatori |=, &=, -=, ^= samo vezu varijablu
+    uz novi objekt.  Stoga je kopiranje skupa (copy.copy, copy.deepcopy)
+    trivijalno (vraca se isti objekt).
+
+    Drugi operand skupovnih operacija i usporedbi moze biti i objekt klase set
+    ili frozenset (ili bilo koja kolekcija) valjanih karata, pa se objekti
+    klase SkupKarata mogu koristiti umjesto skupova karata.  Ipak, hash
+    vrijednost objekta klase SkupKarata nije jednaka hash vrijednosti objekta
+    klase frozenset istih karata, stoga ih ne treba mijesati kao kljuceve
+    rjecnika.
+
+    """
+
+    __slots__ = ('__bitovi',)
+
+    @classmethod
+    def kodKarte (cls, karta):
+        """
+        Dohvati kod (indeks bita) karte karta (v. funkciju Karta.kod).
+
+        Ako karta nije valjana karta (ako joj boja ili znak nisu definirani),
+        povratna vrijednost je None.
+
+        """
+
+        return karta.kod
+
+    @classmethod
+    def kartaKoda (cls, kod):
+        """
+        Dohvati kartu s kodom kod.
+
+        Funkcija je inverz funkcije SkupKarata.kodKarte.
+
+        """
+
+        return Karta.izKoda(kod)
+
+    @classmethod
+    def izBitova (cls, bitovi):
+        """
+        Kreiraj objekt klase SkupKarata zadan bitovima bitovi.
+
+        """
+
+        skup = object.__new__(SkupKarata)
+        skup.__bitovi = bitovi
+
+        return skup
+
+    @classmethod
+    def puni (cls):
+        """
+        Dohvati skup svih 52 valjanih igracih karata.
+
+        """
+
+        return SkupKarata.izBitova((1 << 52) - 1)
+
+    @classmethod
+    def bitoviKolekcije (cls, x):
+        """
+        Dohvati bitove skupa karata u kolekciji x.
+
+        Ako je x objekt klase SkupKarata, povratna vrijednost su njegovi bitovi.
+        Inace se x smatra kolekcijom karata, a ako neki element kolekcije nije
+        valjana karta, povratna vrijednost je None.
+
+        """
+
+        if isinstance(x, SkupKarata):
+            return x.__bitovi
+
+        bitovi = 0
+        for karta in x:
+            kod = SkupKarata.kodKarte(karta) if isinstance(karta, Karta) else None
+            if kod is None:
+                return None
+            bitovi |= 1 << kod
+
+        return bitovi
+
+    def __init__ (self, karte = None):
+        """
+        Inicijaliziraj objekt klase SkupKarata.
+
+        Ako je karte None, inicijalizira se prazni skup.  Inace karte mora biti
+        objekt klase SkupKarata ili kolekcija valjanih karata (objekata klase
+        Karta kojima su definirani i boja i znak), a u suprotnom se izbacuje
+        iznimka tipa ValueError.
+
+        """
+
+        if karte is None:
+            self.__bitovi = 0
+        else:
+            self.__bitovi = SkupKarata.bitoviKolekcije(karte)
+            if self.__bitovi is None:
+                raise ValueError("Objekt klase `SkupKarata' moze sadrzavati samo valjane karte.")
+
+    def __copy__ (self):
+        """
+        Dohvati copy.copy(self).
+
+        """
+
+        return self
+
+    def __deepcopy__ (self, memo = dict()):
+        """
+        Dohvati copy.deepcopy(self, memo).
+
+        """
+
+        return self
+
+    def __reduce__ (self):
+        """
+        Dohvati podatke za serijalizaciju (pickle) objekta.
+
+        """
+
+        return (SkupKarata.izBitova, (self.__bitovi,))
+
+    def dohvatiBitove (self):
+        """
+        Dohvati bitove skupa.
+
+        """
+
+        return self.__bitovi
+
+    def uSkup (self):
+        """
+        Dohvati objekt klase set karata u skupu.
+
+        """
+
+        return set(self)
+
+    def __len__ (self):
+        """
+        Dohvati broj karata u skupu.
+
+        """
+
+        return bin(self.__bitovi).count('1')
+
+    def __iter__ (self):
+        """
+        Iteriraj po kartama u skupu (uzlazno).
+
+        """
+
+        bitovi = self.__bitovi
+        while bitovi:
+            b = bitovi & -bitovi
+            yield SkupKarata.kartaKoda(b.bit_length() - 1)
+            bitovi ^= b
+
+    def __contains__ (self, karta):
+        """
+        Provjeri je li karta u skupu.
+
+        """
+
+        if not isinstance(karta, Karta):
+            return False
+
+        kod = SkupKarata.kodKarte(karta)
+
+        return kod is not None and bool(self.__bitovi >> kod & 1)
+
+    def __nonzero__ (self):
+        """
+        Provjeri je li skup neprazan.
+
+        """
+
+        return bool(self.__bitovi)
+
+    __bool__ = __nonzero__
+
+    def __hash__ (self):
+        """
+        Dohvati hash(self).
+
+        """
+
+        return hash(self.__bitovi)
+
+    def __or__ (self, value):
+        """
+        Dohvati uniju skupova.
+
+        """
+
+        bitovi = SkupKarata.bitoviKolekcije(value)
+        if bitovi is None:
+            return NotImplemented
+
+        return SkupKarata.izBitova(self.__bitovi | bitovi)
+
+    __ror__ = __or__
+
+    def __and__ (self, value):
+        """
+        Dohvati presjek skupova.
+
+        """
+
+        bitovi = SkupKarata.bitoviKolekcije(value)
+        if bitovi is None:
+            return NotImplemented
+
+        return SkupKarata.izBitova(self.__bitovi & bitovi)
+
+    __rand__ = __and__
+
+    def __xor__ (self, value):
+        """
+        Dohvati simetricnu razliku skupova.
+
+        """
+
+        bitovi = SkupKarata.bitoviKolekcije(value)
+        if bitovi is None:
+            return NotImplemented
+
+        return SkupKarata.izBitova(self.__bitovi ^ bitovi)
+
+    __rxor__ = __xor__
+
+    def __sub__ (self, value):
+        """
+        Dohvati razliku skupova (self - value).
+
+        Ako value nije kolekcija valjanih karata, karte koje nisu valjane se
+        zanemaruju (nisu u skupu self pa ih ionako nije potrebno uklanjati).
+
+        """
+
+        if isinstance(value, SkupKarata):
+            return SkupKarata.izBitova(self.__bitovi & ~value.__bitovi)
+
+        bitovi = self.__bitovi
+        for karta in value:
+            kod = SkupKarata.kodKarte(karta) if isinstance(karta, Karta) else None
+            if kod is not None:
+                bitovi &= ~(1 << kod)
+
+        return SkupKarata.izBitova(bitovi)
+
+    def __rsub__ (self, value):
+        """
+        Dohvati razliku skupova (value - self).
+
+        """
+
+        bitovi = SkupKarata.bitoviKolekcije(value)
+        if bitovi is None:
+            return NotImplemented
+
+        return SkupKarata.izBitova(bitovi & ~self.__bitovi)
+
+    def isdisjoint (self, value):
+        """
+        Provjeri jesu li skupovi disjunktni.
+
+        """
+
+        return not (self & SkupKarata(value)).__bitovi
+
+    def __eq__ (self, value):
+        """
+        Usporedi (==) skupove.
+
+        """
+
+        if not isinstance(value, (SkupKarata, set, frozenset)):
+            return NotImplemented
+
+        return self.__bitovi == SkupKarata.bitoviKolekcije(value)
+
+    def __ne__ (self, value):
+        """
+        Usporedi (!=) skupove.
+
+        """
+
+        jednako = self.__eq__(value)
+
+        return jednako if jednako is NotImplemented else not jednako
+
+    def __le__ (self, value):
+        """
+        Provjeri je li self podskup skupa value.
+
+        """
+
+        if not isinstance(value, (SkupKarata, set, frozenset)):
+            return NotImplemented
+
+        if isinstance(value, SkupKarata):
+            return not self.__bitovi & ~value.__bitovi
+
+        return all(karta in value for karta in self)
+
+    def __lt__ (self, value):
+        """
+        Provjeri je li self pravi podskup skupa value.
+
+        """
+
+        podskup = self.__le__(value)
+
+        return podskup if podskup is NotImplemented else podskup and len(self) != len(value)
+
+    def __ge__ (self, value):
+        """
+        Provjeri je li self nadskup skupa value.
+
+        """
+
+        if not isinstance(value, (SkupKarata, set, frozenset)):
+            return NotImplemented
+
+        bitovi = SkupKarata.bitoviKolekcije(value)
+
+        return bitovi is not None and not bitovi & ~self.__bitovi
+
+    def __gt__ (self, value):
+        """
+        Provjeri je li self pravi nadskup skupa value.
+
+        """
+
+        nadskup = self.__ge__(value)
+
+        return nadskup if nadskup is NotImplemented else nadskup and len(self) != len(value)
+
+    def __repr__ (self):
+        """
+        Dohvati repr(self).
+
+        """
+
+        return '<{0:s}: {{{1:s}}}>'.format(self.__class__.__name__, ', '.join(repr(karta) for karta in self))
+
+    def __str__ (self):
+        """
+        Dohvati str(self).
+
+        """
+
+        return '{0:s}({{{1:s}}})'.format(self.__class__.__name__, ', '.join(str(karta) for karta in self))
+
+    def __unicode__ (self):
+        """
+        Dohvati unicode(self).
+
+        """
+
+        return unicode('{0:s}({{{1:s}}})').format(self.__class__.__name__, unicode(', ').join(unicode(karta) for karta in self))
@@ -5,6 +5,11 @@ Implementacija nekih skupovnih operacija.
 
 """
 
+import random
+import six
+
+from predmemorija import Predmemorija
+
 def partitivniSkup (S):
     """
     Izracunaj partitivni skup (konacnog) skupa S.
@@ -37,6 +42,31 @@ def partitivniSkup (S):
     # Vrati izracunati partitivni skup.
     return P
 
+def iterirajPartitivniSkup (S):
+    """
+    Iteriraj po partitivnom skupu (konacnog) skupa S.
+
+    Funkcija je generator koji redom generira iste skupove (objekte klase
+    frozenset) kao sto su elementi povratne vrijednosti funkcije
+    partitivniSkup, ali bez pamcenja vec generiranih skupova (potrebna memorija
+    je linearna u broju elemenata skupa S).  Elementi skupa S sortiraju se
+    (ako je moguce) i skupovi se generiraju redom bitovnih maski 0, 1, 2, ...,
+    2^n - 1, gdje je i-ti bit maske postavljen ako i samo ako je i-ti element
+    u skupu, pa je redoslijed deterministican.
+
+    """
+
+    # Sortiraj elemente skupa S (ako je moguce).
+    elementi = list(set(S))
+    try:
+        elementi.sort()
+    except TypeError:
+        pass
+
+    # Generiraj podskupove redom maski.
+    for A in range(1 << len(elementi)):
+        yield frozenset(elementi[i] for i in range(len(elementi)) if A >> i & 1)
+
 def unijeDisjunktnih (F):
     """
     Izracunaj familiju svih unija disjunktnih elemenata konacne familije F.
@@ -54,10 +84,21 @@ def unijeDisjunktnih (F):
         2.  Iteriramo po svim elementima (S) familije F.  Za svaki A iz U takav
             da su A i S disjunktni A unija S nova je poznata unija u parovima
             disjunktnih elemenata familije F --- stoga A unija S dodajemo u U.
-    Slozenost funkcije je, dakle, reda O(2^n * k), gdje su n ukupni broj svih
-    (razlicitih) elemenata u F i k zbroj kardinaliteta svih elemenata familije
-    F.  Prethodna ocjena pociva na pretpostavci da je slozenost funkcije
-    set.isdisjoint(X, Y) linearne slozenosti max({card(X), card(Y)}).
+    Slozenost funkcije je, dakle, reda O(2^n * m), gdje su n ukupni broj svih
+    (razlicitih) elemenata u F i m broj (razlicitih) elemenata familije F.
+
+    Ako familija F ima barem unijeDisjunktnih.prag elemenata, unije se racunaju
+    nad bitovnim maskama (v. funkciju uMaske): provjera disjunktnosti i
+    racunanje unije postaju bitovne operacije nad cijelim brojevima, a objekt
+    klase frozenset kreira se samo jednom za svaku novu (razlicitu) uniju.  Za
+    manje familije prevodenje u maske skuplje je od same ustede pa se unije
+    racunaju izravno nad objektima klase frozenset.
+
+    Izracunate familije unija pamte se u predmemoriji
+    unijeDisjunktnih.predmemorija (objekt klase Predmemorija) s kljucem
+    frozenset(F), a povratna vrijednost je kopija zapamcene familije.
+    Predmemorija se moze iskljuciti pozivom
+        >>> unijeDisjunktnih.predmemorija.postaviVelicinu(0)
 
     Elementi povratne familije U (objekt klase set) objekti su klase frozenset.
     Za svaki A iz U postoji podfamilija G = {X1, X2, ..., Xm} familije F takva
@@ -67,19 +108,440 @@ def unijeDisjunktnih (F):
 
     """
 
-    # Inicijaliziraj familiju unija u parovima disjunktnih elemenata familije
-    # F na {{}}.
-    U = {frozenset()}
+    def __unije (F):
+        """
+        Izracunaj familiju svih unija disjunktnih elemenata familije F
+        (elementi familije F moraju biti objekti klase frozenset).
+
+        """
+
+        if len(F) < unijeDisjunktnih.prag:
+            # Inicijaliziraj familiju unija u parovima disjunktnih elemenata
+            # familije F na {{}}.
+            U = {frozenset()}
+
+            # Konstruiraj familiju unija u parovima disjunktnih elemenata
+            # familije F.
+            for S in F:
+                V = set()
+                for A in U:
+                    if A.isdisjoint(S):
+                        V |= {frozenset(A | S)}
+                U |= V
+
+            # Vrati familiju unija u parovima disjunktnih elemenata familije
+            # F.
+            return U
+
+        # Prevedi familiju F u bitovne maske.
+        _, maske = uMaske(F)
+
+        # Inicijaliziraj familiju unija (rjecnik maski i pripadnih skupova)
+        # na {{}}.
+        U = {0 : frozenset()}
+
+        # Konstruiraj familiju unija u parovima disjunktnih elemenata familije
+        # F.
+        for m, S in six.iteritems(maske):
+            U.update({A | m : X | S for A, X in six.iteritems(U) if not A & m and not (A | m) in U})
+
+        # Vrati familiju unija u parovima disjunktnih elemenata familije F.
+        return set(six.itervalues(U))
+
+    # Pretvori elemente familije F u objekte klase frozenset.
+    F = frozenset(frozenset(S) for S in F)
+
+    # Dohvati familiju unija iz predmemorije (kljuc je familija F kao objekt
+    # klase frozenset) i vrati njezinu kopiju.
+    return set(unijeDisjunktnih.predmemorija.dohvati(F, __unije, F))
+
+# Najmanji broj elemenata familije za racunanje unija nad bitovnim maskama.
+# (Izmjereno na familijama poteza slucajnih stolova od 2 do 16 karata: za
+# familije od 16 do 23 elementa racunanje nad maskama jos je oko 8% sporije,
+# a za familije od 24 do 31 elementa vec oko 1.4 puta brze.  Takve familije
+# rijetke su na stvarnim stolovima, pa se tipicne familije racunaju izravno.)
+unijeDisjunktnih.prag = 24
+
+# Predmemorija izracunatih familija unija.
+unijeDisjunktnih.predmemorija = Predmemorija()
+
+def iterirajUnijeDisjunktnih (F):
+    """
+    Iteriraj po familiji svih unija disjunktnih elemenata konacne familije F.
+
+    Funkcija je generator koji generira iste skupove (objekte klase frozenset)
+    kao sto su elementi povratne vrijednosti funkcije unijeDisjunktnih (svaki
+    tocno jednom), ali bez pamcenja vec generiranih unija.
+
+    Elementi skupova u familiji sortiraju se (ako je moguce) i prevode u
+    bitovne maske (v. funkciju uMaske), a zatim se pretrazivanjem u dubinu za
+    svaki element redom odlucuje je li u uniji ili nije.  Uz odluke se pamte
+    "nedovrsena pokrivanja" --- maske jos neodlucenih elemenata koje su vec
+    pokrivene odabranim disjunktnim elementima familije F koji pokrivaju sve
+    dosad ukljucene, a nijedan iskljuceni element.  Kada element ulazi u
+    uniju, a nije vec pokriven, pokriva ga element familije F kojemu je on
+    najnizi element.  Grana se odbacuje cim ne preostane nijedno nedovrseno
+    pokrivanje, a unija se generira ako na kraju postoji pokrivanje bez
+    nepokrivenih elemenata.  Svaka se unija, dakle, generira tocno jednom i
+    redoslijed generiranih unija je deterministican.  Potrebna memorija ne
+    ovisi o broju unija, nego samo o broju istodobnih nedovrsenih pokrivanja
+    na putu pretrazivanja.
+
+    """
+
+    def __unije (i, A, pokrivanja):
+        """
+        Iteriraj po unijama kojima su odluke o elementima s indeksima manjim od
+        i zadane maskom A, uz nedovrsena pokrivanja pokrivanja.
+
+        """
+
+        if i == len(elementi):
+            if 0 in pokrivanja:
+                yield izMaske(A, elementi)
+
+            return
+
+        b = 1 << i
+
+        # Element nije u uniji (ne smije biti vec pokriven).
+        izvan = {P for P in pokrivanja if not P & b}
+        if izvan:
+            for U in __unije(i + 1, A, izvan):
+                yield U
 
-    # Konstruiraj familiju unija u parovima disjunktnih elemenata familije F.
+        # Element je u uniji (vec je pokriven ili ga pokriva novi element
+        # familije F).
+        unutra = {P ^ b for P in pokrivanja if P & b}
+        unutra |= {(P | m) ^ b for P in izvan for m in maske[i] if not P & m}
+        if unutra:
+            for U in __unije(i + 1, A | b, unutra):
+                yield U
+
+    # Pretvori elemente familije F u objekte klase frozenset.
+    F = [frozenset(S) for S in F]
+
+    # Sortiraj elemente skupova u familiji F (ako je moguce).
+    elementi = list(frozenset().union(*F))
+    try:
+        elementi.sort()
+    except TypeError:
+        pass
+    elementi = [frozenset((x,)) for x in elementi]
+
+    # Prevedi familiju F u bitovne maske i razvrstaj ih po najnizem bitu.
+    maske = [set() for x in elementi]
     for S in F:
-        S = frozenset(S)
+        if S:
+            m = sum(1 << i for i in range(len(elementi)) if not S.isdisjoint(elementi[i]))
+            maske[(m & -m).bit_length() - 1] |= {m}
+
+    # Generiraj unije.
+    for U in __unije(0, 0, {0}):
+        yield U
+
+def slucajnaUnijaDisjunktnih (F, generator = random):
+    """
+    Odaberi slucajnu uniju disjunktnih elemenata konacne familije F.
+
+    Svaka unija iz povratne vrijednosti funkcije unijeDisjunktnih(F) odabire se
+    s jednakom vjerojatnoscu, ali bez racunanja cijele familije unija: unije se
+    generiraju funkcijom iterirajUnijeDisjunktnih, a odabire se jedna metodom
+    uzorkovanja spremnikom (eng. reservoir sampling) --- k-ta generirana unija
+    zamjenjuje dotad odabranu s vjerojatnoscu 1 / k.
+
+    Argument generator je objekt s metodom randrange (na primjer objekt klase
+    random.Random ili sam modul random).
+
+    """
+
+    # Odaberi uniju uzorkovanjem spremnikom.
+    odabrana = None
+    for k, A in enumerate(iterirajUnijeDisjunktnih(F)):
+        if not generator.randrange(k + 1):
+            odabrana = A
+
+    # Vrati odabranu uniju.
+    return odabrana
+
+def maksimalneUnijeDisjunktnih (F):
+    """
+    Izracunaj familiju svih maksimalnih unija disjunktnih elemenata konacne
+    familije F.
+
+    Unija u parovima disjunktnih elemenata familije F (v. funkciju
+    unijeDisjunktnih) je maksimalna ako nije pravi podskup nijedne druge unije
+    u parovima disjunktnih elemenata familije F.  Povratna familija je, dakle,
+    podfamilija povratne familije funkcije unijeDisjunktnih (prazni skup je u
+    povratnoj familiji ako i samo ako je F prazna familija ili familija ciji je
+    jedini element prazni skup).
+
+    Familija svih unija se ne racuna, nego se pretrazivanjem pronalaze samo
+    "kandidati" --- unije koje se ne mogu prosiriti nijednim elementom
+    familije F (unija koja se moze prosiriti ocito nije maksimalna):
+        --  ako familija F ima manje od maksimalneUnijeDisjunktnih.prag
+            elemenata, kandidati su unije maksimalnih podfamilija u parovima
+            disjunktnih elemenata, koje se pronalaze algoritmom Bron-Kerbosch
+            s pivotiranjem nad grafom disjunktnosti elemenata familije F
+            (elementi grafa i skupovi susjeda reprezentirani su bitovima pa
+            se objekti klase frozenset kreiraju samo za kandidate; ako su
+            svaka dva elementa familije F disjunktna, kandidati su upravo
+            elementi familije F),
+        --  inace se elementi skupova u familiji prevode u bitove i za svaki
+            element redom odlucuje je li u uniji (ako nije vec pokriven,
+            pokriva ga element familije F kojemu je on najnizi element) ili
+            nije, pri cemu se jednake djelomicne unije spajaju, a djelomicna
+            unija odbacuje cim postoji element familije F o cijim su svim
+            elementima odluke donesene i koji je s njom disjunktan (takva se
+            unija vise ne moze dopuniti do kandidata).
+    Obrat ne vrijedi (na primjer za F = {{1}, {1, 2}} unija {1} ne moze se
+    prosiriti, ali je pravi podskup unije {1, 2}), stoga se medu kandidatima
+    (sortiranima silazno po kardinalitetu) zadrzavaju samo oni koji nisu
+    podskupovi vec zadrzanih.
+
+    Izracunate familije pamte se u predmemoriji
+    maksimalneUnijeDisjunktnih.predmemorija (objekt klase Predmemorija) s
+    kljucem frozenset(F), a povratna vrijednost je kopija zapamcene familije.
+
+    """
+
+    def __maksimalne (F):
+        """
+        Izracunaj familiju svih maksimalnih unija disjunktnih elemenata
+        familije F (elementi familije F moraju biti objekti klase frozenset).
+
+        """
+
+        def __podfamilije (R, P, X):
+            """
+            Pronadi unije maksimalnih podfamilija u parovima disjunktnih
+            elemenata koje sadrze elemente s bitovima iz R, neke elemente s
+            bitovima iz P i nijedan element s bitom iz X.
+
+            """
+
+            if not P:
+                if not X:
+                    kandidati.add(frozenset().union(*[F[i] for i in range(len(F)) if R >> i & 1]))
+
+                return
+
+            # Svaka maksimalna podfamilija sadrzi pivot ili neki element koji
+            # s njim nije disjunktan.
+            u = (P | X) & -(P | X)
+            Q = P & ~susjedi[u.bit_length() - 1]
+            while Q:
+                b = Q & -Q
+                i = b.bit_length() - 1
+                __podfamilije(R | b, P & susjedi[i], X & susjedi[i])
+                P &= ~b
+                X |= b
+                Q ^= b
+
+        # Izbaci prazni skup (on ne mijenja uniju).
+        F = [S for S in F if S]
+
+        # Obradi trivijalne familije.
+        if len(F) <= 1:
+            return frozenset(F) if F else frozenset((frozenset(),))
+
+        if len(F) < maksimalneUnijeDisjunktnih.prag:
+            # Izracunaj graf disjunktnosti (i-ti bit skupa susjedi[j]
+            # postavljen je ako i samo ako su F[i] i F[j] disjunktni).
+            susjedi = [0 for S in F]
+            for i in range(len(F)):
+                for j in range(i + 1, len(F)):
+                    if F[i].isdisjoint(F[j]):
+                        susjedi[i] |= 1 << j
+                        susjedi[j] |= 1 << i
+
+            # Pronadi kandidate.
+            if any(susjedi):
+                kandidati = set()
+                __podfamilije(0, (1 << len(F)) - 1, 0)
+            else:
+                kandidati = F
+        else:
+            # Prevedi elemente familije F u bitovne maske razvrstane po
+            # najnizem i najvisem bitu.
+            elementi = [frozenset((x,)) for x in frozenset().union(*F)]
+            najnizi = [list() for x in elementi]
+            najvisi = [list() for x in elementi]
+            for S in F:
+                m = 0
+                for i in range(len(elementi)):
+                    if not S.isdisjoint(elementi[i]):
+                        m |= 1 << i
+                najnizi[(m & -m).bit_length() - 1].append(m)
+                najvisi[m.bit_length() - 1].append(m)
+
+            # Odlucuj redom o elementima.
+            U = {0}
+            for i in range(len(elementi)):
+                b = 1 << i
+                if najnizi[i]:
+                    U |= {A | m for A in U if not A & b for m in najnizi[i] if not A & m}
+                for m in najvisi[i]:
+                    U = {A for A in U if A & m}
+
+            # Prevedi kandidate u objekte klase frozenset.
+            kandidati = [izMaske(A, elementi) for A in U]
+
+        # Zadrzi maksimalne kandidate.
+        M = list()
+        for A in sorted(kandidati, key = len, reverse = True):
+            if not any(A <= B for B in M):
+                M.append(A)
+
+        # Vrati familiju maksimalnih unija u parovima disjunktnih elemenata
+        # familije F.
+        return frozenset(M)
+
+    # Pretvori elemente familije F u objekte klase frozenset.
+    F = frozenset(frozenset(S) for S in F)
+
+    # Dohvati familiju maksimalnih unija iz predmemorije (kljuc je familija F
+    # kao objekt klase frozenset) i vrati njezinu kopiju.
+    return set(maksimalneUnijeDisjunktnih.predmemorija.dohvati(F, __maksimalne, F))
+
+# Najmanji broj elemenata familije za pretrazivanje po elementima skupova
+# (umjesto po podfamilijama) u funkciji maksimalneUnijeDisjunktnih.
+maksimalneUnijeDisjunktnih.prag = 16
+
+# Predmemorija izracunatih familija maksimalnih unija.
+maksimalneUnijeDisjunktnih.predmemorija = Predmemorija()
+
+def unijeDisjunktnihVektora (F, v):
+    """
+    Izracunaj familiju svih "unija disjunktnih" elemenata konacne familije F
+    multiskupova ogranicenih multiskupom v.
+
+    Multiskupovi su reprezentirani vektorima (objektima klase tuple) jednake
+    duljine kao v ciji su elementi nenegativni cijeli brojevi (kratnosti).
+    Analogon unije u parovima disjunktnih elemenata familije F (v. funkciju
+    unijeDisjunktnih) je suma vektora
+        k1 * X1 + k2 * X2 + ... + km * Xm,
+    gdje su X1, X2, ..., Xm razliciti elementi familije F, a k1, k2, ..., km
+    nenegativni cijeli brojevi, takva da je suma (po komponentama) manja ili
+    jednaka v.  Isti element familije F smije se, dakle, pojaviti i vise puta
+    jer reprezentira vise razlicitih (disjunktnih) skupova s istim brojem
+    elemenata svake vrste.
+
+    Familija se racuna analogno kao u funkciji unijeDisjunktnih, ali se za
+    svaki X iz F i svaki A iz U u U dodaju svi vektori A + k * X (k = 1, 2,
+    ...) manji ili jednaki v.
+
+    Izracunate familije pamte se u predmemoriji
+    unijeDisjunktnihVektora.predmemorija (objekt klase Predmemorija) s kljucem
+    (frozenset(F), v), a povratna vrijednost je kopija zapamcene familije.
+
+    """
+
+    def __unije (F, v):
+        """
+        Izracunaj familiju svih "unija disjunktnih" elemenata familije F
+        ogranicenih s v.
+
+        """
+
+        # Inicijaliziraj familiju unija na {0}.
+        U = {tuple(0 for x in v)}
+
+        # Konstruiraj familiju unija.
+        for X in F:
+            if not any(X):
+                continue
+            V = set()
+            for A in U:
+                B = tuple(a + x for a, x in zip(A, X))
+                while all(b <= y for b, y in zip(B, v)):
+                    V |= {B}
+                    B = tuple(b + x for b, x in zip(B, X))
+            U |= V
+
+        # Vrati familiju unija.
+        return U
+
+    # Pretvori elemente familije F i vektor v u objekte klase tuple.
+    F = frozenset(tuple(X) for X in F)
+    v = tuple(v)
+
+    # Dohvati familiju unija iz predmemorije i vrati njezinu kopiju.
+    return set(unijeDisjunktnihVektora.predmemorija.dohvati((F, v), __unije, F, v))
+
+# Predmemorija izracunatih familija unija vektora.
+unijeDisjunktnihVektora.predmemorija = Predmemorija()
+
+def maksimalneUnijeDisjunktnihVektora (F, v):
+    """
+    Izracunaj familiju svih maksimalnih "unija disjunktnih" elemenata konacne
+    familije F multiskupova ogranicenih multiskupom v.
+
+    Funkcija je analogon funkcije maksimalneUnijeDisjunktnih za vektore (v.
+    funkciju unijeDisjunktnihVektora): vektor je maksimalan ako nijedan drugi
+    vektor povratne familije funkcije unijeDisjunktnihVektora nije po
+    komponentama veci ili jednak njemu.
+
+    """
+
+    # Pronadi maksimalne unije.
+    M = list()
+    for A in sorted(unijeDisjunktnihVektora(F, v), key = sum, reverse = True):
+        if not any(all(a <= b for a, b in zip(A, B)) for B in M):
+            M.append(A)
+
+    # Vrati familiju maksimalnih unija.
+    return set(M)
+
+def uMaske (F):
+    """
+    Prevedi familiju F u bitovne maske.
+
+    Povratna vrijednost je tuple (elementi, maske) gdje je elementi lista
+    jednoclanih skupova (objekata klase frozenset) svih (razlicitih) elemenata
+    skupova u familiji F, a maske rjecnik ciji su kljucevi cijeli brojevi, a
+    vrijednosti objekti klase frozenset, takav da je svaki S iz F vrijednost
+    jedinstvenog kljuca m ciji je i-ti bit postavljen ako i samo ako je element
+    skupa elementi[i] u S.
+
+    Elementi su reprezentirani jednoclanim skupovima (a ne samim elementima)
+    jer se tada i prevodenje skupova u maske i prevodenje maski u skupove (v.
+    funkciju izMaske) svodi na skupovne operacije nad objektima klase
+    frozenset, koje koriste vec izracunate hash vrijednosti elemenata.
+
+    """
+
+    # Pretvori elemente familije F u objekte klase frozenset.
+    F = [frozenset(S) for S in F]
+
+    # Izracunaj jednoclane skupove svih elemenata.
+    elementi = [frozenset((x,)) for x in frozenset().union(*F)]
+
+    # Izracunaj maske.
+    maske = dict()
+    for S in F:
+        m = 0
+        for i in range(len(elementi)):
+            if not S.isdisjoint(elementi[i]):
+                m |= 1 << i
+        maske.update({m : S})
+
+    return (elementi, maske)
+
+def izMaske (A, elementi):
+    """
+    Prevedi bitovnu masku A u objekt klase frozenset elemenata skupova iz liste
+    elementi.
+
+    Funkcija je inverz funkcije uMaske za pojedinu masku.
+
+    """
 
-        V = set()
-        for A in U:
-            if A.isdisjoint(S):
-                V |= {frozenset(A | S)}
-        U |= V
+    # Izdvoji jednoclane skupove postavljenih bitova (od najnizeg bita).
+    B = list()
+    while A:
+        b = A & -A
+        B.append(elementi[b.bit_length() - 1])
+        A ^= b
 
-    # Vrati familiju unija u parovima disjunktnih elemenata familije F.
-    return U
+    return frozenset().union(*B)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase Mijesalica za brzo generiranje promijesanih spilova i
+klase Spil za sekvencijalno dijeljenje karata iz promijesanog spila.
+
+"""
+
+import random
+import six
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from karta import Karta
+
+if six.PY3:
+    unicode = str
+
+class Mijesalica (object):
+    """
+    Klasa za generiranje promijesanih spilova od 52 valjane igrace karte.
+
+    Kanonski spil (svih 52 zamrznutih karata, v. funkciju Karta.zamrzni)
+    kreira se samo jednom, a svaki promijeseni spil je lista tih istih karata
+    u permutaciji koju odreduje generator pseudoslucajnih brojeva mijesalice.
+    Kanonski poredak karata jednak je poretku iteriranja po povratnoj
+    vrijednosti funkcije Karta.noviSpil, stoga je
+        >>> random.seed(sjeme)
+        >>> Mijesalica().promijesaj()
+    isti spil kao
+        >>> random.seed(sjeme)
+        >>> spil = list(Karta.noviSpil())
+        >>> random.shuffle(spil)
+
+    """
+
+    # Kanonski spil (racuna se pri prvom koristenju).
+    __kanonski = None
+
+    @classmethod
+    def kanonski (cls):
+        """
+        Dohvati kanonski spil (tuple od 52 zamrznute karte).
+
+        """
+
+        if Mijesalica.__kanonski is None:
+            Mijesalica.__kanonski = tuple(Karta.zamrzni(karta) for karta in Karta.noviSpil())
+
+        return Mijesalica.__kanonski
+
+    def __init__ (self, sjeme = None, generator = None):
+        """
+        Inicijaliziraj objekt klase Mijesalica.
+
+        Ako je zadan generator (objekt s metodama shuffle i randrange, na
+        primjer objekt klase random.Random), mijesa se njime.  Inace se, ako je
+        zadano sjeme, mijesa novim generatorom random.Random(sjeme), a ako nije,
+        globalnim generatorom modula random.
+
+        """
+
+        if generator is None:
+            generator = random if sjeme is None else random.Random(sjeme)
+
+        self.__generator = generator
+
+    def dohvatiGenerator (self):
+        """
+        Dohvati generator pseudoslucajnih brojeva mijesalice.
+
+        """
+
+        return self.__generator
+
+    def promijesaj (self):
+        """
+        Dohvati novi promijesani spil (listu od 52 karte).
+
+        """
+
+        spil = list(Mijesalica.kanonski())
+        self.__generator.shuffle(spil)
+
+        return spil
+
+    def serija (self, n):
+        """
+        Dohvati n promijesanih spilova odjednom (zahtijeva paket numpy).
+
+        Povratna vrijednost je objekt klase numpy.ndarray oblika (n, 52) tipa
+        numpy.uint8 ciji je svaki redak permutacija kodova karata (v. funkciju
+        Karta.kod) jednog spila.  Redak se u spil karata prevodi, na primjer,
+        funkcijom PoljeKarata.izKodova ili funkcijom Mijesalica.spilKodova.
+        Permutacije se racunaju generatorom numpy.random.RandomState ciji se
+        sjeme dohvaca iz generatora mijesalice (pa je serija ponovljiva ako je
+        mijesalica ponovljiva).
+
+        """
+
+        if np is None:
+            raise RuntimeError("Serija spilova zahtijeva paket `numpy'.")
+
+        generator = np.random.RandomState(self.__generator.randrange(2 ** 32))
+        kodovi = np.array([karta.kod for karta in Mijesalica.kanonski()], dtype = np.uint8)
+
+        return kodovi[np.argsort(generator.random_sample((n, len(kodovi))), axis = 1)]
+
+    @classmethod
+    def spilKodova (cls, kodovi):
+        """
+        Dohvati spil (listu karata) zadan nizom kodova karata kodovi.
+
+        """
+
+        return [Karta.zamrzni(Karta.izKoda(int(kod))) for kod in kodovi]
+
+class Spil (object):
+    """
+    Klasa za sekvencijalno dijeljenje karata iz (vec promijesanog) spila.
+
+    Karte spila cuvaju se u nepromjenjivom tuple-u, a dijeljenje samo pomice
+    pokazivac na sljedecu kartu (bez zakljucavanja kao u klasi queue.Queue i
+    bez kopiranja karata), pa je broj preostalih karata poznat u svakom
+    trenutku, a stanje spila (pozicija pokazivaca) moze se u konstantnom
+    vremenu spremiti i vratiti (v. funkcije Spil.snimka, Spil.vrati), na
+    primjer pri pretrazivanju ili ponavljanju partije.
+
+    """
+
+    __slots__ = ('__karte', '__i')
+
+    def __init__ (self, karte):
+        """
+        Inicijaliziraj objekt klase Spil.
+
+        Argument karte je iterabilni objekt karata u poretku kojim ce se
+        dijeliti (na primjer povratna vrijednost funkcije
+        Mijesalica.promijesaj).
+
+        """
+
+        self.__karte = tuple(karte)
+        self.__i = 0
+
+    def __copy__ (self):
+        """
+        Dohvati copy.copy(self).
+
+        """
+
+        spil = Spil(self.__karte)
+        spil.__i = self.__i
+
+        return spil
+
+    def __deepcopy__ (self, memo = dict()):
+        """
+        Dohvati copy.deepcopy(self, memo).
+
+        Karte spila su nepromjenjive (tuple) pa se ne kopiraju.
+
+        """
+
+        return self.__copy__()
+
+    def __len__ (self):
+        """
+        Dohvati broj preostalih karata u spilu.
+
+        """
+
+        return len(self.__karte) - self.__i
+
+    def __nonzero__ (self):
+        """
+        Provjeri ima li u spilu jos karata.
+
+        """
+
+        return self.__i < len(self.__karte)
+
+    __bool__ = __nonzero__
+
+    def __repr__ (self):
+        """
+        Dohvati repr(self).
+
+        """
+
+        return '<{0:s}: ({1:s}, {2:d})>'.format(self.__class__.__name__, repr(self.__karte), self.__i)
+
+    def __str__ (self):
+        """
+        Dohvati str(self).
+
+        """
+
+        return '{0:s}({1:d}/{2:d})'.format(self.__class__.__name__, len(self), len(self.__karte))
+
+    def __unicode__ (self):
+        """
+        Dohvati unicode(self).
+
+        """
+
+        return unicode(str(self))
+
+    def vuci (self):
+        """
+        Dohvati sljedecu kartu iz spila.
+
+        Ako je spil prazan, izbacuje se iznimka tipa RuntimeError.
+
+        """
+
+        if self.__i >= len(self.__karte):
+            raise RuntimeError('Spil je prazan.')
+
+        self.__i += 1
+
+        return self.__karte[self.__i - 1]
+
+    def podijeli (self, k):
+        """
+        Dohvati sljedecih k karata iz spila odjednom (tuple).
+
+        Ako u spilu nema k karata, izbacuje se iznimka tipa RuntimeError.
+
+        """
+
+        if k > len(self.__karte) - self.__i:
+            raise RuntimeError('U spilu nema {0:d} karata.'.format(k))
+
+        self.__i += k
+
+        return self.__karte[self.__i - k:self.__i]
+
+    def preostale (self):
+        """
+        Dohvati preostale karte u spilu (tuple) redom kojim ce se dijeliti.
+
+        """
+
+        return self.__karte[self.__i:]
+
+    def snimka (self):
+        """
+        Dohvati snimku stanja spila (za funkciju Spil.vrati).
+
+        """
+
+        return self.__i
+
+    def vrati (self, snimka):
+        """
+        Vrati spil u stanje spremljeno snimkom snimka (povratnom vrijednosti
+        funkcije Spil.snimka).
+
+        """
+
+        if not 0 <= snimka <= len(self.__karte):
+            raise ValueError('Snimka {0} nije valjana snimka spila.'.format(snimka))
+
+        self.__i = snimka
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase TablicaPoteza za unaprijed izracunate moguce poteze.
+
+"""
+
+import bisect
+import itertools
+import mmap
+import six
+import struct
+import sys
+
+from karta import Karta
+from skup_karata import SkupKarata
+
+if six.PY3:
+    unicode = str
+
+class TablicaPoteza (object):
+    """
+    Klasa za unaprijed izracunatu tablicu mogucih poteza spremljenu u datoteci.
+
+    Stolovi su reprezentirani vektorima brojeva karata po indeksima kao u
+    funkciji PohlepniLog.prevediKartu (v. funkciju PohlepniLog.prevediSkup).
+    Za svaki vektor v s najvise dohvatiMaxKarata() karata u datoteci je za
+    svaki znak zapisana familija vektora u <= v (po komponentama) takvih da se
+    svaki podskup karata s u[i] karata indeksa i za svaki i sumira (medu
+    ostalim) u taj znak (v. funkciju PohlepniIgrac.moguciPoteziKanonski).
+
+    Datoteka se ne ucitava u memoriju, nego se mapira u memoriju (mmap), pa
+    vise procesa koji koriste istu datoteku dijeli istu kopiju u
+    predmemoriji operacijskog sustava.  Format datoteke je (svi cijeli brojevi
+    zapisani su little-endian):
+        1.  zaglavlje   --  8 bajtova TablicaPoteza.zaglavlje(), a zatim
+                            cijeli brojevi (uint32) maxKarata, broj vektora N i
+                            ukupni broj zapisanih vektora poteza P,
+        2.  kljucevi    --  N uzlazno sortiranih kodova vektora (uint32, v.
+                            funkciju TablicaPoteza.kodVektora),
+        3.  pomaci      --  13 * N + 1 pomaka (uint32) u listi poteza, tako da
+                            su potezi j-tog znaka (redom Karta.Znak.A,
+                            Karta.Znak.BR2, ..., Karta.Znak.K) i-tog vektora
+                            zapisani od pomaka s indeksom 13 * i + j
+                            (ukljucivo) do pomaka s indeksom 13 * i + j + 1
+                            (iskljucivo),
+        4.  potezi      --  P kodova vektora poteza (uint16) relativnih
+                            vektoru stola (v. funkciju TablicaPoteza.kodPoteza).
+
+    """
+
+    # Najveci brojevi karata po indeksima za zapisnik.
+    __granice = (4, 3, 4, 4, 4, 4, 4, 4, 4, 3, 4, 4, 4, 1, 1)
+
+    # Znakovi karata redom kojim su zapisani u datoteci.
+    __znakovi = (Karta.Znak.A, Karta.Znak.BR2, Karta.Znak.BR3, Karta.Znak.BR4, Karta.Znak.BR5, Karta.Znak.BR6, Karta.Znak.BR7, Karta.Znak.BR8, Karta.Znak.BR9, Karta.Znak.BR10, Karta.Znak.J, Karta.Znak.Q, Karta.Znak.K)
+
+    @classmethod
+    def zaglavlje (cls):
+        """
+        Dohvati pocetne bajtove datoteke tablice poteza.
+
+        """
+
+        return b'TABLIC01'
+
+    @classmethod
+    def indeksKoda (cls, kod):
+        """
+        Dohvati indeks za zapisnik (v. funkciju PohlepniLog.prevediKartu)
+        karte s kodom kod (v. funkciju SkupKarata.kodKarte).
+
+        """
+
+        if kod == 7:
+            # Tref 2.
+            return 13
+        if kod == 38:
+            # Karo 10.
+            return 14
+
+        return kod >> 2
+
+    @classmethod
+    def kodVektora (cls, v):
+        """
+        Dohvati kod vektora v.
+
+        Kod vektora je broj zapisan u mjesovitoj bazi cije su znamenke
+        elementi vektora v (od najmanje znacajne), a baze za redom vrijednosti
+        granica (najvecih brojeva karata) po indeksima uvecanih za 1.
+
+        """
+
+        kod = 0
+        for i in reversed(range(len(v))):
+            kod = kod * (TablicaPoteza.__granice[i] + 1) + v[i]
+
+        return kod
+
+    @classmethod
+    def kodPoteza (cls, u, v):
+        """
+        Dohvati kod vektora poteza u relativnog vektoru stola v.
+
+        Kod je broj zapisan u mjesovitoj bazi cije su znamenke elementi vektora
+        u (od najmanje znacajne), a baze redom vrijednosti vektora v uvecane za
+        1.
+
+        """
+
+        kod = 0
+        for i in reversed(range(len(v))):
+            kod = kod * (v[i] + 1) + u[i]
+
+        return kod
+
+    @classmethod
+    def potezKoda (cls, kod, v):
+        """
+        Dohvati vektor poteza s kodom kod relativnog vektoru stola v.
+
+        Funkcija je inverz funkcije TablicaPoteza.kodPoteza.
+
+        """
+
+        u = list()
+        for x in v:
+            u.append(kod % (x + 1))
+            kod //= x + 1
+
+        return tuple(u)
+
+    @classmethod
+    def vektori (cls, maxKarata):
+        """
+        Iteriraj (uzlazno po kodovima) po svim vektorima stolova s najvise
+        maxKarata karata.
+
+        """
+
+        def __vektori (i, preostalo):
+            """
+            Iteriraj po vektorima od indeksa i nadalje s najvise preostalo
+            karata (uzlazno po kodovima).
+
+            """
+
+            if i < 0:
+                yield tuple()
+
+                return
+
+            for x in range(min(TablicaPoteza.__granice[i], preostalo) + 1):
+                for v in __vektori(i - 1, preostalo - x):
+                    yield v + (x,)
+
+        return __vektori(len(TablicaPoteza.__granice) - 1, maxKarata)
+
+    @classmethod
+    def izgradi (cls, datoteka, maxKarata = 6):
+        """
+        Izracunaj tablicu poteza za sve stolove s najvise maxKarata karata i
+        zapisi ju u datoteku datoteka (string imena datoteke).
+
+        Potezi se racunaju funkcijom PohlepniIgrac.moguciPoteziKanonski (s
+        iskljucenom tablicom poteza u klasi Tablic).  Kodovi vektora poteza
+        zapisuju se kao uint16 pa maxKarata mora biti najvise 16.
+
+        """
+
+        from engine import Tablic
+        from pohlepni_igrac import PohlepniIgrac
+
+        if maxKarata > 16:
+            raise ValueError('Tablica poteza moze sadrzavati samo stolove s najvise 16 karata.')
+
+        # Privremeno iskljuci tablicu poteza i predmemoriju kanonskih poteza.
+        tablica = Tablic.dohvatiTablicuPoteza()
+        Tablic.postaviTablicuPoteza(None)
+        velicina = PohlepniIgrac.predmemorijaKanonskihPoteza().dohvatiVelicinu()
+        PohlepniIgrac.predmemorijaKanonskihPoteza().postaviVelicinu(0)
+
+        try:
+            # Izracunaj kljuceve, pomake i poteze.
+            kljucevi = list()
+            pomaci = [0]
+            potezi = list()
+            for v in TablicaPoteza.vektori(maxKarata):
+                M = PohlepniIgrac.moguciPoteziKanonski(v)
+                kljucevi.append(TablicaPoteza.kodVektora(v))
+                for znak in TablicaPoteza.__znakovi:
+                    if znak in M:
+                        potezi += sorted(TablicaPoteza.kodPoteza(u, v) for u in M[znak])
+                    pomaci.append(len(potezi))
+        finally:
+            Tablic.postaviTablicuPoteza(tablica)
+            PohlepniIgrac.predmemorijaKanonskihPoteza().postaviVelicinu(velicina)
+
+        # Zapisi tablicu u datoteku.
+        with open(datoteka, 'wb') as izlaz:
+            izlaz.write(TablicaPoteza.zaglavlje())
+            izlaz.write(struct.pack('<3I', maxKarata, len(kljucevi), len(potezi)))
+            izlaz.write(struct.pack('<{0:d}I'.format(len(kljucevi)), *kljucevi))
+            izlaz.write(struct.pack('<{0:d}I'.format(len(pomaci)), *pomaci))
+            izlaz.write(struct.pack('<{0:d}H'.format(len(potezi)), *potezi))
+
+    def __init__ (self, datoteka):
+        """
+        Inicijaliziraj objekt klase TablicaPoteza mapiranjem datoteke datoteka
+        (string imena datoteke) u memoriju.
+
+        Ako datoteka nije datoteka tablice poteza, izbacuje se iznimka tipa
+        ValueError.
+
+        """
+
+        self.__datoteka = datoteka
+
+        with open(datoteka, 'rb') as ulaz:
+            self.__mm = mmap.mmap(ulaz.fileno(), 0, access = mmap.ACCESS_READ)
+
+        n = len(TablicaPoteza.zaglavlje())
+        if self.__mm.size() < n + 12 or self.__mm[:n] != TablicaPoteza.zaglavlje():
+            self.__mm.close()
+            raise ValueError("Datoteka `{0:s}' nije datoteka tablice poteza.".format(datoteka))
+
+        self.__maxKarata, self.__N, self.__P = struct.unpack_from('<3I', self.__mm, n)
+
+        self.__kljucevi = n + 12
+        self.__pomaci = self.__kljucevi + 4 * self.__N
+        self.__potezi = self.__pomaci + 4 * (13 * self.__N + 1)
+
+        if self.__mm.size() != self.__potezi + 2 * self.__P:
+            self.__mm.close()
+            raise ValueError("Datoteka `{0:s}' nije ispravna datoteka tablice poteza.".format(datoteka))
+
+        # Ako je moguce (Python 3 na little-endian racunalu), kljuceve gledaj
+        # kao niz cijelih brojeva bez kopiranja (za binarno pretrazivanje
+        # funkcijom bisect.bisect_left).
+        self.__pogledKljuceva = None
+        if six.PY3 and sys.byteorder == 'little' and struct.calcsize('I') == 4:
+            self.__pogledKljuceva = memoryview(self.__mm)[self.__kljucevi:self.__pomaci].cast('I')
+
+    def __copy__ (self):
+        """
+        Dohvati copy.copy(self).
+
+        Tablica poteza je nepromjenjiva, stoga se ne kopira.
+
+        """
+
+        return self
+
+    def __deepcopy__ (self, memo = dict()):
+        """
+        Dohvati copy.deepcopy(self, memo).
+
+        Tablica poteza je nepromjenjiva, stoga se ne kopira.
+
+        """
+
+        return self
+
+    def __len__ (self):
+        """
+        Dohvati broj stolova (vektora) u tablici.
+
+        """
+
+        return self.__N
+
+    def __repr__ (self):
+        """
+        Dohvati repr(self).
+
+        """
+
+        return '<{0:s}: ({1:s}, {2:d})>'.format(self.__class__.__name__, repr(self.__datoteka), self.__maxKarata)
+
+    def __str__ (self):
+        """
+        Dohvati str(self).
+
+        """
+
+        return '{0:s}({1:s})'.format(self.__class__.__name__, repr(self.__datoteka))
+
+    def __unicode__ (self):
+        """
+        Dohvati unicode(self).
+
+        """
+
+        return unicode(str(self))
+
+    def dohvatiMaxKarata (self):
+        """
+        Dohvati najveci broj karata na stolovima u tablici.
+
+        """
+
+        return self.__maxKarata
+
+    def zatvori (self):
+        """
+        Zatvori datoteku tablice (nakon poziva tablica se vise ne moze
+        koristiti).
+
+        """
+
+        if self.__pogledKljuceva is not None:
+            self.__pogledKljuceva.release()
+            self.__pogledKljuceva = None
+
+        self.__mm.close()
+
+    def potezi (self, v):
+        """
+        Dohvati moguce poteze na stolu zadanom vektorom v.
+
+        Povratna vrijednost je None ako stol nije u tablici, a inace dict
+        jednak povratnoj vrijednosti funkcije
+        PohlepniIgrac.moguciPoteziKanonski(v).
+
+        """
+
+        if sum(v) > self.__maxKarata:
+            return None
+
+        # Binarno pretrazi kljuceve.
+        kod = TablicaPoteza.kodVektora(v)
+        if self.__pogledKljuceva is not None:
+            lijevo = bisect.bisect_left(self.__pogledKljuceva, kod)
+        else:
+            lijevo = 0
+            desno = self.__N
+            while lijevo < desno:
+                sredina = (lijevo + desno) // 2
+                if struct.unpack_from('<I', self.__mm, self.__kljucevi + 4 * sredina)[0] < kod:
+                    lijevo = sredina + 1
+                else:
+                    desno = sredina
+        if lijevo == self.__N or struct.unpack_from('<I', self.__mm, self.__kljucevi + 4 * lijevo)[0] != kod:
+            return None
+
+        # Procitaj poteze.
+        pomaci = struct.unpack_from('<14I', self.__mm, self.__pomaci + 4 * 13 * lijevo)
+        M = dict()
+        for j in range(13):
+            if pomaci[j + 1] > pomaci[j]:
+                kodovi = struct.unpack_from('<{0:d}H'.format(pomaci[j + 1] - pomaci[j]), self.__mm, self.__potezi + 2 * pomaci[j])
+                M.update({TablicaPoteza.__znakovi[j] : {TablicaPoteza.potezKoda(x, v) for x in kodovi}})
+
+        return M
+
+    def moguciPotezi (self, S):
+        """
+        Dohvati moguce poteze na stolu S (kolekciji karata).
+
+        Povratna vrijednost je None ako S nije kolekcija valjanih karata ili
+        ako stol nije u tablici, a inace dict jednak povratnoj vrijednosti
+        funkcije Tablic.moguciPotezi(S).
+
+        """
+
+        # Grupiraj karte po indeksima.
+        grupe = [list() for x in TablicaPoteza.__granice]
+        for karta in S:
+            kod = SkupKarata.kodKarte(karta) if isinstance(karta, Karta) else None
+            if kod is None:
+                return None
+            grupe[TablicaPoteza.indeksKoda(kod)].append(karta)
+
+        # Dohvati poteze nad vektorom stola.
+        v = tuple(len(grupa) for grupa in grupe)
+        P = self.potezi(v)
+        if P is None:
+            return None
+
+        # "Napuhaj" vektore poteza u podskupove S.
+        M = dict()
+        for znak, U in six.iteritems(P):
+            M.update({znak : set()})
+            for u in U:
+                M[znak] |= {frozenset(itertools.chain(*A)) for A in itertools.product(*(itertools.combinations(grupe[i], u[i]) for i in range(len(u)) if u[i]))}
+
+        return M
@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+
+"""
+Implementacija klase Turnir za paralelno igranje serije partija igre tablic
+u vise procesa (uz funkcije za izrazavanje vremena i dedukciju pobjednika
+partije koje koristi skripta usporedba.py).
+
+"""
+
+import math
+import multiprocessing
+import random
+import time
+import traceback
+
+from six.moves import queue
+
+from engine import Tablic
+
+# Najdulje vrijeme (u sekundama) cekanja na rezultat partije u redu prije
+# provjere stanja radnih procesa.
+interval = 1.0
+
+def izraziVrijeme (t, preciznost = 2, predznak = False):
+    """
+    Dohvati string vremena t (u sekundama) izrazenog u potrebnim jedinicama.
+
+    Povratna vrijednost je string oblika "[predznak][[[Dd ]Hh ]Mm ]Ss", gdje
+    su:
+        --  D   --  broj dana (iz intervala [1, +beskonacno)),
+        --  H   --  broj sati (iz intervala [0, 24)),
+        --  M   --  broj minuta (iz intervala [0, 60)),
+        --  S   --  broj sekundi (iz intervala [0, 60)).
+    Vodece nule se ne ispisuju (ako je, na primjer, t = 65, preciznost = 2 i
+    predznak = False, povratni string je samo "1m 05.00s"), ali sekunde se
+    uvijek ispisuju (cak i ako je t = 0).  Ako je predznak = True, predznak se
+    nuzno ispisuje ispred vodece vrijednosti (ako je t < 0, predznak se ionako
+    ispisuje).  Vrijednost preciznost zadaje broj decimalnih mjesta za ispis
+    vrijednosti sekundi.
+
+    """
+
+    # Definiranje stringova za predznake.
+    minus = '-'
+    plus = '+'
+
+    # Definiranje stringova za oznake mjernih jedinica vremena.
+    dan = 'd'
+    sat = 'h'
+    minuta = 'm'
+    sekunda = 's'
+
+    # Izrazavanje negativnog vremena.
+    if t < 0.0:
+        return '{0:s}{1:s}'.format(minus, izraziVrijeme(-t, preciznost, False))
+
+    # Ako je veca mjerna jedinica vec ispisana (na primjer sat), manja se mora
+    # ispisati iako iznosi 0 (na primjer minuta ako je sat vec ispisan).
+    # Obavezno ispisivanje zadano je varijablom ispisuj.
+    ispisuj = False
+
+    # Inicijalizacija povratnog stringa.
+    t_str = plus if predznak and t else ''
+
+    # Ispis dana.
+    if t >= 86400.0:
+        t_str += '{0:d}{1:s} '.format(int(math.floor(t / 86400.0)), dan)
+        t -= 86400.0 * math.floor(t / 86400.0)
+
+    # Ispis sati.
+    if ispisuj or t >= 3600.0:
+        t_str += '{1:{0:s}d}{2:s} '.format('02' if ispisuj else '', int(math.floor(t / 3600.0)), sat)
+        t -= 3600.0 * math.floor(t / 3600.0)
+
+        ispisuj = True
+
+    # Ispis minuta.
+    if ispisuj or t >= 60.0:
+        t_str += '{1:{0:s}d}{2:s} '.format('02' if ispisuj else '', int(math.floor(t / 60.0)), minuta)
+        t -= 60.0 * math.floor(t / 60.0)
+
+        ispisuj = True
+
+    # Ispis sekundi.
+    t_str += '{2:{1:s}.{0:d}f}{3:s}'.format(preciznost, ('0{0:d}'.format(preciznost + 3) if preciznost else '02') if ispisuj else '', t, sekunda)
+
+    # Povrat izrazenog vremena.
+    return t_str
+
+def deducirajPobjednika (konacni_rezultat):
+    """
+    Otkrij tko je skupio strogo najvise bodova.
+
+    Argument funkcije mora biti povratna vrijednost funkcije
+    Tablic.Log.konacniRezultat iz koje se trazi indeks igraca sa strogo
+    najvecim brojem skupljenih bodova.  Ako vise igraca dijeli prvo mjesto,
+    povratna vrijednost je uzlazno sortirani tuple njihovih indeksa.
+
+    """
+
+    # Dedukcija igraca s najvise bodova.
+    pobjednik = [0]
+    for i in range(1, len(konacni_rezultat)):
+        if konacni_rezultat[i] > konacni_rezultat[pobjednik[0]]:
+            pobjednik = [i]
+        elif konacni_rezultat[i] == konacni_rezultat[pobjednik[0]]:
+            pobjednik.append(i)
+
+    # Obradivanje slucaja da vise igraca ima najvise bodova.
+    if len(pobjednik) > 1:
+        return tuple(pobjednik)
+
+    # Povrat indeksa igraca sa strogo najvecim brojem bodova.
+    return pobjednik[0]
+
+def sjemenaPartije (sjeme, r, m):
+    """
+    Dohvati sjemena neovisnih tokova pseudoslucajnih brojeva partije s rednim
+    brojem r (pocevsi od 0) turnira s glavnim sjemenom sjeme i m igraca.
+
+    Povratna vrijednost je tuple (spil, igraci, globalno), gdje je spil sjeme
+    za mijesanje spila, igraci tuple sjemena generatora igraca (v. funkciju
+    Tablic.Igrac.postaviGenerator), a globalno sjeme kojim se prije partije
+    inicijalizira globalni generator modula random (za igrace koji ne koriste
+    vlastiti generator).  Sjemena se izvode funkcijom Tablic.izvediSjeme pa
+    ovise samo o glavnom sjemenu, rednom broju partije i indeksima igraca.
+
+    """
+
+    return (Tablic.izvediSjeme(sjeme, r, 'spil'),
+            tuple(Tablic.izvediSjeme(sjeme, r, 'igrac', j) for j in range(m)),
+            Tablic.izvediSjeme(sjeme, r, 'random'))
+
+def ponoviPartiju (igraci, sjeme, r):
+    """
+    Pripremi partiju s rednim brojem r (pocevsi od 0) turnira s glavnim
+    sjemenom sjeme za ponovno igranje u izolaciji.
+
+    Argument igraci je niz rjecnika s kljucevima 'klasa', 'args', 'kwargs'
+    (kao u skripti usporedba.py).  Povratna vrijednost je objekt klase Tablic
+    s dodanim igracima i generatorima zadanim funkcijom sjemenaPartije, a
+    nakon poziva funkcije igraj (na primjer sa zapisnicima) rezultat partije
+    jednak je rezultatu te partije u turniru (osim ako igraci ne ogranicavaju
+    vrijeme razmisljanja).
+
+    """
+
+    spil, sjemena, globalno = sjemenaPartije(sjeme, r, len(igraci))
+
+    random.seed(globalno)
+
+    igra = Tablic(sjeme = spil)
+    for j in range(len(igraci)):
+        kwargs = dict(igraci[j]['kwargs'])
+        kwargs.pop('generator', None)
+        kwargs['sjeme'] = sjemena[j]
+        igra.dodajIgraca(igraci[j]['klasa'], *igraci[j]['args'], **kwargs)
+
+    return igra
+
+def partijeRaspona (igraci, pocetak, kraj, sjeme):
+    """
+    Odigraj partije s rednim brojevima iz intervala [pocetak, kraj).
+
+    Argument igraci je niz rjecnika s kljucevima 'klasa', 'args', 'kwargs'
+    (kao u skripti usporedba.py).  Igraci se instanciraju samo jednom i igraju
+    sve partije raspona (v. funkciju Tablic.simuliraj), a partija s rednim
+    brojem r igra se sa sjemenima sjemenaPartije(sjeme, r, len(igraci)), pa
+    njezin rezultat ne ovisi o rasponu u kojem je odigrana i moze se ponoviti
+    u izolaciji (v. funkciju ponoviPartiju).
+
+    Povratna vrijednost je generator tuple-ova (r, t, imena, konacni_rezultat)
+    koji se generiraju redom po zavrsetku partija, gdje je r redni broj
+    partije (pocevsi od 0), t trajanje partije u sekundama, imena tuple imena
+    igraca, a konacni_rezultat tuple bodova igraca (v. funkciju
+    Tablic.Log.konacniRezultat).
+
+    """
+
+    # Instanciraj igrace.
+    instance = list()
+    for igrac in igraci:
+        kwargs = dict(igrac['kwargs'])
+        kwargs.pop('i', None)
+        instance.append(igrac['klasa'](len(instance), *igrac['args'], **kwargs))
+    imena = tuple(igrac.dohvatiIme() for igrac in instance)
+
+    # Odigraj partije.
+    for r in range(pocetak, kraj):
+        spil, sjemena, globalno = sjemenaPartije(sjeme, r, len(instance))
+
+        random.seed(globalno)
+        for j in range(len(instance)):
+            instance[j].postaviGenerator(sjemena[j])
+
+        t0 = time.time()
+        konacni_rezultat = Tablic.simuliraj(instance, 1, generator = random.Random(spil))[0]
+        t1 = time.time()
+
+        yield (r, float(t1 - t0), imena, tuple(int(bodovi) for bodovi in konacni_rezultat))
+
+def igrajRaspon (igraci, pocetak, kraj, sjeme, red):
+    """
+    Odigraj partije raspona u radnom procesu i salji rezultate u red red.
+
+    Rezultati partija (v. funkciju partijeRaspona) stavljaju se u red red cim
+    su partije zavrsene.  Ako se pri igranju dogodi iznimka, u red se umjesto
+    rezultata stavlja tuple (None, string traga iznimke) i igranje raspona se
+    prekida.
+
+    """
+
+    try:
+        for rezultat in partijeRaspona(igraci, pocetak, kraj, sjeme):
+            red.put(rezultat)
+    except Exception:
+        red.put((None, traceback.format_exc()))
+
+class Turnir (object):
+    """
+    Klasa za paralelno igranje serije partija igre tablic.
+
+    Partije se, podijeljene u raspone uzastopnih rednih brojeva, igraju u
+    bazenu procesa (v. klasu multiprocessing.Pool), a rezultati se vracaju
+    roditeljskom procesu (kroz red) cim je pojedina partija zavrsena.  Uz
+    rezultate se akumuliraju ukupni bodovi, broj pobjeda i nerjesene partije
+    igraca te ukupno trajanje partija.
+
+    """
+
+    def __init__ (self, igraci, N, sjeme = None, procesi = None, raspon = None):
+        """
+        Inicijaliziraj objekt klase Turnir.
+
+        Argument igraci je niz rjecnika s kljucevima 'klasa', 'args', 'kwargs'
+        (kao u skripti usporedba.py), a N je broj partija.  Partija s rednim
+        brojem r (pocevsi od 0) igra se s neovisnim tokovima pseudoslucajnih
+        brojeva izvedenima iz glavnog sjemena sjeme (v. funkciju
+        sjemenaPartije); ako sjeme nije zadano, bira se globalnim generatorom
+        modula random.  Argument procesi
+        zadaje broj radnih procesa (zadano je broj procesora; ako je 1,
+        partije se igraju u trenutnom procesu), a raspon broj partija koje
+        jedan radni proces igra s istim objektima igraca (zadano je tako da
+        svaki proces dobije priblizno 4 raspona).
+
+        """
+
+        if N < 0:
+            raise ValueError('Broj partija mora biti nenegativan.')
+
+        if procesi is None:
+            procesi = multiprocessing.cpu_count()
+        if procesi < 1:
+            raise ValueError('Broj procesa mora biti pozitivan.')
+
+        if raspon is None:
+            raspon = max(1, int(math.ceil(float(N) / (4 * procesi))))
+        if raspon < 1:
+            raise ValueError('Raspon mora biti pozitivan.')
+
+        if sjeme is None:
+            sjeme = random.randrange(2 ** 31)
+
+        self.__igraci = tuple(igraci)
+        self.__N = N
+        self.__sjeme = sjeme
+        self.__procesi = procesi
+        self.__raspon = raspon
+
+        self.__T = 0.0
+        self.__akumulirano = [0 for i in range(len(self.__igraci))]
+        self.__pobjede = [0 for i in range(len(self.__igraci))]
+        self.__nerjeseno = list()
+
+    def __partije (self):
+        """
+        Dohvati generator rezultata partija (v. funkciju partijeRaspona)
+        redom kojim su partije zavrsene.
+
+        """
+
+        # Odigraj partije u trenutnom procesu.
+        if self.__procesi == 1:
+            for rezultat in partijeRaspona(self.__igraci, 0, self.__N, self.__sjeme):
+                yield rezultat
+
+            return
+
+        # Podijeli partije radnim procesima i primaj rezultate iz reda.  Ako
+        # u redu nema rezultata, provjerava se je li neki zadatak zavrsio
+        # greskom (na primjer, ako se argumenti ne mogu serijalizirati) ili je
+        # neki radni proces prekinut (bazen ga tada zamjenjuje novim, a
+        # njegov zadatak nikad ne zavrsava), da se ne bi beskonacno cekalo.
+        upravitelj = multiprocessing.Manager()
+        bazen = None
+        try:
+            red = upravitelj.Queue()
+            postojeci = set(p.pid for p in multiprocessing.active_children())
+            bazen = multiprocessing.Pool(self.__procesi)
+            radnici = set(p.pid for p in multiprocessing.active_children()) - postojeci
+            zadaci = list()
+            for pocetak in range(0, self.__N, self.__raspon):
+                zadaci.append(bazen.apply_async(igrajRaspon, (self.__igraci, pocetak, min(pocetak + self.__raspon, self.__N), self.__sjeme, red)))
+            bazen.close()
+
+            for i in range(self.__N):
+                while True:
+                    try:
+                        rezultat = red.get(timeout = interval)
+                        break
+                    except queue.Empty:
+                        pass
+
+                    for zadatak in zadaci:
+                        if zadatak.ready() and not zadatak.successful():
+                            try:
+                                zadatak.get()
+                            except Exception:
+                                raise RuntimeError('Greska u radnom procesu:\n{0:s}'.format(traceback.format_exc()))
+                    if not radnici <= set(p.pid for p in multiprocessing.active_children()):
+                        raise RuntimeError('Radni proces je neocekivano prekinut.')
+                    if all(zadatak.ready() for zadatak in zadaci) and red.empty():
+                        raise RuntimeError('Radni procesi su zavrsili bez svih rezultata.')
+
+                if rezultat[0] is None:
+                    raise RuntimeError('Greska u radnom procesu:\n{0:s}'.format(rezultat[1]))
+
+                yield rezultat
+        finally:
+            if bazen is not None:
+                bazen.terminate()
+                bazen.join()
+            upravitelj.shutdown()
+
+    def igraj (self):
+        """
+        Odigraj partije turnira.
+
+        Povratna vrijednost je generator tuple-ova (r, t, imena,
+        konacni_rezultat) kao kod funkcije partijeRaspona, koji se generiraju
+        redom kojim su partije zavrsene, a nakon sto su rezultati partije vec
+        pribrojeni akumuliranim vrijednostima turnira (v. funkcije
+        Turnir.dohvatiAkumulirano, Turnir.dohvatiPobjede,
+        Turnir.dohvatiNerjeseno, Turnir.dohvatiTrajanje).
+
+        Ako se u radnom procesu dogodi greska (iznimka pri igranju, neuspjela
+        serijalizacija argumenata ili prekid radnog procesa), izbacuje se
+        iznimka RuntimeError.
+
+        """
+
+        for r, t, imena, konacni_rezultat in self.__partije():
+            self.__T += t
+
+            for j in range(len(self.__igraci)):
+                self.__akumulirano[j] += konacni_rezultat[j]
+            pobjednik = deducirajPobjednika(konacni_rezultat)
+            if isinstance(pobjednik, tuple):
+                self.__nerjeseno.append((r + 1, tuple(p + 1 for p in pobjednik)))
+            else:
+                self.__pobjede[pobjednik] += 1
+
+            yield (r, t, imena, konacni_rezultat)
+
+    def dohvatiBrojPartija (self):
+        """
+        Dohvati broj partija turnira.
+
+        """
+
+        return self.__N
+
+    def dohvatiSjeme (self):
+        """
+        Dohvati glavno sjeme turnira.
+
+        """
+
+        return self.__sjeme
+
+    def ponovi (self, r):
+        """
+        Pripremi partiju turnira s rednim brojem r (pocevsi od 0) za ponovno
+        igranje u izolaciji (v. funkciju ponoviPartiju).
+
+        """
+
+        if not 0 <= r < self.__N:
+            raise ValueError('Partija {0} ne postoji u turniru.'.format(r))
+
+        return ponoviPartiju(self.__igraci, self.__sjeme, r)
+
+    def dohvatiTrajanje (self):
+        """
+        Dohvati akumulirano trajanje dosad zavrsenih partija (u sekundama).
+
+        """
+
+        return self.__T
+
+    def dohvatiAkumulirano (self):
+        """
+        Dohvati listu akumuliranih bodova igraca u dosad zavrsenim partijama.
+
+        """
+
+        return list(self.__akumulirano)
+
+    def dohvatiPobjede (self):
+        """
+        Dohvati listu brojeva pobjeda igraca u dosad zavrsenim partijama.
+
+        """
+
+        return list(self.__pobjede)
+
+    def dohvatiNerjeseno (self):
+        """
+        Dohvati listu nerjesenih partija od dosad zavrsenih partija.
+
+        Elementi liste su parovi rednog broja partije (pocevsi od 1) i tuple-a
+        rednih brojeva igraca (pocevsi od 1) koji su u toj partiji dijelili
+        prvo mjesto, redom kojim su partije zavrsene.
+
+        """
+
+        return list(self.__nerjeseno)
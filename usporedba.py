@@ -7,7 +7,6 @@ Skripta za testiranje igraca igre tablic.
 
 """
 
-import math
 import random
 import six
 import sys
@@ -20,6 +19,7 @@ from pohlepni_igrac import PohlepniIgrac
 from minimax_igrac import MinimaxIgrac
 from io_igrac import IOIgrac
 from promatrac_log import PromatracLog
+from turnir import Turnir, izraziVrijeme
 
 # Broj partija za testiranje.
 N = 50
@@ -30,6 +30,16 @@ N = 50
 # ispisuje.
 k = 5
 
+# Broj procesa u kojima se partije igraju paralelno (ako je None, uzima se broj
+# procesora; ako je 1, partije se igraju u procesu skripte).
+P = None
+
+# Glavno sjeme iz kojeg se izvode neovisni tokovi pseudoslucajnih brojeva
+# partija i igraca (v. funkciju turnir.sjemenaPartije) te slucajnog redoslijeda
+# igraca.  Ako je None, bira se slucajno (i ispisuje se, pa se svaka partija
+# moze ponoviti u izolaciji funkcijom turnir.ponoviPartiju).
+sjeme = None
+
 # Detalji o nerjesenim partijama ispisuju se ako je ispisNerjesenih True.
 ispisNerjesenih = False
 
@@ -42,97 +52,9 @@ ispisNerjesenih = False
 igraci = ({'klasa' : MinimaxIgrac, 'args' : tuple(), 'kwargs' : {'ime' : 'Marconi', 'maxDubina' : 3, 'maxT' : 15.0}},
           {'klasa' : PohlepniIgrac, 'args' : tuple(), 'kwargs' : {'ime' : 'Popeye'}})
 
-def izraziVrijeme (t, preciznost = 2, predznak = False):
-    """
-    Dohvati string vremena t (u sekundama) izrazenog u potrebnim jedinicama.
-
-    Povratna vrijednost je string oblika "[predznak][[[Dd ]Hh ]Mm ]Ss", gdje
-    su:
-        --  D   --  broj dana (iz intervala [1, +beskonacno)),
-        --  H   --  broj sati (iz intervala [0, 24)),
-        --  M   --  broj minuta (iz intervala [0, 60)),
-        --  S   --  broj sekundi (iz intervala [0, 60)).
-    Vodece nule se ne ispisuju (ako je, na primjer, t = 65, preciznost = 2 i
-    predznak = False, povratni string je samo "1m 05.00s"), ali sekunde se
-    uvijek ispisuju (cak i ako je t = 0).  Ako je predznak = True, predznak se
-    nuzno ispisuje ispred vodece vrijednosti (ako je t < 0, predznak se ionako
-    ispisuje).  Vrijednost preciznost zadaje broj decimalnih mjesta za ispis
-    vrijednosti sekundi.
-
-    """
-
-    # Definiranje stringova za predznake.
-    minus = '-'
-    plus = '+'
-
-    # Definiranje stringova za oznake mjernih jedinica vremena.
-    dan = 'd'
-    sat = 'h'
-    minuta = 'm'
-    sekunda = 's'
-
-    # Izrazavanje negativnog vremena.
-    if t < 0.0:
-        return '{0:s}{1:s}'.format(minus, izraziVrijeme(-t, preciznost, False))
-
-    # Ako je veca mjerna jedinica vec ispisana (na primjer sat), manja se mora
-    # ispisati iako iznosi 0 (na primjer minuta ako je sat vec ispisan).
-    # Obavezno ispisivanje zadano je varijablom ispisuj.
-    ispisuj = False
-
-    # Inicijalizacija povratnog stringa.
-    t_str = plus if predznak and t else ''
-
-    # Ispis dana.
-    if t >= 86400.0:
-        t_str += '{0:d}{1:s} '.format(int(math.floor(t / 86400.0)), dan)
-        t -= 86400.0 * math.floor(t / 86400.0)
-
-    # Ispis sati.
-    if ispisuj or t >= 3600.0:
-        t_str += '{1:{0:s}d}{2:s} '.format('02' if ispisuj else '', int(math.floor(t / 3600.0)), sat)
-        t -= 3600.0 * math.floor(t / 3600.0)
-
-        ispisuj = True
-
-    # Ispis minuta.
-    if ispisuj or t >= 60.0:
-        t_str += '{1:{0:s}d}{2:s} '.format('02' if ispisuj else '', int(math.floor(t / 60.0)), minuta)
-        t -= 60.0 * math.floor(t / 60.0)
-
-        ispisuj = True
-
-    # Ispis sekundi.
-    t_str += '{2:{1:s}.{0:d}f}{3:s}'.format(preciznost, ('0{0:d}'.format(preciznost + 3) if preciznost else '02') if ispisuj else '', t, sekunda)
-
-    # Povrat izrazenog vremena.
-    return t_str
-
-def deducirajPobjednika (konacni_rezultat):
-    """
-    Otkrij tko je skupio strogo najvise bodova.
-
-    Argument funkcije mora biti povratna vrijednost funkcije
-    Tablic.Log.konacniRezultat iz koje se trazi indeks igraca sa strogo
-    najvecim brojem skupljenih bodova.  Ako vise igraca dijeli prvo mjesto,
-    povratna vrijednost je uzlazno sortirani tuple njihovih indeksa.
-
-    """
-
-    # Dedukcija igraca s najvise bodova.
-    pobjednik = [0]
-    for i in range(1, len(konacni_rezultat)):
-        if konacni_rezultat[i] > konacni_rezultat[pobjednik[0]]:
-            pobjednik = [i]
-        elif konacni_rezultat[i] == konacni_rezultat[pobjednik[0]]:
-            pobjednik.append(i)
-
-    # Obradivanje slucaja da vise igraca ima najvise bodova.
-    if len(pobjednik) > 1:
-        return tuple(pobjednik)
-
-    # Povrat indeksa igraca sa strogo najvecim brojem bodova.
-    return pobjednik[0]
+# Odabir glavnog sjemena.
+if sjeme is None:
+    sjeme = random.randrange(2 ** 31)
 
 # Ako je pri pokretanju skripte zadan argument "-r", redoslijed igraca u tuple-u igraci se obrce.  Ako je zadan argument "-p", redoslijed igraca permutira
 # se slucajnim izborom.  Ostali dodatni argumenti se ne prepoznaju.
@@ -141,13 +63,16 @@ if len(sys.argv) == 2:
         igraci = tuple(reversed(igraci))
     elif sys.argv[1] == '-p':
         igraci = list(igraci)
-        random.shuffle(igraci)
+        random.Random(Tablic.izvediSjeme(sjeme, 'redoslijed')).shuffle(igraci)
         igraci = tuple(igraci)
     else:
         raise RuntimeError("Dodatni argument `{0:s}' nije prepoznat.".format(sys.argv[1]))
 elif len(sys.argv) != 1:
     raise RuntimeError("Skripta se pokrece s jednim argumentom `-r' (obrnuti redoslijed igraca) ili `-p' (slucajni redoslijed igraca), ili bez argumenata.")
 
+# Ispis glavnog sjemena.
+print('Sjeme: {0:d}'.format(sjeme))
+
 # Ispis igraca redom kojim su na potezu.
 print('Igraci redom po potezima:')
 for i in range(len(igraci)):
@@ -157,16 +82,9 @@ for i in range(len(igraci)):
                                                                    ', '.join('{0:s} = {1:s}'.format(x, repr(y)) for x, y in six.iteritems(igraci[i]['kwargs'])),
                                                                    ', ' if igraci[i]['kwargs'] else '')))
 
-# Varijabla T "pamti" akumulirani broj sekundi trajanja partija.
-T = 0.0
-
-# U listi akumulirano spremljeni su akumulirani brojevi bodova igraca kroz
-# partije, a u listi pobjede brojevi partija u kojima su pobjedili.  U listi
-# nerjeseno spremljeni su parovi indeksa partije i tuple-a igraca koji su u tim
-# partijama dijelili prvo mjesto.
-akumulirano = [0 for i in range(len(igraci))]
-pobjede = [0 for i in range(len(igraci))]
-nerjeseno = list()
+# Objekt turnir igra partije (paralelno) i akumulira ukupno trajanje partija,
+# bodove i pobjede igraca te nerjesene partije (v. klasu Turnir).
+turnir = Turnir(igraci, N, sjeme, P)
 
 ##  * * *  FORMAT ISPISA  * * *
 ##
@@ -185,7 +103,8 @@ nerjeseno = list()
 ##  	...
 ##
 ##  Legenda:
-##      r   --  redni broj partije,
+##      r   --  broj dosad zavrsenih partija (partije se igraju paralelno pa
+##              zavrsavaju proizvoljnim redom),
 ##      N   --  ukupni broj partija,
 ##      t   --  broj sekundi trajanja r-te partije,
 ##      mt  --  prosjecno vrijeme trajanja prvih r partija,
@@ -202,7 +121,9 @@ nerjeseno = list()
 ##      p1, p2  --  broj pobjedenih partija igraca igrac1, igrac2 u prvih r
 ##                  partija,
 ##      n   --  broj nerjesenih partija od prvih r partija,
-##      r1, r2  --  redom redni brojevi nerjesenih partija od prvih r partija,
+##      r1, r2  --  redni brojevi (pocevsi s brojem 1)
+##                  nerjesenih partija od prvih r partija redom kojim su
+##                  zavrsile,
 ##      i11, i12    --  redni brojevi igraca koji su u r1-toj partiji imali
 ##                      najvise bodova (redni brojevi u smislu reda poteza,
 ##                      pocevsi s brojem 1),
@@ -216,53 +137,32 @@ nerjeseno = list()
 ##  n nerjesenih partija.
 ##
 ##  Na samom kraju ispis je slican, ali bez informacija o konkretnoj partiji
-##  (ispis vremena je u obliku "mt; T" gdje je T akumulirano vrijeme trajanja
-##  svih partija, a od bodova su ispisani samo akumulirani bodovi).  Rezultat
-##  zadnje partije se ne ispisuje, nego se samo ispisuje konacno stanje.
+##  (ispis vremena je u obliku "mt; T (W)" gdje je T akumulirano vrijeme
+##  trajanja svih partija, a W stvarno proteklo vrijeme igranja turnira, a od
+##  bodova su ispisani samo akumulirani bodovi).  Rezultat zadnje partije se ne
+##  ispisuje, nego se samo ispisuje konacno stanje.
 ##
 ##  Moguce je da se linije nakon linije "n" ne ce ispisivati cak i ako je n > 0
 ##  (ako su od interesa, varijabla ispisNerjesenih mora biti postavljena na
 ##  True).
 ##
 
-# Igranje N partija.
-for i in range(N):
-    # Inicijalizacija igre.
-    igra = Tablic()
-
-    # Dodabvanje igraca u igru.
-    for igrac in igraci:
-        igra.dodajIgraca(igrac['klasa'], *igrac['args'], **igrac['kwargs'])
-
-    # Pocetak mjerenja vremena partije.
-    t0 = time.time()
-
-    # Igranje partije.
-    igra.igraj()
-
-    # Kraj mjerenja vremena partije.
-    t1 = time.time()
-
-    # Dodavanje trajanja partije varijabli T.
-    T += float(t1 - t0)
-
-    # Racunanje konacnog rezultata i pribrajanje listama akumulirano, pobjede.
-    rezultat = igra.dohvatiRezultat()
-    konacni_rezultat = Tablic.Log.konacniRezultat(rezultat)
-    for j in range(len(igraci)):
-        akumulirano[j] += konacni_rezultat[j]
-    pobjednik = deducirajPobjednika(konacni_rezultat)
-    if isinstance(pobjednik, tuple):
-        nerjeseno.append((i + 1, tuple(p + 1 for p in pobjednik)))
-    else:
-        pobjede[pobjednik] += 1
+# Igranje N partija (rezultati se ispisuju redom kojim partije zavrsavaju).
+t_pocetak = time.time()
+i = 0
+for r, t, imena, konacni_rezultat in turnir.igraj():
+    # Dohvacanje akumuliranih vrijednosti.
+    T = turnir.dohvatiTrajanje()
+    akumulirano = turnir.dohvatiAkumulirano()
+    pobjede = turnir.dohvatiPobjede()
+    nerjeseno = turnir.dohvatiNerjeseno()
 
     # Eventualni ispis rezultata.
     if not (i and (i + 1) % k or i + 1 == N):
         print("\nPartija {0:d}/{1:d}:".format(i + 1, N))
-        print("\t{0:s} ({1:s}; {2:s} + {3:s} = {4:s})".format(izraziVrijeme(float(t1 - t0)), izraziVrijeme(T / (i + 1)), izraziVrijeme(T), izraziVrijeme((N - i - 1) * T / (i + 1)), izraziVrijeme(N * T / (i + 1))))
-        print("\t{0:s}".format(' vs. '.join(igra.dohvatiIme(j) for j in range(igra.dohvatiBrojIgraca()))))
-        print("\t{0:s}".format(repr(konacni_rezultat)))
+        print("\t{0:s} ({1:s}; {2:s} + {3:s} = {4:s})".format(izraziVrijeme(t), izraziVrijeme(T / (i + 1)), izraziVrijeme(T), izraziVrijeme((N - i - 1) * T / (i + 1)), izraziVrijeme(N * T / (i + 1))))
+        print("\t{0:s}".format(' vs. '.join(imena)))
+        print("\t{0:s}".format(repr(list(konacni_rezultat))))
         print("\t{0:s}".format(repr(akumulirano)))
         print("\t{0:s}".format(repr(pobjede)))
         print("\t{0:d}".format(len(nerjeseno)))
@@ -270,10 +170,20 @@ for i in range(N):
             print("\tNerjesene:")
             for r in nerjeseno:
                 print("\t\t{0:s}".format(repr(r)))
+        sys.stdout.flush()
+
+    i += 1
+t_kraj = time.time()
+
+# Dohvacanje konacnih akumuliranih vrijednosti.
+T = turnir.dohvatiTrajanje()
+akumulirano = turnir.dohvatiAkumulirano()
+pobjede = turnir.dohvatiPobjede()
+nerjeseno = turnir.dohvatiNerjeseno()
 
 # Konacni ispis rezultata.
 print("\nKonacno ({0:d} partija):".format(N))
-print("\t{0:s}; {1:s}".format(izraziVrijeme(T / N), izraziVrijeme(T)))
+print("\t{0:s}; {1:s} ({2:s})".format(izraziVrijeme(T / N), izraziVrijeme(T), izraziVrijeme(float(t_kraj - t_pocetak))))
 print("\t{0:s}".format(repr(akumulirano)))
 print("\t{0:s}".format(repr(pobjede)))
 print("\t{0:d}".format(len(nerjeseno)))